@@ -1,3 +1,4 @@
+import atexit
 import pygame
 import sys
 from src.config.settings import *
@@ -7,6 +8,7 @@ from src.view.pauseMenu import PauseMenu
 from src.view.tutorialManager import TutorialManager
 from src.view.dayNightCycle import DayNightCycle
 from src.model.jeep import Jeep
+from src.controller.replay import ReplayRecorder
 
 class Game:
     def __init__(self):
@@ -19,6 +21,14 @@ class Game:
         self.selected_difficulty = None
         self.tutorial_manager = TutorialManager(self)
         self.map = None
+        self.recorder = None
+        atexit.register(self.save_replay)
+
+    def save_replay(self):
+        if self.recorder:
+            self.recorder.save()
+            self.recorder = None
+
     def run(self):
         while self.running:
             self.current_screen()
@@ -30,7 +40,9 @@ class Game:
             pygame.quit()
             sys.exit()
             
+        self.save_replay()
         self.map = Map(difficulty=self.selected_difficulty, game_reference=self)
+        self.recorder = ReplayRecorder(self.map)
         jeep_start = self.map.jeep_start
         if jeep_start:
             self.current_screen = self.game_screen  # <-- ✅ THIS IS MANDATORY!
@@ -43,6 +55,8 @@ class Game:
         while game_running:
             events = pygame.event.get()
             dt = self.clock.tick(60) / 1000.0
+            self.map.input.begin_frame(dt)
+            self.recorder.begin_frame(dt)
             for event in events:
                 if event.type == pygame.QUIT:
                     pygame.quit()
@@ -53,15 +67,17 @@ class Game:
                     continue
                     
                 if self.map.time_indicator.handle_event(event):
+                    self.map.set_time_mode(self.map.time_indicator.time_mode)
+                    continue
+
+                if self.map.stats_chart.handle_event(event):
                     continue
                 
                 if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
                     if self.map.day_night_rect.collidepoint(event.pos):
                         self.map.toggle_day_night()
 
-                if event.type == pygame.KEYDOWN:
-                    if event.key == pygame.K_n:
-                        self.map.toggle_day_night()
+                self.map.input.handle_event(event)
 
                 if self.map.pause_menu.handle_event(event):
                     self.map.paused = self.map.pause_menu.menu_open
@@ -73,6 +89,13 @@ class Game:
                 if not self.map.paused:
                     self.map.store_ui.handle_event(event)
                     
+            if self.map.input.pressed('toggle_day_night'):
+                self.map.toggle_day_night()
+            if self.map.input.pressed('toggle_stats'):
+                self.map.stats_chart.toggle()
+            if self.map.input.pressed('toggle_density'):
+                self.map.density_overlay.toggle()
+
             self.map.run(dt, events)
             if self.map.new_game_requested:
                 self.map.new_game_requested = False
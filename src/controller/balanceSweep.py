@@ -0,0 +1,236 @@
+# ──────────────────────────────────────────────────────────────────────────────
+# balanceSweep.py – runs many headless parks over a parameter grid in parallel
+# ──────────────────────────────────────────────────────────────────────────────
+#  Every (difficulty, parameter combination, seed) is one job. Jobs run in a
+#  process pool (one process per core by default), each building its own
+#  headless Map and stepping it until the game ends or the time limit is hit.
+#
+#  Output:
+#      <out>_summary.csv   one row per parameter combination (win rate,
+#                          bankruptcy / extinction rates, time to bankruptcy…)
+#      <out>_runs.csv      one row per simulated park
+#      <out>_curves.csv    population samples (long format) for plotting
+#
+#  Example:
+#      python -m src.controller.balanceSweep --difficulty easy medium --seeds 8 \
+#          --param safari_pass=30,50,80 --param poacher_add_time=30,60
+# ──────────────────────────────────────────────────────────────────────────────
+
+import argparse
+import csv
+import itertools
+import multiprocessing
+import os
+import sys
+import time
+
+SWEEP_DT = 1 / 20                 # fixed simulation step (seconds)
+SWEEP_DURATION = 600.0            # simulated seconds per park unless the game ends first
+CURVE_INTERVAL = 10.0             # population sample period (one in-game month)
+
+# Tunable parameters: name -> (where it lives, attribute)
+#   "win"     → Map.win_conditions[attribute]
+#   "map"     → attribute on the Map instance
+#   "jeep"    → module constant in src.model.jeep
+#   "animals" → module constant in src.model.animals
+#   "visitors" → module constant in src.model.visitorDemand
+PARAMETERS = {
+    "months":              ("win", "months"),
+    "visitors":            ("win", "visitors"),
+    "herbivores":          ("win", "herbivores"),
+    "carnivores":          ("win", "carnivores"),
+    "capital":             ("win", "capital"),
+    "poacher_add_time":    ("map", "poacher_add_time"),
+    "poacher_remove_time": ("map", "poacher_remove_time"),
+    "safari_pass":         ("jeep", "SAFARI_PASS"),
+    "visitor_rate":        ("visitors", "VISITOR_PEAK_RATE"),
+    "hunger_decay":        ("animals", "HUNGER_DECAY_RATE"),
+    "thirst_decay":        ("animals", "THIRST_DECAY_RATE"),
+    "health_decay":        ("animals", "HEALTH_DECAY_RATE"),
+}
+
+_module_defaults: dict[str, float] = {}
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# Worker side
+# ──────────────────────────────────────────────────────────────────────────────
+def _init_worker():
+    """Headless SDL and a silenced stdout (the simulation prints a lot)."""
+    os.environ["SDL_VIDEODRIVER"] = "dummy"
+    os.environ["SDL_AUDIODRIVER"] = "dummy"
+    os.environ["SDL_NO_SIGNAL_HANDLERS"] = "1"   # else SDL swallows the pool's SIGTERM
+    sys.stdout = open(os.devnull, "w")
+
+    import pygame
+    pygame.init()
+    from src.config.settings import SCREEN_WIDTH, SCREEN_HEIGHT  # creates the display
+    pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+
+    # Remember module constants so every job starts from the shipped values
+    from src.model import jeep, animals, visitorDemand
+    modules = {"jeep": jeep, "animals": animals, "visitors": visitorDemand}
+    for name, (target, attr) in PARAMETERS.items():
+        if target in modules:
+            _module_defaults[name] = getattr(modules[target], attr)
+
+
+def _apply_parameters(game_map, params):
+    from src.model import jeep, animals, visitorDemand
+    modules = {"jeep": jeep, "animals": animals, "visitors": visitorDemand}
+
+    for name, value in _module_defaults.items():      # reset what the last job changed
+        target, attr = PARAMETERS[name]
+        setattr(modules[target], attr, value)
+
+    for name, value in params.items():
+        target, attr = PARAMETERS[name]
+        if target == "win":
+            game_map.win_conditions[attr] = value
+        elif target == "map":
+            setattr(game_map, attr, value)
+        else:
+            setattr(modules[target], attr, value)
+
+
+def simulate(job):
+    """Run one park; returns (job, outcome dict, population curve)."""
+    from src.model.safariMap import Map
+
+    difficulty, params, seed, duration = job
+    game_map = Map(difficulty=difficulty.title(), seed=seed)  # TimeIndicator expects "Easy"/"Medium"/"Hard"
+    game_map.autosave.enabled = False
+    _apply_parameters(game_map, params)
+
+    curve = []
+    next_sample = 0.0
+    start = time.perf_counter()
+    while game_map.game_result is None and game_map.sim_time < duration:
+        if game_map.sim_time >= next_sample:
+            curve.append((round(game_map.sim_time, 2), len(game_map.herbivores),
+                          len(game_map.carnivores), len(game_map.omnivores)))
+            next_sample += CURVE_INTERVAL
+        game_map.step(SWEEP_DT)
+
+    extinct = len(game_map.herbivores) + len(game_map.carnivores) + len(game_map.omnivores) == 0
+    bankrupt = game_map.game_result == "loss" and game_map.capital <= 0
+    outcome = {
+        "result": game_map.game_result or "timeout",
+        "bankrupt": int(bankrupt),
+        "extinct": int(extinct),
+        "end_time": round(game_map.sim_time, 2),
+        "capital": game_map.capital,
+        "visitors": game_map.visitor_count,
+        "herbivores": len(game_map.herbivores),
+        "carnivores": len(game_map.carnivores),
+        "omnivores": len(game_map.omnivores),
+        "wall_seconds": round(time.perf_counter() - start, 2),
+    }
+    return job, outcome, curve
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# Grid & aggregation
+# ──────────────────────────────────────────────────────────────────────────────
+def parse_param(text):
+    """'safari_pass=30,50,80' -> ('safari_pass', [30, 50, 80])"""
+    name, _, values = text.partition("=")
+    if name not in PARAMETERS or not values:
+        raise argparse.ArgumentTypeError(f"expected NAME=V1,V2,... with NAME in {', '.join(PARAMETERS)}")
+    return name, [float(v) if "." in v else int(v) for v in values.split(",")]
+
+
+def build_jobs(difficulties, grid, seeds, duration, base_seed=0):
+    names = [name for name, _ in grid]
+    combos = list(itertools.product(*(values for _, values in grid))) or [()]
+    return [
+        (difficulty, dict(zip(names, combo)), base_seed + s, duration)
+        for difficulty in difficulties
+        for combo in combos
+        for s in range(seeds)
+    ]
+
+
+def summarise(results, param_names):
+    groups: dict[tuple, list[dict]] = {}
+    for (difficulty, params, _seed, _), outcome, _curve in results:
+        key = (difficulty, *(params.get(n) for n in param_names))
+        groups.setdefault(key, []).append(outcome)
+
+    rows = []
+    for key, outcomes in sorted(groups.items(), key=lambda kv: str(kv[0])):
+        n = len(outcomes)
+        bankrupt_times = [o["end_time"] for o in outcomes if o["bankrupt"]]
+        rows.append({
+            "difficulty": key[0],
+            **dict(zip(param_names, key[1:])),
+            "runs": n,
+            "win_rate": round(sum(o["result"] == "win" for o in outcomes) / n, 3),
+            "bankruptcy_rate": round(len(bankrupt_times) / n, 3),
+            "mean_time_to_bankruptcy": round(sum(bankrupt_times) / len(bankrupt_times), 2) if bankrupt_times else "",
+            "extinction_rate": round(sum(o["extinct"] for o in outcomes) / n, 3),
+            "mean_final_animals": round(sum(o["herbivores"] + o["carnivores"] + o["omnivores"] for o in outcomes) / n, 2),
+            "mean_final_capital": round(sum(o["capital"] for o in outcomes) / n, 2),
+        })
+    return rows
+
+
+def _write_csv(path, rows):
+    if not rows:
+        return
+    with open(path, "w", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=list(rows[0]))
+        writer.writeheader()
+        writer.writerows(rows)
+
+
+def write_tables(out, results, param_names):
+    os.makedirs(os.path.dirname(out) or ".", exist_ok=True)
+    runs, curves = [], []
+    for (difficulty, params, seed, _), outcome, curve in results:
+        base = {"difficulty": difficulty, **{n: params.get(n) for n in param_names}, "seed": seed}
+        runs.append({**base, **outcome})
+        curves.extend({**base, "time": t, "herbivores": h, "carnivores": c, "omnivores": o}
+                      for t, h, c, o in curve)
+    _write_csv(f"{out}_summary.csv", summarise(results, param_names))
+    _write_csv(f"{out}_runs.csv", runs)
+    _write_csv(f"{out}_curves.csv", curves)
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# Command line
+# ──────────────────────────────────────────────────────────────────────────────
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Parallel balance sweep over headless parks.")
+    parser.add_argument("--difficulty", nargs="+", default=["easy"], choices=["easy", "medium", "hard"])
+    parser.add_argument("--param", action="append", type=parse_param, default=[],
+                        help="NAME=V1,V2,... (repeatable); see PARAMETERS for names")
+    parser.add_argument("--seeds", type=int, default=4, help="seeds per parameter combination")
+    parser.add_argument("--base-seed", type=int, default=0)
+    parser.add_argument("--duration", type=float, default=SWEEP_DURATION, help="simulated seconds per park")
+    parser.add_argument("--workers", type=int, default=os.cpu_count())
+    parser.add_argument("--out", default="sweeps/balance")
+    args = parser.parse_args(argv)
+
+    param_names = [name for name, _ in args.param]
+    jobs = build_jobs(args.difficulty, args.param, args.seeds, args.duration, args.base_seed)
+    print(f"{len(jobs)} parks on {args.workers} workers")
+
+    # "spawn" keeps SDL state out of the children on every platform
+    ctx = multiprocessing.get_context("spawn")
+    results = []
+    start = time.perf_counter()
+    with ctx.Pool(args.workers, initializer=_init_worker) as pool:
+        for i, result in enumerate(pool.imap_unordered(simulate, jobs), 1):
+            results.append(result)
+            print(f"\r{i}/{len(jobs)} done", end="", flush=True)
+        pool.close()
+        pool.join()
+    print(f"\nfinished in {time.perf_counter() - start:.1f}s")
+
+    write_tables(args.out, results, param_names)
+    print(f"wrote {args.out}_summary.csv, {args.out}_runs.csv, {args.out}_curves.csv")
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,126 @@
+# ──────────────────────────────────────────────────────────────────────────────
+# inputActions.py – maps KEYDOWN / KEYUP events to named gameplay actions
+# ──────────────────────────────────────────────────────────────────────────────
+
+import pygame
+
+# ──────────────────────────────────────────────────────────────────────────────
+# Bindings: action -> (key, requires Ctrl)
+# ──────────────────────────────────────────────────────────────────────────────
+ACTION_BINDINGS = {
+    "move_left":        (pygame.K_LEFT,  False),
+    "move_right":       (pygame.K_RIGHT, False),
+    "move_up":          (pygame.K_UP,    False),
+    "move_down":        (pygame.K_DOWN,  False),
+    "attack":           (pygame.K_a,     True),
+    "weapon_prev":      (pygame.K_z,     True),
+    "weapon_next":      (pygame.K_x,     True),
+    "switch_ranger":    (pygame.K_TAB,   False),
+    "toggle_day_night": (pygame.K_n,     False),
+    "toggle_stats":     (pygame.K_g,     False),
+    "toggle_density":   (pygame.K_h,     False),
+}
+
+# Held actions that fire again after `delay` seconds, then every `interval`
+ACTION_REPEAT = {
+    "weapon_prev": (0.4, 0.15),
+    "weapon_next": (0.4, 0.15),
+}
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# InputActions: edge-triggered, non-blocking action state
+# ──────────────────────────────────────────────────────────────────────────────
+class InputActions:
+    """
+    - begin_frame(dt) starts a frame: clears the edge sets and runs repeat timers.
+    - handle_event(event) feeds the KEYDOWN / KEYUP events of that frame.
+    - pressed() / released() are true for exactly one frame, held() while down.
+    - listeners are called as listener(action, is_down) on every press/release
+      (the replay recorder uses this to log ranger control).
+    Nothing here ever sleeps, so input handling never stalls the game loop.
+    """
+
+    def __init__(self, bindings=ACTION_BINDINGS, repeat=ACTION_REPEAT):
+        self.repeat = repeat
+        self._by_key: dict[int, list[tuple[str, bool]]] = {}
+        for action, (key, needs_ctrl) in bindings.items():
+            self._by_key.setdefault(key, []).append((action, needs_ctrl))
+
+        self._held: set[str] = set()
+        self._pressed: set[str] = set()
+        self._released: set[str] = set()
+        self._repeat_timers: dict[str, float] = {}
+        self.listeners: list = []
+
+    # ──────────────────────────────────────────────────────────────────────────
+    # Frame / event processing
+    # ──────────────────────────────────────────────────────────────────────────
+    def begin_frame(self, dt):
+        self._pressed.clear()
+        self._released.clear()
+        for action, remaining in self._repeat_timers.items():
+            remaining -= dt
+            if remaining <= 0:
+                self._pressed.add(action)
+                remaining += self.repeat[action][1]
+            self._repeat_timers[action] = remaining
+
+    def handle_event(self, event):
+        """Update action state from a key event. Returns True if an action changed."""
+        if event.type == pygame.KEYDOWN:
+            ctrl = bool(event.mod & pygame.KMOD_CTRL)
+            changed = False
+            for action, needs_ctrl in self._by_key.get(event.key, ()):
+                if needs_ctrl and not ctrl:
+                    continue
+                self.press(action)
+                changed = True
+            return changed
+
+        if event.type == pygame.KEYUP:
+            changed = False
+            for action, _ in self._by_key.get(event.key, ()):
+                if action in self._held:
+                    self.release(action)
+                    changed = True
+            return changed
+
+        if event.type == pygame.WINDOWFOCUSLOST:
+            self.reset()
+        return False
+
+    def press(self, action):
+        if action in self._held:
+            return
+        self._held.add(action)
+        self._pressed.add(action)
+        if action in self.repeat:
+            self._repeat_timers[action] = self.repeat[action][0]
+        for listener in self.listeners:
+            listener(action, True)
+
+    def release(self, action):
+        if action not in self._held:
+            return
+        self._held.discard(action)
+        self._released.add(action)
+        self._repeat_timers.pop(action, None)
+        for listener in self.listeners:
+            listener(action, False)
+
+    def reset(self):
+        for action in list(self._held):
+            self.release(action)
+
+    # ──────────────────────────────────────────────────────────────────────────
+    # Queries
+    # ──────────────────────────────────────────────────────────────────────────
+    def pressed(self, action):
+        return action in self._pressed
+
+    def released(self, action):
+        return action in self._released
+
+    def held(self, action):
+        return action in self._held
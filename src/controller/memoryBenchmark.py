@@ -0,0 +1,154 @@
+# ──────────────────────────────────────────────────────────────────────────────
+# memoryBenchmark.py – bytes per entity for animals, rangers, poachers and jeeps
+# ──────────────────────────────────────────────────────────────────────────────
+#  Builds N entities of each kind on a headless display and reports how much
+#  Python memory each one costs (tracemalloc delta / N). One entity of every
+#  kind is created first so shared frame tables and caches are not counted.
+#
+#  The "dict" column rebuilds the layout entities had before __slots__: the
+#  same attributes in a per-instance __dict__, plus the tables each instance
+#  used to own (animation frame lists, patrol pattern, jeep sprites and font).
+#  Both columns come from the same tree, so they compare only the layout.
+#
+#  Usage:
+#      python -m src.controller.memoryBenchmark            (1000 of each)
+#      python -m src.controller.memoryBenchmark --count 5000
+#
+#  The jeep figures leave out the pixel data of the per-jeep sprites, which
+#  lives in SDL memory that tracemalloc cannot see.
+# ──────────────────────────────────────────────────────────────────────────────
+
+import argparse
+import gc
+import os
+import sys
+import time
+import tracemalloc
+
+
+def _factories(map_rect, group):
+    from src.model.animals import Herbivore, Carnivore, Omnivore
+    from src.model.rangers import Ranger
+    from src.model.poacher import Poacher
+    from src.model.jeep import Jeep
+    from src.model.jeepFleet import JeepRoute
+    from src.utils.rng import WorldRNG
+
+    rng = WorldRNG(0)
+    route = JeepRoute([(100 + 32 * i, 200) for i in range(20)])
+    collision = []
+
+    class _MapStub:
+        capital = 0
+
+    return {
+        "herbivore": lambda i: Herbivore(f"h{i}", "cow", 3, (500, 500), group, map_rect, 150,
+                                         variant="", rng=rng),
+        "carnivore": lambda i: Carnivore(f"c{i}", "wolf/2", 3, (500, 500), group, map_rect, 300,
+                                         variant="", rng=rng),
+        "omnivore":  lambda i: Omnivore(f"o{i}", "bears/1", 3, (500, 500), group, map_rect, 300,
+                                        body_shape="fat", variant="", rng=rng),
+        "ranger":    lambda i: Ranger((500, 500), group, map_rect, collision),
+        "poacher":   lambda i: Poacher((500, 500), group, map_rect, rng=rng),
+        "jeep":      lambda i: Jeep(route, [group], map_ref=_MapStub()),
+    }
+
+
+class _DictLayout:
+    """Stand-in for an entity that keeps its attributes in a per-instance __dict__."""
+
+
+def _slot_names(cls):
+    for klass in cls.__mro__:
+        for name in getattr(klass, "__slots__", ()):
+            if name not in ("__dict__", "__weakref__"):
+                yield name
+
+
+def _owned_tables(kind, entity):
+    """The tables each instance built for itself before they were shared."""
+    import pygame
+    from src.model.character import PATROL_PATTERN
+
+    if kind in ("herbivore", "carnivore", "omnivore"):
+        return {"animations": [list(frames) for frames in entity.animations]}
+    if kind in ("ranger", "poacher"):
+        return {"pattern": [pygame.Vector2(step) for step in PATROL_PATTERN]}
+    size = entity.image.get_size()
+    return {"directional_sprites": {facing: pygame.Surface(size, pygame.SRCALPHA)
+                                    for facing in ("up", "down", "left", "right")},
+            "font": pygame.font.Font(None, 24)}
+
+
+def _dict_layout(kind, entity, names):
+    stand_in = _DictLayout()
+    stand_in.__dict__.update(entity.__dict__)            # sprite group bookkeeping
+    for name in names:
+        if hasattr(entity, name):
+            setattr(stand_in, name, getattr(entity, name))
+    stand_in.__dict__.update(_owned_tables(kind, entity))
+    return stand_in
+
+
+def _traced(build):
+    """Return (result of build(), bytes it left allocated)."""
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    result = build()
+    gc.collect()
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return result, after - before
+
+
+def measure(kind, factory, count):
+    """Return (bytes per entity with __dict__, with __slots__, ns per attribute read)."""
+    factory(-1)                           # warm shared caches
+    entities, slotted = _traced(lambda: [factory(i) for i in range(count)])
+
+    # The dict layout replaces each instance and its bookkeeping __dict__
+    names = list(_slot_names(type(entities[0])))
+    _, stand_ins = _traced(lambda: [_dict_layout(kind, e, names) for e in entities])
+    replaced = sum(sys.getsizeof(e) + sys.getsizeof(e.__dict__) for e in entities)
+    unslotted = slotted + stand_ins - replaced
+
+    start = time.perf_counter()
+    for e in entities:
+        for _ in range(10):
+            e.pos; e.rect; e.speed; e.image
+    read_time = (time.perf_counter() - start) / (count * 10 * 4) * 1e9
+    return unslotted / count, slotted / count, read_time
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Memory cost per simulated entity.")
+    parser.add_argument("--count", type=int, default=1000)
+    args = parser.parse_args(argv)
+
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+    import pygame
+    from src.config.settings import SCREEN_WIDTH, SCREEN_HEIGHT
+    pygame.init()
+    pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+
+    group = pygame.sprite.Group()
+    map_rect = pygame.Rect(0, 0, 3200, 3200)
+
+    stdout, sys.stdout = sys.stdout, open(os.devnull, "w")   # constructors print
+    try:
+        results = {kind: measure(kind, factory, args.count)
+                   for kind, factory in _factories(map_rect, group).items()}
+    finally:
+        sys.stdout.close()
+        sys.stdout = stdout
+
+    print(f"{'entity':<10} {'dict':>8} {'slots':>8} {'delta':>8} {'change':>7} {'ns/attr read':>13}")
+    for kind, (unslotted, slotted, read_ns) in results.items():
+        delta = slotted - unslotted
+        print(f"{kind:<10} {unslotted:>8,.0f} {slotted:>8,.0f} {delta:>+8,.0f} {delta / unslotted:>+7.0%} "
+              f"{read_ns:>13.1f}")
+
+if __name__ == "__main__":
+    sys.exit(main())
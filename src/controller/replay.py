@@ -0,0 +1,208 @@
+# ──────────────────────────────────────────────────────────────────────────────
+# replay.py – records a play session as (seed, frame dts, commands) and replays it
+# ──────────────────────────────────────────────────────────────────────────────
+#  A session is reproducible from three things: the world seed, the dt of every
+#  frame, and the player commands issued in each frame (purchases, placements,
+#  sales, chipping, time-mode changes, day/night toggles and ranger key
+#  presses). Commands are tagged with the frame index and with whether they
+#  happened before or after that frame's simulation step.
+#
+#  Usage:
+#      python -m src.controller.replay replays/session_XXXX.json            (headless)
+#      python -m src.controller.replay replays/session_XXXX.json --render --speed 4
+# ──────────────────────────────────────────────────────────────────────────────
+
+import json
+import os
+import sys
+import time
+
+import pygame
+
+REPLAY_VERSION = 1
+REPLAY_DIR = "replays"
+
+# Commands whose first argument is an index into Map.animals
+ANIMAL_COMMANDS = {"sell_animal", "chip_animal"}
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# Recording
+# ──────────────────────────────────────────────────────────────────────────────
+class ReplayRecorder:
+    """
+    Attaches to a Map and its InputActions.
+    - begin_frame(dt) is called by the game loop once per rendered frame.
+    - Map.step() calls stepped() so paused frames replay as paused.
+    - Map command methods call command(); InputActions reports key actions.
+    """
+
+    def __init__(self, game_map):
+        self.map = game_map
+        self.seed = game_map.rng.seed
+        self.difficulty = game_map.time_indicator.difficulty
+        self.frames: list[list] = []            # [dt, stepped]
+        self.commands: list[list] = []          # [frame, after_step, name, args]
+        self.recording = True
+
+        game_map.recorder = self
+        game_map.input.listeners.append(self._on_input)
+
+    def begin_frame(self, dt):
+        if self.recording:
+            self.frames.append([dt, False])
+
+    def stepped(self):
+        if self.frames:
+            self.frames[-1][1] = True
+
+    def command(self, name, *args):
+        if not self.recording:
+            return
+        frame = max(len(self.frames) - 1, 0)
+        after_step = bool(self.frames) and self.frames[-1][1]
+        self.commands.append([frame, after_step, name, list(args)])
+
+    def _on_input(self, action, is_down):
+        self.command("press" if is_down else "release", action)
+
+    def detach(self, reason=""):
+        """Stop recording (e.g. the park was replaced by a loaded save)."""
+        if not self.recording:
+            return
+        self.recording = False
+        self.map.recorder = None
+        if self._on_input in self.map.input.listeners:
+            self.map.input.listeners.remove(self._on_input)
+        if reason:
+            print(f"[REPLAY] recording stopped: {reason}")
+
+    # ──────────────────────────────────────────────────────────────────────────
+    # Persistence
+    # ──────────────────────────────────────────────────────────────────────────
+    def to_dict(self):
+        return {
+            "version": REPLAY_VERSION,
+            "seed": self.seed,
+            "difficulty": self.difficulty,
+            "frames": self.frames,
+            "commands": self.commands,
+        }
+
+    def save(self, path=None):
+        if not self.frames:
+            return None
+        if path is None:
+            stamp = time.strftime("%Y%m%d_%H%M%S")
+            path = os.path.join(REPLAY_DIR, f"session_{stamp}.json")
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        with open(path, "w") as f:
+            json.dump(self.to_dict(), f, separators=(",", ":"))
+        print(f"[REPLAY] saved {len(self.frames)} frames to {path}")
+        return path
+
+
+def load_replay(path):
+    with open(path) as f:
+        log = json.load(f)
+    if log.get("version") != REPLAY_VERSION:
+        raise ValueError(f"unsupported replay version {log.get('version')}")
+    return log
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# Playback
+# ──────────────────────────────────────────────────────────────────────────────
+class ReplayPlayer:
+    """Rebuilds the recorded park from its seed and feeds the log back in."""
+
+    def __init__(self, log, game_reference=None):
+        from src.model.safariMap import Map  # safariMap pulls in the whole UI
+
+        self.log = log
+        self.map = Map(difficulty=log["difficulty"], game_reference=game_reference, seed=log["seed"])
+        self.map.autosave.enabled = False
+        self.frames = log["frames"]
+
+        # Commands grouped per frame and phase: {(frame, after_step): [(name, args), ...]}
+        self.schedule: dict[tuple[int, bool], list] = {}
+        for frame, after_step, name, args in log["commands"]:
+            self.schedule.setdefault((frame, after_step), []).append((name, args))
+
+    def _apply(self, frame, after_step):
+        m = self.map
+        for name, args in self.schedule.get((frame, after_step), ()):
+            if name == "press":
+                m.input.press(*args)
+            elif name == "release":
+                m.input.release(*args)
+            elif name in ANIMAL_COMMANDS:
+                getattr(m, name)(m.animals[args[0]], *args[1:])
+            else:
+                getattr(m, name)(*args)
+
+    def advance(self, frame, draw=False):
+        """Replay one recorded frame; `draw` renders it through Map.run."""
+        dt, stepped = self.frames[frame]
+        self.map.input.begin_frame(dt)
+        self._apply(frame, False)
+        if stepped:
+            if draw:
+                self.map.run(dt, [])
+            else:
+                self.map.step(dt)
+        self._apply(frame, True)
+
+    def play_headless(self):
+        for frame in range(len(self.frames)):
+            self.advance(frame)
+        return self.map
+
+    def play_rendered(self, speed=1.0, fps=60):
+        """Show the replay; speed > 1 simulates several frames per displayed one."""
+        clock = pygame.time.Clock()
+        stride = max(1, int(speed))
+        tick_rate = fps * speed / stride
+        for frame in range(len(self.frames)):
+            draw = frame % stride == stride - 1
+            self.advance(frame, draw=draw)
+            if draw:
+                pygame.display.update()
+                clock.tick(tick_rate)
+                if any(event.type == pygame.QUIT for event in pygame.event.get()):
+                    return self.map
+        return self.map
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# Command line
+# ──────────────────────────────────────────────────────────────────────────────
+def main(argv=None):
+    import argparse
+    from src.config.settings import SCREEN_WIDTH, SCREEN_HEIGHT
+
+    parser = argparse.ArgumentParser(description="Replay a recorded Safari Park session.")
+    parser.add_argument("path")
+    parser.add_argument("--render", action="store_true", help="draw the replay in a window")
+    parser.add_argument("--speed", type=float, default=1.0, help="playback multiplier when rendering")
+    args = parser.parse_args(argv)
+
+    if not args.render:
+        os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    pygame.init()
+    pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+
+    log = load_replay(args.path)
+    player = ReplayPlayer(log)
+    start = time.perf_counter()
+    game_map = player.play_rendered(args.speed) if args.render else player.play_headless()
+    elapsed = time.perf_counter() - start
+
+    print(f"Replayed {len(player.frames)} frames in {elapsed:.2f}s "
+          f"({len(player.frames) / max(elapsed, 1e-9):.0f} frames/s)")
+    print(f"capital={game_map.capital} animals={len(game_map.animals)} "
+          f"poachers={len(game_map.poachers)} result={game_map.game_result}")
+
+
+if __name__ == "__main__":
+    sys.exit(main())
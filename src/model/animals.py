@@ -2,13 +2,16 @@
 #  animals.py – creature AI with herding, reproduction, and needs system
 # ──────────────────────────────────────────────────────────────────────────────
 import os
-import random
 import pygame
 from typing import Literal, List, Optional, Tuple
 
 from src.config.settings import *  # TILE_SIZE, LAYERS, SCREEN_WIDTH …
 from src.utils.support import import_folder
+from src.utils.rng import WorldRNG, DEFAULT_RNG
 from src.model.sprites import Water
+from src.model.herd import HERD_COHESION_WEIGHT, HERD_SEPARATION_WEIGHT
+from src.model.proximityService import THREATS, PREY, is_valid_prey
+from src.model.animation import quantise, FOUR_WAY, IDLE, WALK, UP, DOWN, LEFT, RIGHT, N_DIRECTIONS
 
 # --------------------------------------------------------------------------- #
 #  Animation helper (4-directional sheets for 8-way movement)                #
@@ -23,19 +26,27 @@ DIRECTION_MAPPING = {
     "up": "up",
     "down": "down",
 }
+SHEET_DIRECTIONS = ((UP, "up"), (DOWN, "down"), (LEFT, "left"), (RIGHT, "right"))
+WANDER_DIRECTIONS = ((UP, (0, -1)), (DOWN, (0, 1)), (LEFT, (-1, 0)), (RIGHT, (1, 0)))
 
 # --------------------------------------------------------------------------- #
 #  Herd behavior settings                                                    #
 # --------------------------------------------------------------------------- #
-HERD_RADIUS = 120          # Distance at which animals will form herds
 HERD_FOLLOW_DIST = 60      # Distance to maintain from herd leader
-HERD_STUCK_TIME = 1.5      # Time before considering leader stuck (seconds)
+CRITICAL_NEED = 20         # Hunger / thirst below which an animal leaves a herd move order
+# Leader hand-over, cohesion and separation live in herd.py
+
+# --------------------------------------------------------------------------- #
+#  Predator / prey settings                                                  #
+# --------------------------------------------------------------------------- #
+PREY_DETECTION_RADIUS = 150  # How far predators can spot prey (1.5x DETECTION_RADIUS)
 
 # --------------------------------------------------------------------------- #
 #  Reproduction and growth settings                                          #
 # --------------------------------------------------------------------------- #
 INTERACTION_RADIUS = 60    # Distance for mating interaction
 GESTATION_SECONDS = 200    # Pregnancy duration in game seconds
+FERTILITY_COOLDOWN = 60    # Game seconds after a birth before a female mates again
 ONE_YEAR_SECONDS = 120     # Aging speed (game-time)
 SMALL_SCALE_FACTOR = 0.50  # Baby size multiplier
 MEDIUM_SCALE_FACTOR = 0.80 # Adolescent size multiplier
@@ -74,10 +85,82 @@ HERBIVORE_LIFESPAN = 15   # Herbivores die at age 15
 OMNIVORE_LIFESPAN = 20     # Omnivores die at age 16
 CARNIVORE_LIFESPAN = 25    # Carnivores die at age 20
 
+# --------------------------------------------------------------------------- #
+#  Shared frame cache (decoded and scaled once per folder and size)          #
+# --------------------------------------------------------------------------- #
+_SCALED_FRAMES: dict[tuple[str, tuple[int, int]], list[pygame.Surface]] = {}
+
+
+def load_scaled_frames(path: str, size: tuple[int, int]) -> list[pygame.Surface]:
+    """Return the frames of `path` scaled to `size`, shared by every caller."""
+    key = (path, size)
+    frames = _SCALED_FRAMES.get(key)
+    if frames is None:
+        frames = _SCALED_FRAMES[key] = [pygame.transform.scale(f, size) for f in import_folder(path)]
+    return frames
+
+
+def _frame_size(body_shape: str, scale: float) -> tuple[int, int]:
+    if body_shape == "fat":
+        return int(32 * scale * 1.1), int(32 * scale)
+    if body_shape == "tall":
+        return int(32 * scale), int(32 * scale * 1.2)
+    return (int(32 * scale),) * 2
+
+
+# One animation set per (sheet folder, frame size): a tuple of frame lists
+# indexed by action * N_DIRECTIONS + facing, shared by every animal using it
+_ANIMATION_SETS: dict[tuple[str, tuple[int, int]], tuple[list[pygame.Surface], ...]] = {}
+
+
+def load_animation_set(folder: str, size: tuple[int, int]) -> tuple[list[pygame.Surface], ...]:
+    key = (folder, size)
+    animations = _ANIMATION_SETS.get(key)
+    if animations is not None:
+        return animations
+
+    table: list[list[pygame.Surface]] = [[] for _ in range(2 * N_DIRECTIONS)]
+    base_path = os.path.join("src/assets/characters/animals", folder)
+    for facing, direction in SHEET_DIRECTIONS:
+        full_path = os.path.join(base_path, direction)
+        if not os.path.isdir(full_path):
+            continue
+        frames = load_scaled_frames(full_path, size)
+        if frames:
+            table[WALK * N_DIRECTIONS + facing] = frames
+            # Dedicated idle frames if the sheet has them, else the first walk frame
+            idle_path = os.path.join(base_path, f"{direction}_idle")
+            if os.path.isdir(idle_path):
+                table[IDLE * N_DIRECTIONS + facing] = load_scaled_frames(idle_path, size)
+            else:
+                table[IDLE * N_DIRECTIONS + facing] = [frames[0]]
+
+    animations = _ANIMATION_SETS[key] = tuple(table)
+    return animations
+
+
 class Animal(pygame.sprite.Sprite):
     """Base class for all creatures with herding, reproduction, and needs systems."""
 
     DETECTION_RADIUS = 100   # Default threat detection range
+    HERDS = True             # joins the Herd of its group_type when added to a map
+
+    # Fixed attribute layout instead of a per-instance dict
+    __slots__ = (
+        "rng", "name", "species", "age", "age_clock", "price", "group_type", "gender", "mother",
+        "is_pregnant", "gestation_timer", "_stored_father", "fertility_cooldown", "breeding_index",
+        "proximity", "navigator",
+        "health", "hunger_level", "thirst_level", "is_alive",
+        "pos", "map_rect", "direction", "speed", "base_scale", "scale", "body_shape",
+        "current_water_target", "drink_timer", "water_search_timer", "is_drinking",
+        "variant", "status", "animations", "frame_index", "frame_timer", "image", "rect", "hitbox",
+        "z", "collision_sprites",
+        "step_timer", "step_duration", "idle", "idle_duration", "idle_timer",
+        "fleeing", "flee_duration", "flee_timer",
+        "hunger_timer", "thirst_timer", "health_timer", "eat_plant_timer",
+        "edge_timer", "edge_margin",
+        "herd", "_last_pos", "_stuck", "_main_group",
+    )
 
     def __init__(
         self,
@@ -95,8 +178,11 @@ class Animal(pygame.sprite.Sprite):
         group_type: Optional[str] = None,
         gender: Optional[Literal["male", "female"]] = None,
         mother: Optional["Animal"] = None,
+        variant: Optional[str] = None,
+        rng: Optional[WorldRNG] = None,
     ):
         super().__init__(group)
+        self.rng = rng or (mother.rng if mother else DEFAULT_RNG)
 
         # Basic creature information
         self.name = name
@@ -105,13 +191,17 @@ class Animal(pygame.sprite.Sprite):
         self.age_clock = 0.0
         self.price = price
         self.group_type = group_type or species
-        self.gender = gender or random.choice(("male", "female"))
+        self.gender = gender or self.rng.breeding.choice(("male", "female"))
         self.mother = mother
 
         # Reproduction tracking
         self.is_pregnant = False
         self.gestation_timer = 0.0
         self._stored_father = None
+        self.fertility_cooldown = 0.0
+        self.breeding_index = None  # BreedingIndex of the map, set when added to one
+        self.proximity = None       # ProximityService of the map, likewise
+        self.navigator = None       # Navigator on the map's Pathfinder, likewise
 
         # Vital needs system
         self.health = 100
@@ -134,16 +224,14 @@ class Animal(pygame.sprite.Sprite):
         self.water_search_timer = 0.0
         self.is_drinking = False
 
-        # Animation system - now includes idle animations
-        self.status = "down_idle"  # Start in idle state
-        self.animations = {
-            'up': [], 'down': [], 'left': [], 'right': [],
-            'up_idle': [], 'down_idle': [], 'left_idle': [], 'right_idle': []
-        }
+        # Animation system - shared frame lists indexed by action * N_DIRECTIONS + facing
+        self.variant = variant  # sprite sheet sub-folder, picked once
+        self.status = DOWN  # facing (sheet direction id); starts idle
+        self.animations: tuple[list[pygame.Surface], ...] = ()
         self.frame_index = 0
         self.frame_timer = 0.0
         self.import_assets(self._get_sheet_folder())
-        self.image = self.animations[self.status][0]
+        self.image = self.animations[IDLE * N_DIRECTIONS + self.status][0]
         self.rect = self.image.get_rect(center=pos)
         self.hitbox = self.rect.inflate(-10, -10)
 
@@ -153,7 +241,7 @@ class Animal(pygame.sprite.Sprite):
 
         # Movement behavior timers
         self.step_timer = 0.0
-        self.step_duration = random.uniform(2.5, 4.5)
+        self.step_duration = self.rng.movement.uniform(2.5, 4.5)
         self.idle = True  # Start in idle state
         self.idle_duration = 1.0
         self.idle_timer = 0.0
@@ -174,7 +262,7 @@ class Animal(pygame.sprite.Sprite):
         self.edge_margin = 100
 
         # Herd behavior tracking
-        self.herd_leader: Optional["Animal"] = None
+        self.herd = None  # Herd of this group_type, set by the map's HerdManager
         self._last_pos = self.pos.copy()
         self._stuck = 0.0
 
@@ -199,54 +287,25 @@ class Animal(pygame.sprite.Sprite):
         """Load animation frames with proper scaling for body shape."""
         full_base_path = os.path.join("src/assets/characters/animals", folder)
         
-        # Handle variant subfolders (type_1, type_2, etc.)
-        type_folder = None
-        for i in range(1, 9):
-            if os.path.isdir(os.path.join(full_base_path, str(i))):
-                type_folder = str(random.randint(1, 8))
-                break
-            if os.path.isdir(os.path.join(full_base_path, f'type_{i}')):
-                type_folder = f'type_{random.randint(1, 8)}'
-                break
-        
-        if type_folder:
-            folder = f"{folder}/{type_folder}"
-            full_base_path = os.path.join("src/assets/characters/animals", folder)
-        
-        # Load animations for each direction
-        found_valid = False
-        for direction in ("up", "down", "left", "right"):
-            full_path = os.path.join(full_base_path, direction)
-            if os.path.isdir(full_path):
-                frames = import_folder(full_path)
-                
-                # Scale based on body shape
-                if self.body_shape == "fat":
-                    size = (int(32 * self.scale * 1.1), int(32 * self.scale))
-                elif self.body_shape == "tall":
-                    size = (int(32 * self.scale), int(32 * self.scale * 1.2))
-                else:
-                    size = (int(32 * self.scale),) * 2
-                    
-                if frames:
-                    # Create both moving and idle animations
-                    self.animations[direction] = [
-                        pygame.transform.scale(f, size) for f in frames
-                    ]
-                    # For idle, use first frame or create dedicated idle frames if available
-                    idle_path = os.path.join(full_base_path, f"{direction}_idle")
-                    if os.path.isdir(idle_path):
-                        idle_frames = import_folder(idle_path)
-                        self.animations[f"{direction}_idle"] = [
-                            pygame.transform.scale(f, size) for f in idle_frames
-                        ]
-                    else:
-                        # Default to first frame if no idle animation exists
-                        self.animations[f"{direction}_idle"] = [self.animations[direction][0]]
-                    found_valid = True
+        # Handle variant subfolders (type_1, type_2, etc.), chosen once per animal
+        if self.variant is None:
+            self.variant = ""
+            for i in range(1, 9):
+                if os.path.isdir(os.path.join(full_base_path, str(i))):
+                    self.variant = str(self.rng.spawns.randint(1, 8))
+                    break
+                if os.path.isdir(os.path.join(full_base_path, f'type_{i}')):
+                    self.variant = f'type_{self.rng.spawns.randint(1, 8)}'
+                    break
         
+        if self.variant:
+            folder = f"{folder}/{self.variant}"
+
+        # Frames for this sheet and size are shared with every other animal using them
+        self.animations = load_animation_set(folder, _frame_size(self.body_shape, self.scale))
+
         # Fallback if no valid animations found
-        if not found_valid:
+        if not any(self.animations):
             print(f"Warning: No valid animation folders for '{self.species}' in '{folder}'")
             self.image = pygame.Surface((32, 32))
             self.image.fill((255, 0, 0))
@@ -255,22 +314,13 @@ class Animal(pygame.sprite.Sprite):
     #  Utility methods                                                      #
     # --------------------------------------------------------------------- #
     @staticmethod
-    def _label_from_vector(vec: pygame.Vector2) -> str:
-        """Convert movement vector to animation status label."""
-        x, y = round(vec.x), round(vec.y)
-        direction = {
-            (-1, -1): "up_left",
-            (1, -1): "up_right",
-            (-1, 1): "down_left",
-            (1, 1): "down_right",
-            (-1, 0): "left",
-            (1, 0): "right",
-            (0, -1): "up",
-            (0, 1): "down",
-        }.get((x, y), "down")
-        
-        # Remove _idle suffix if present and we're moving
-        return direction.split('_')[0]
+    def _facing_from_vector(vec: pygame.Vector2) -> int:
+        """Convert movement vector to the facing (sheet direction) id."""
+        return FOUR_WAY[quantise(vec.x, vec.y)]
+
+    def _frames(self, action: int) -> list[pygame.Surface]:
+        """Frame list of `action` for the current facing."""
+        return self.animations[action * N_DIRECTIONS + self.status]
 
     def draw_detection_range(
         self,
@@ -299,7 +349,7 @@ class Animal(pygame.sprite.Sprite):
                 continue
             # Allow overlapping with herd members or family
             if (other.group_type == self.group_type and
-                (self.herd_leader or other.herd_leader or
+                (self.herd is not None or other.herd is not None or
                  self.mother is other or other.mother is self)):
                 continue
             if rect.colliderect(other.rect):
@@ -362,7 +412,7 @@ class Animal(pygame.sprite.Sprite):
                     collision_targets is None or not self._collides_with_any(trial, collision_targets)
                 ):
                     self.direction = alt
-                    self.status = self._label_from_vector(self.direction)
+                    self.status = self._facing_from_vector(self.direction)
                     self.pos.update(
                         self.pos.x + alt.x * self.speed * dt,
                         self.pos.y + alt.y * self.speed * dt
@@ -370,27 +420,24 @@ class Animal(pygame.sprite.Sprite):
                     self.rect.center = self.pos
                     break
 
-        # Track if creature is stuck
-        if (self.pos - self._last_pos).length_squared() < 1:
+        # Track if creature is stuck: it covered less than a quarter of its step
+        step = 0.25 * self.speed * dt
+        if (self.pos - self._last_pos).length_squared() < step * step:
             self._stuck += dt
         else:
             self._stuck = 0.0
         self._last_pos.update(self.pos)
 
-        # Update hitbox and handle tile collisions
+        # Update hitbox and handle tile collisions. pos keeps its fraction unless
+        # a tile pushes it back: slow diagonal steps are under a pixel per axis
         self.hitbox.center = self.pos
         self._tile_collision("horizontal")
         self._tile_collision("vertical")
         self.rect.center = self.hitbox.center
-        self.pos.update(self.hitbox.center)
 
     def _choose_new_random_direction(self) -> None:
         """Select a new random wandering direction."""
-        direction = random.choice(("up", "down", "left", "right"))
-        self.status = direction
-        self.direction.xy = {
-            "up": (0, -1), "down": (0, 1), "left": (-1, 0), "right": (1, 0)
-        }[direction]
+        self.status, self.direction.xy = self.rng.movement.choice(WANDER_DIRECTIONS)
 
     def _update_wander_pattern(self, dt: float) -> None:
         """Manage the wandering behavior cycle."""
@@ -419,7 +466,7 @@ class Animal(pygame.sprite.Sprite):
                 dx = 1 if x < m else -1 if x > self.map_rect.width - m else 0
                 dy = 1 if y < m else -1 if y > self.map_rect.height - m else 0
                 self.direction.update(dx, dy)
-                self.status = self._label_from_vector(self.direction)
+                self.status = self._facing_from_vector(self.direction)
                 self.step_timer = self.edge_timer = 0.0
         else:
             self.edge_timer = 0.0
@@ -427,83 +474,103 @@ class Animal(pygame.sprite.Sprite):
     # --------------------------------------------------------------------- #
     #  Herd behavior                                                        #
     # --------------------------------------------------------------------- #
-    def _update_herd(self, animals: list["Animal"], dt: float) -> None:
-        """Manage herd following behavior."""
-        if self.type == "carnivore" or self.fleeing:
-            self.herd_leader = None
+    @property
+    def herd_leader(self) -> Optional["Animal"]:
+        return self.herd.leader if self.herd is not None else None
+
+    def _update_herd(self, dt: float) -> None:
+        """Follow the herd leader, steering with boids cohesion and separation."""
+        herd = self.herd
+        if herd is None or self.fleeing or herd.destination is not None:
+            return
+        leader = herd.leader
+        if leader is None or leader is self:
             return
 
-        # Drop leader if gone or stuck
-        if self.herd_leader and (
-            not self.herd_leader.is_alive or self.herd_leader._stuck > HERD_STUCK_TIME
-        ):
-            self.herd_leader = None
-
-        # Find new leader if needed
-        if self.herd_leader is None:
-            nearest, dmin = None, float("inf")
-            for o in animals:
-                if (o is self or not o.is_alive or o.group_type != self.group_type or o.fleeing):
-                    continue
-                d = self.pos.distance_to(o.pos)
-                if d < HERD_RADIUS and d < dmin:
-                    nearest, dmin = o, d
-            if nearest:
-                self.herd_leader = nearest.herd_leader or nearest
-
-        # Follow leader behavior
-        if self.herd_leader and self.herd_leader is not self:
-            vec = self.herd_leader.pos - self.pos
-            if vec.length() > HERD_FOLLOW_DIST:
-                self.direction = vec.normalize()
-                self.status = self._label_from_vector(self.direction)
-                self.idle = False
-                outsiders = [a for a in animals if a.group_type != self.group_type]
-                self.move(dt, outsiders)
-            else:
-                self.idle = self.herd_leader.idle
+        vec = leader.pos - self.pos
+        if vec.length_squared() > HERD_FOLLOW_DIST * HERD_FOLLOW_DIST:
+            steer = vec.normalize()
+            to_centre = herd.centroid - self.pos
+            if to_centre.length_squared() > 0:
+                steer += to_centre.normalize() * HERD_COHESION_WEIGHT
+            push = herd.separation.get(self)
+            if push is not None:
+                steer += push * HERD_SEPARATION_WEIGHT
+            self.direction = steer.normalize() if steer.length_squared() > 0 else vec.normalize()
+            self.status = self._facing_from_vector(self.direction)
+            self.idle = False
+            self.move(dt, herd.outsiders())
+        else:
+            self.idle = leader.idle
+
+    def _needs_critical(self) -> bool:
+        """Hungry or thirsty enough to break off a herd move order."""
+        return self.thirst_level < CRITICAL_NEED or self.hunger_level < CRITICAL_NEED
+
+    def _follow_herd_order(self) -> None:
+        """Walk the herd's destination flow field, keeping apart from herd mates."""
+        herd = self.herd
+        steer = herd.destination.direction_at(self.pos)
+        if steer is None:                       # in the goal tile: wait for the others
+            self.direction.xy = (0, 0)
+            self.idle = True
+            return
+        push = herd.separation.get(self)
+        if push is not None:
+            steer += push * HERD_SEPARATION_WEIGHT
+        if steer.length_squared() > 0:
+            self.direction = steer.normalize()
+            self.status = self._facing_from_vector(self.direction)
+        self.idle = False
 
     # --------------------------------------------------------------------- #
     #  Reproduction system                                                  #
     # --------------------------------------------------------------------- #
     def _check_reproduction(self, animals: list["Animal"]) -> None:
         """Check for mating opportunities."""
-        if self.gender != "female" or self.is_pregnant or self.type == "carnivore":
+        if (self.gender != "female" or self.is_pregnant or self.fertility_cooldown > 0 or
+                self.type == "carnivore"):
             return
-            
-        for other in animals:
-            if (other is self or not other.is_alive or
-                other.gender != "male" or
-                other.group_type != self.group_type):
-                continue
-                
-            if self.pos.distance_to(other.pos) <= INTERACTION_RADIUS:
-                self.is_pregnant = True
-                self.gestation_timer = GESTATION_SECONDS
-                self._stored_father = other
-                print(f"[PAIR] {self.name} mated with {other.name}")
-                return
+
+        if self.breeding_index is not None:
+            mate = self.breeding_index.find_mate(self)
+        else:
+            # Not on a map (tests, tools): plain scan of the list we were given
+            mate = next((other for other in animals
+                         if other is not self and other.is_alive and other.gender == "male" and
+                         other.group_type == self.group_type and
+                         self.pos.distance_to(other.pos) <= INTERACTION_RADIUS), None)
+
+        if mate is not None:
+            self.is_pregnant = True
+            self.gestation_timer = GESTATION_SECONDS
+            self._stored_father = mate
+            print(f"[PAIR] {self.name} mated with {mate.name}")
 
     def _gestate(self, dt: float, animals: list["Animal"]) -> None:
-        """Handle pregnancy countdown."""
+        """Handle pregnancy countdown (and the rest after a birth)."""
         if not self.is_pregnant:
+            if self.fertility_cooldown > 0:
+                self.fertility_cooldown = max(0.0, self.fertility_cooldown - dt)
             return
             
         self.gestation_timer -= dt
         if self.gestation_timer <= 0.0:
             self.is_pregnant = False
+            self.fertility_cooldown = FERTILITY_COOLDOWN
             self._give_birth(animals)
 
     def _give_birth(self, animals: list["Animal"]) -> None:
         """Create a new baby animal."""
         father = self._stored_father or self
-        baby_species = random.choice((self.species, father.species))
-        baby_name = f"{baby_species.split('/')[-1]}_baby_{random.randint(100,999)}"
+        breeding = self.rng.breeding
+        baby_species = breeding.choice((self.species, father.species))
+        baby_name = f"{baby_species.split('/')[-1]}_baby_{breeding.randint(100,999)}"
         baby_pos = (
-            self.pos.x + random.randint(-20, 20),
-            self.pos.y + random.randint(-20, 20)
+            self.pos.x + breeding.randint(-20, 20),
+            self.pos.y + breeding.randint(-20, 20)
         )
-        baby_gender = random.choice(("male", "female"))
+        baby_gender = breeding.choice(("male", "female"))
         baby_cls = self.__class__
         
         baby = baby_cls(
@@ -568,7 +635,8 @@ class Animal(pygame.sprite.Sprite):
         self.body_shape = size_label
         self.scale = self.base_scale * scale_factor
         self.import_assets(self._get_sheet_folder())
-        self.image = self.animations[self.status][int(self.frame_index) % len(self.animations[self.status])]
+        frames = self._frames(WALK)
+        self.image = frames[int(self.frame_index) % len(frames)]
         centre = self.rect.center
         self.rect = self.image.get_rect(center=centre)
 
@@ -579,27 +647,26 @@ class Animal(pygame.sprite.Sprite):
         """Detect predators and initiate fleeing behavior."""
         if self.type == "carnivore":
             return
-            
-        flee_from = {
-            "herbivore": ("carnivore", "omnivore"),
-            "omnivore": ("carnivore",)
-        }[self.type]
-        
-        for other in animals:
-            if (other is self or not other.is_alive or
-                getattr(other, "type", None) not in flee_from):
-                continue
-                
-            if self.rect.colliderect(other.rect.inflate(self.DETECTION_RADIUS, self.DETECTION_RADIUS)):
-                vec = pygame.Vector2(other.rect.center) - self.pos
-                if vec.length_squared() > 0:
-                    self.direction = -vec.normalize()
-                    self.status = self._label_from_vector(self.direction)
-                    self.fleeing = True
-                    self.flee_timer = 0.0
-                    self.idle = False
-                    self.herd_leader = None
-                    return
+
+        if self.proximity is not None:
+            threat = self.proximity.sighting(self).threat
+        else:
+            # Not on a map (tests, tools): plain scan of the list we were given
+            flee_from = THREATS[self.type]
+            threat = next((other for other in animals
+                           if other is not self and other.is_alive and
+                           getattr(other, "type", None) in flee_from and
+                           self.rect.colliderect(other.rect.inflate(self.DETECTION_RADIUS,
+                                                                    self.DETECTION_RADIUS))), None)
+
+        if threat is not None:
+            vec = pygame.Vector2(threat.rect.center) - self.pos
+            if vec.length_squared() > 0:
+                self.direction = -vec.normalize()
+                self.status = self._facing_from_vector(self.direction)
+                self.fleeing = True
+                self.flee_timer = 0.0
+                self.idle = False
 
     # --------------------------------------------------------------------- #
     #  Plant eating behavior                                                #
@@ -658,7 +725,7 @@ class Animal(pygame.sprite.Sprite):
                 # Move toward plant
                 self.idle = False
                 self.direction = (target_pos - self.pos).normalize()
-                self.status = self._label_from_vector(self.direction)
+                self.status = self._facing_from_vector(self.direction)
         else:
             # No plants found, graze randomly
             self.idle = True
@@ -703,7 +770,7 @@ class Animal(pygame.sprite.Sprite):
         self.water_search_timer += dt
         if self.water_search_timer < WATER_SEARCH_COOLDOWN and not self.current_water_target:
             # During cooldown, move randomly to avoid getting stuck
-            if random.random() < 0.05:  # 5% chance to change direction each frame
+            if self.rng.movement.random() < 0.05:  # 5% chance to change direction each frame
                 self._choose_new_random_direction()
             return
         
@@ -738,21 +805,27 @@ class Animal(pygame.sprite.Sprite):
                 # Move toward water
                 self.idle = False
                 self.is_drinking = False
-                self.direction = (target_pos - self.pos).normalize()
-                self.status = self._label_from_vector(self.direction)
+                if self.navigator is not None:
+                    # Straight while the line is clear, around obstacles otherwise
+                    steer = self.navigator.steer(self.pos, target_pos, force=self._stuck > 2.0)
+                    if steer is not None:
+                        self.direction = steer
+                else:
+                    self.direction = (target_pos - self.pos).normalize()
+                self.status = self._facing_from_vector(self.direction)
                 
                 # If stuck while moving toward water, try a different path
-                if self._stuck > 2.0:  # If stuck for 2 seconds
+                if self.navigator is None and self._stuck > 2.0:  # If stuck for 2 seconds
                     # Try moving perpendicular to current direction
                     self.direction = pygame.Vector2(-self.direction.y, self.direction.x)
-                    if random.random() < 0.5:
+                    if self.rng.movement.random() < 0.5:
                         self.direction *= -1  # 50% chance to go the other way
                     self._stuck = 0.0
         else:
             # No water found - move randomly and try again later
             self.is_drinking = False
             self.current_water_target = None
-            if random.random() < 0.1:  # 10% chance to change direction
+            if self.rng.movement.random() < 0.1:  # 10% chance to change direction
                 self._choose_new_random_direction()
 
     # --------------------------------------------------------------------- #
@@ -803,8 +876,8 @@ class Animal(pygame.sprite.Sprite):
             self._gestate(dt, animals)
 
         # Herd behavior
-        if animals and not self.fleeing:
-            self._update_herd(animals, dt)
+        if not self.fleeing:
+            self._update_herd(dt)
 
         # Threat detection
         if animals:
@@ -812,15 +885,19 @@ class Animal(pygame.sprite.Sprite):
 
         # Behavior priority system:
         # 1. Flee from threats
-        # 2. Seek water if thirsty
-        # 3. Eat plants if hungry (except carnivores)
-        # 4. Default wandering
+        # 2. Follow the herd's move order (unless hunger or thirst is critical)
+        # 3. Seek water if thirsty
+        # 4. Eat plants if hungry (except carnivores)
+        # 5. Default wandering
         
         if self.fleeing:
             self.flee_timer += dt
             if self.flee_timer >= self.flee_duration:
                 self.fleeing = False
             self.move(dt, animals)
+        elif self.herd is not None and self.herd.destination is not None and not self._needs_critical():
+            self._follow_herd_order()
+            self.move(dt, self.herd.outsiders())
         elif self._should_seek_water():
             self._seek_water(dt)
             self.move(dt, animals)
@@ -835,19 +912,12 @@ class Animal(pygame.sprite.Sprite):
         # Animation updates - properly handle idle states
         if self.idle or self.direction.length_squared() == 0 or self.is_drinking:
             # Use idle animation if available
-            base_status = self.status.split('_')[0]  # Get base direction
-            idle_status = f"{base_status}_idle"
-            
-            # Default to first frame if no idle animation exists
-            if idle_status not in self.animations:
-                idle_status = base_status
-                
-            frames = self.animations.get(idle_status, [])
+            frames = self._frames(IDLE)
             if frames:
                 self.image = frames[int(self.frame_index) % len(frames)]
         else:
             # Regular movement animation
-            frames = self.animations.get(self.status, [])
+            frames = self._frames(WALK)
             if frames:
                 frame_interval = max(0.05, 0.25 * (50 / max(10, self.speed)))
                 self.frame_timer += dt
@@ -871,6 +941,9 @@ class Animal(pygame.sprite.Sprite):
 # ... (keep all your existing imports and constants) ...
 
 class Predator(Animal):
+    HERDS = False
+    __slots__ = ("target_prey", "hunting_cooldown", "hunt_fail_timer")
+
     def __init__(
         self,
         name,
@@ -887,11 +960,14 @@ class Predator(Animal):
         group_type: str | None = None,
         gender: Literal["male", "female"] | None = None,
         mother: Animal | None = None,
+        variant: str | None = None,
+        rng: WorldRNG | None = None,
     ):
         super().__init__(
             name, species, age, pos, group, map_rect, price,
             speed=speed, scale=scale, body_shape=body_shape,
             group_type=group_type, gender=gender, mother=mother,
+            variant=variant, rng=rng,
         )
         self.target_prey: Animal | None = None
         self.hunting_cooldown = 0.0
@@ -904,7 +980,7 @@ class Predator(Animal):
         if self.hunger_level < 40 or self.thirst_level < 30:
             return True
         # Less aggressive hunting when moderately hungry
-        if self.hunger_level < 70 and random.random() < 0.3:  # 30% chance to hunt
+        if self.hunger_level < 70 and self.rng.combat.random() < 0.3:  # 30% chance to hunt
             return True
         return False
 
@@ -916,26 +992,21 @@ class Predator(Animal):
         if self.hunting_cooldown > 0:
             return False
 
-        prey_types = {
-            "carnivore": ("herbivore", "omnivore"),
-            "omnivore": ("herbivore",)
-        }[self.type]
-        
-        closest, dmin = None, float("inf")
-        for other in animals:
-            if (other is self or not other.is_alive or 
-                getattr(other, "type", None) not in prey_types):
-                continue
-                
-            # carnivores avoid healthy bears
-            if (self.type == "carnivore" and other.type == "omnivore" and
-                "bear" in other.species.lower() and other.health >= 50):
-                continue
-                
-            d = self.pos.distance_to(other.pos)
-            if d < Animal.DETECTION_RADIUS * 1.5 and d < dmin:  # Increased detection range
-                closest, dmin = other, d
-                
+        if self.proximity is not None:
+            closest = self.proximity.sighting(self).prey
+        else:
+            # Not on a map (tests, tools): plain scan of the list we were given
+            prey_types = PREY[self.type]
+            closest, dmin = None, PREY_DETECTION_RADIUS
+            for other in animals:
+                if (other is self or not other.is_alive or
+                        getattr(other, "type", None) not in prey_types or
+                        not is_valid_prey(self, other)):
+                    continue
+                d = self.pos.distance_to(other.pos)
+                if d < dmin:
+                    closest, dmin = other, d
+
         if closest:
             self.target_prey = closest
             self.hunt_fail_timer = 0.0
@@ -960,7 +1031,7 @@ class Predator(Animal):
             
         if vec.length_squared() > 0:
             self.direction = vec.normalize()
-            self.status = self._label_from_vector(self.direction)
+            self.status = self._facing_from_vector(self.direction)
             self.idle = False
             self.fleeing = False
             
@@ -980,7 +1051,7 @@ class Predator(Animal):
                 
         # Check for successful attack
         if self.rect.colliderect(prey.rect):
-            prey.health -= 15 + random.randint(0, 10)  # Variable damage
+            prey.health -= 15 + self.rng.combat.randint(0, 10)  # Variable damage
             print(f"[HUNT] {self.name} attacked {prey.name} ({prey.health} HP left)")
             
             if prey.health <= 0:
@@ -1061,13 +1132,11 @@ class Predator(Animal):
 
         # Animation updates
         if self.idle or self.direction.length_squared() == 0:
-            base_status = self.status.split('_')[0] if '_' in self.status else self.status
-            idle_status = f"{base_status}_idle"
-            frames = self.animations.get(idle_status, self.animations.get(base_status, []))
+            frames = self._frames(IDLE)
             if frames:
                 self.image = frames[int(self.frame_index) % len(frames)]
         else:
-            frames = self.animations.get(self.status, [])
+            frames = self._frames(WALK)
             if frames:
                 # Faster animation when hunting
                 frame_interval = max(0.05, 0.2 * (50 / max(10, self.speed)))  
@@ -1079,6 +1148,8 @@ class Predator(Animal):
 
 
 class Carnivore(Predator):
+    __slots__ = ()
+
     @property
     def type(self):
         return "carnivore"
@@ -1089,6 +1160,8 @@ class Carnivore(Predator):
 
 
 class Omnivore(Predator):
+    __slots__ = ()
+
     @property
     def type(self):
         return "omnivore"
@@ -1103,7 +1176,7 @@ class Omnivore(Predator):
         """Omnivores hunt when very hungry or when prey is easy."""
         if self.hunger_level < 40:
             return True
-        if self.hunger_level < 70 and random.random() < 0.2:  # 20% chance to hunt
+        if self.hunger_level < 70 and self.rng.combat.random() < 0.2:  # 20% chance to hunt
             return True
         return False
 
@@ -1173,13 +1246,11 @@ class Omnivore(Predator):
 
         # Animation updates
         if self.idle or self.direction.length_squared() == 0:
-            base_status = self.status.split('_')[0] if '_' in self.status else self.status
-            idle_status = f"{base_status}_idle"
-            frames = self.animations.get(idle_status, self.animations.get(base_status, []))
+            frames = self._frames(IDLE)
             if frames:
                 self.image = frames[int(self.frame_index) % len(frames)]
         else:
-            frames = self.animations.get(self.status, [])
+            frames = self._frames(WALK)
             if frames:
                 frame_interval = max(0.05, 0.25 * (50 / max(10, self.speed)))
                 self.frame_timer += dt
@@ -1192,6 +1263,8 @@ class Omnivore(Predator):
                 
 
 class Herbivore(Animal):
+    __slots__ = ()
+
     @property
     def type(self):
         return "herbivore"
\ No newline at end of file
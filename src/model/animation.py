@@ -0,0 +1,73 @@
+# ──────────────────────────────────────────────────────────────────────────────
+#  animation.py – interned animation states shared by characters and animals
+# ──────────────────────────────────────────────────────────────────────────────
+#  A state is the triple (action, weapon, direction) packed into one small int.
+#  Frame lists live in flat tables indexed by that int, so resolving the
+#  current animation each frame needs no string formatting and no allocation.
+# ──────────────────────────────────────────────────────────────────────────────
+from src.utils.support import import_folder
+
+# --------------------------------------------------------------------------- #
+#  Ids                                                                        #
+# --------------------------------------------------------------------------- #
+IDLE, WALK, SHOOTING, SPEAR_ATTACK, DEATH, DEATH_GUN, DEATH_SPEAR = range(7)
+N_ACTIONS = 7
+
+NORMAL, GUN, SPEAR = range(3)          # same order as Ranger.WEAPON_TYPES
+N_WEAPONS = 3
+
+UP, DOWN, LEFT, RIGHT, UP_LEFT, UP_RIGHT, DOWN_LEFT, DOWN_RIGHT = range(8)
+N_DIRECTIONS = 8
+DIRECTION_NAMES = ("up", "down", "left", "right", "up_left", "up_right", "down_left", "down_right")
+
+ATTACK_ACTIONS = frozenset((SHOOTING, SPEAR_ATTACK))
+DEATH_ACTIONS = {"death": DEATH, "death_Gun": DEATH_GUN, "death_Spear": DEATH_SPEAR}
+
+
+def state_id(action: int, weapon: int, direction: int) -> int:
+    return (action * N_WEAPONS + weapon) * N_DIRECTIONS + direction
+
+
+# --------------------------------------------------------------------------- #
+#  Direction quantisation                                                     #
+# --------------------------------------------------------------------------- #
+#  A vector is snapped to (-1|0|1, -1|0|1) the same way int(round(v)) does for
+#  unit vectors, then looked up in a 3x3 table: index = (sx + 1) * 3 + (sy + 1).
+_COMPASS = (
+    UP_LEFT,   LEFT,  DOWN_LEFT,    # sx = -1, sy = -1 / 0 / 1
+    UP,        DOWN,  DOWN,         # sx =  0  (no movement faces down)
+    UP_RIGHT,  RIGHT, DOWN_RIGHT,   # sx =  1
+)
+
+
+def quantise(x: float, y: float) -> int:
+    """Return the 8-way direction id of the vector (x, y)."""
+    sx = 0 if -0.5 <= x <= 0.5 else (1 if x > 0 else -1)
+    sy = 0 if -0.5 <= y <= 0.5 else (1 if y > 0 else -1)
+    return _COMPASS[(sx + 1) * 3 + (sy + 1)]
+
+
+def remap(mapping: dict[int, int]) -> tuple[int, ...]:
+    """Build a direction -> sheet direction table (identity for missing keys)."""
+    return tuple(mapping.get(d, d) for d in range(N_DIRECTIONS))
+
+
+# Per-sheet direction tables (which drawn direction a compass direction uses)
+FOUR_WAY = remap({UP_LEFT: UP, UP_RIGHT: UP, DOWN_LEFT: DOWN, DOWN_RIGHT: DOWN})
+NO_SIDEWAYS = remap({LEFT: DOWN_LEFT, RIGHT: DOWN_RIGHT})
+
+
+# --------------------------------------------------------------------------- #
+#  Frame tables                                                               #
+# --------------------------------------------------------------------------- #
+class FrameTable:
+    """Flat list of frame lists indexed by state id, loaded once and shared."""
+
+    def __init__(self):
+        self.frames: list[list] = [[] for _ in range(N_ACTIONS * N_WEAPONS * N_DIRECTIONS)]
+
+    def load(self, action: int, weapon: int, direction: int, path: str) -> None:
+        self.frames[state_id(action, weapon, direction)] = import_folder(path)
+
+    def __getitem__(self, state: int) -> list:
+        return self.frames[state]
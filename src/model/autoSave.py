@@ -0,0 +1,121 @@
+# ──────────────────────────────────────────────────────────────────────────────
+#  autoSave.py – background autosave into rotating slots
+# ──────────────────────────────────────────────────────────────────────────────
+#  The game loop only captures a ParkSnapshot (plain immutable tuples), and
+#  spreads even that over several ticks with a SnapshotCapture, so no tick
+#  copies more than CAPTURE_CHUNK animals. Encoding, zlib compression and the
+#  disk write happen on a worker thread, and every file is written to a temp
+#  name first, then os.replace()d into its slot, so a crash mid-write never
+#  leaves a half-written autosave behind.
+# ──────────────────────────────────────────────────────────────────────────────
+import glob
+import os
+import queue
+import threading
+import zlib
+
+from src.model.saveGame import SAVE_DIR, SnapshotCapture, encode_snapshot
+
+AUTOSAVE_SLOTS = 3
+AUTOSAVE_COMPRESSION = 1      # zlib level: fast, still shrinks saves ~3x
+
+
+def autosave_path(slot: int, directory: str = SAVE_DIR) -> str:
+    return os.path.join(directory, f"autosave_{slot}.sav")
+
+
+def latest_autosave(directory: str = SAVE_DIR) -> str | None:
+    """Return the most recently written autosave slot, if any."""
+    slots = glob.glob(os.path.join(directory, "autosave_*.sav"))
+    return max(slots, key=os.path.getmtime) if slots else None
+
+
+def oldest_slot(directory: str = SAVE_DIR, slots: int = AUTOSAVE_SLOTS) -> int:
+    """The slot to write next: the first empty one, else the least recently written."""
+    paths = [autosave_path(slot, directory) for slot in range(slots)]
+    for slot, path in enumerate(paths):
+        if not os.path.exists(path):
+            return slot
+    return min(range(slots), key=lambda slot: os.path.getmtime(paths[slot]))
+
+
+class AutoSave:
+    """
+    - request(map) starts a capture; update(), called every tick, copies the
+      next chunk and queues the snapshot once it is complete.
+    - A single daemon worker encodes, compresses and writes it atomically.
+    - At most one snapshot waits in the queue; if the worker is still busy
+      with an older one, the newer snapshot replaces the waiting one.
+    - A new session continues the rotation from the oldest slot on disk.
+    """
+
+    def __init__(self, directory: str = SAVE_DIR, slots: int = AUTOSAVE_SLOTS, enabled: bool = True):
+        self.directory = directory
+        self.slots = slots
+        self.enabled = enabled  # headless tools (replay, balance sweep) turn this off
+        self.next_slot = oldest_slot(directory, slots)
+        self.last_path: str | None = None
+        self.last_error: Exception | None = None
+
+        self._capture: SnapshotCapture | None = None
+        self._pending: queue.Queue = queue.Queue(maxsize=1)
+        self._worker: threading.Thread | None = None   # started on the first request
+
+    # ──────────────────────────────────────────────────────────────────────────
+    # Game-loop side
+    # ──────────────────────────────────────────────────────────────────────────
+    def request(self, game_map) -> None:
+        if not self.enabled:
+            return
+        if self._worker is None:
+            self._worker = threading.Thread(target=self._run, name="autosave", daemon=True)
+            self._worker.start()
+        if self._capture is None:           # a capture already running covers this request
+            self._capture = SnapshotCapture(game_map)
+
+    def update(self) -> None:
+        """Advance a running capture by one chunk; queue the snapshot when it is complete."""
+        if self._capture is None:
+            return
+        snapshot = self._capture.step()
+        if snapshot is None:
+            return
+        self._capture = None
+        try:
+            self._pending.get_nowait()      # drop a stale snapshot still waiting
+            self._pending.task_done()
+        except queue.Empty:
+            pass
+        self._pending.put_nowait(snapshot)
+
+    def flush(self) -> None:
+        """Finish a running capture, then block until every queued snapshot has been written."""
+        while self._capture is not None:
+            self.update()
+        self._pending.join()
+
+    # ──────────────────────────────────────────────────────────────────────────
+    # Worker side
+    # ──────────────────────────────────────────────────────────────────────────
+    def _run(self) -> None:
+        while True:
+            snapshot = self._pending.get()
+            try:
+                self._write(zlib.compress(encode_snapshot(snapshot), AUTOSAVE_COMPRESSION))
+            except Exception as e:          # keep the worker alive, or flush() would hang
+                self.last_error = e
+                print(f"[AUTOSAVE] failed: {e!r}")
+            finally:
+                self._pending.task_done()
+
+    def _write(self, data: bytes) -> None:
+        os.makedirs(self.directory, exist_ok=True)
+        path = autosave_path(self.next_slot, self.directory)
+        tmp = f"{path}.tmp"
+        with open(tmp, "wb") as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, path)
+        self.last_path = path
+        self.next_slot = (self.next_slot + 1) % self.slots
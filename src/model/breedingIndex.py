@@ -0,0 +1,76 @@
+# ──────────────────────────────────────────────────────────────────────────────
+#  breedingIndex.py – mate lookup by (group_type, gender) and spatial bucket
+# ──────────────────────────────────────────────────────────────────────────────
+#  Females looking for a mate ask find_mate() instead of scanning every animal.
+#  Males of each group_type are bucketed into square cells one interaction
+#  radius wide, so a query only looks at the 3x3 cells around the female.
+#
+#  - Membership follows the EntityRegistry: add() on spawn / birth, remove()
+#    on sale or death.
+#  - Buckets are rebuilt lazily, at most once per tick and only for group
+#    types that a female actually searched in that tick (begin_tick()).
+# ──────────────────────────────────────────────────────────────────────────────
+from src.model.entityList import EntityList
+
+
+class BreedingIndex:
+    def __init__(self, radius: float):
+        self.radius = radius
+        self.members: dict[tuple[str, str], EntityList] = {}     # (group_type, gender) -> animals
+        self._buckets: dict[str, dict[tuple[int, int], list]] = {}
+        self._bucket_tick: dict[str, int] = {}
+        self.tick = 0
+
+    def add(self, animal) -> None:
+        key = (animal.group_type, animal.gender)
+        members = self.members.get(key)
+        if members is None:
+            members = self.members[key] = EntityList()
+        members.append(animal)
+        animal.breeding_index = self
+        if animal.gender == "male":
+            self._bucket_tick.pop(animal.group_type, None)  # findable before the next tick
+
+    def remove(self, animal) -> None:
+        members = self.members.get((animal.group_type, animal.gender))
+        if members is not None:
+            members.discard(animal)
+        animal.breeding_index = None
+
+    def clear(self) -> None:
+        for members in self.members.values():
+            for a in members:
+                a.breeding_index = None
+        self.members.clear()
+        self._buckets.clear()
+        self._bucket_tick.clear()
+
+    def begin_tick(self) -> None:
+        """Animals have moved: buckets are rebuilt on their next query."""
+        self.tick += 1
+
+    def _male_buckets(self, group_type: str) -> dict[tuple[int, int], list]:
+        if self._bucket_tick.get(group_type) == self.tick:
+            return self._buckets[group_type]
+        size = self.radius
+        buckets: dict[tuple[int, int], list] = {}
+        for m in self.members.get((group_type, "male"), ()):
+            buckets.setdefault((int(m.pos.x // size), int(m.pos.y // size)), []).append(m)
+        self._buckets[group_type] = buckets
+        self._bucket_tick[group_type] = self.tick
+        return buckets
+
+    def find_mate(self, female):
+        """Nearest-bucket-first male of the same group_type within the radius, or None."""
+        if not self.members.get((female.group_type, "male")):
+            return None
+        buckets = self._male_buckets(female.group_type)
+        size = self.radius
+        limit = size * size
+        cx, cy = int(female.pos.x // size), int(female.pos.y // size)
+        for dx in (0, -1, 1):
+            for dy in (0, -1, 1):
+                for m in buckets.get((cx + dx, cy + dy), ()):
+                    if m.is_alive and m is not female and female.pos.distance_squared_to(m.pos) <= limit:
+                        return m
+        return None
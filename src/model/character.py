@@ -4,7 +4,18 @@ from src.config.settings import *
 
 CHARACTER_DETECTION_RADIUS = 180
 
+# Patrol walk: eight compass steps, shared by every character
+PATROL_PATTERN = (
+    (0, 1), (1, 1), (1, 0), (1, -1), (0, -1), (-1, -1), (-1, 0), (-1, 1)
+)
+
 class Character(pygame.sprite.Sprite):
+    __slots__ = (
+        "frame_index", "direction", "last_direction", "pos", "speed", "map_rect", "z",
+        "current_step", "step_timer", "step_duration", "idle_phase",
+        "max_health", "health", "image", "rect", "animations", "action", "status",
+    )
+
     def __init__(self, pos, group, map_rect):
         super().__init__(group)
         self.frame_index = 0
@@ -15,11 +26,6 @@ class Character(pygame.sprite.Sprite):
         self.map_rect = map_rect
         self.z = LAYERS['main']
 
-        self.pattern = [
-            pygame.Vector2(0, 1), pygame.Vector2(1, 1), pygame.Vector2(1, 0),
-            pygame.Vector2(1, -1), pygame.Vector2(0, -1), pygame.Vector2(-1, -1),
-            pygame.Vector2(-1, 0), pygame.Vector2(-1, 1)
-        ]
         self.current_step = 0
         self.step_timer = 0
         self.step_duration = 1.2
@@ -43,9 +49,9 @@ class Character(pygame.sprite.Sprite):
             self.step_timer = 0
             self.idle_phase = not self.idle_phase
             if not self.idle_phase:
-                self.current_step = (self.current_step + 1) % len(self.pattern)
+                self.current_step = (self.current_step + 1) % len(PATROL_PATTERN)
         if not self.idle_phase:
-            self.direction = self.pattern[self.current_step]
+            self.direction = pygame.Vector2(PATROL_PATTERN[self.current_step])
 
 
     #############################################################################################
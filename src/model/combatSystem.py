@@ -0,0 +1,102 @@
+# ──────────────────────────────────────────────────────────────────────────────
+#  combatSystem.py – ranger / poacher / animal proximity, resolved once per tick
+# ──────────────────────────────────────────────────────────────────────────────
+#  Map.step() calls CombatSystem.update() once, before rangers and poachers
+#  move. It buckets rangers and animals into cells one detection radius wide,
+#  then walks every poacher once, collecting the (ranger, poacher) and
+#  (poacher, animal) pairs that are in range. From those pairs each entity
+#  gets a view:
+#
+#      RangerView   nearest poacher to chase, poachers in gun / spear range
+#      PoacherView  nearest ranger to flee from, nearest animal to hunt
+#
+#  Ranger.update() and Poacher.update() read their view instead of looping
+#  over every poacher, ranger or animal, so the tick costs O(R + P + A) plus
+#  the pairs actually in range instead of R×P + P×A.
+# ──────────────────────────────────────────────────────────────────────────────
+from src.model.rangers import RANGER_DETECTION_RADIUS, RANGER_SPEAR_RANGE
+from src.model.poacher import POACHER_DETECTION_RADIUS
+
+
+class RangerView:
+    __slots__ = ("target", "target_d2", "in_gun_range", "in_spear_range")
+
+    def __init__(self):
+        self.target = None                   # nearest poacher within detection radius
+        self.target_d2 = RANGER_DETECTION_RADIUS ** 2
+        self.in_gun_range: list = []
+        self.in_spear_range: list = []
+
+
+class PoacherView:
+    __slots__ = ("threat", "threat_d2", "prey", "prey_d2")
+
+    def __init__(self):
+        self.threat = None                   # nearest ranger within detection radius
+        self.threat_d2 = POACHER_DETECTION_RADIUS ** 2
+        self.prey = None                     # nearest living animal within detection radius
+        self.prey_d2 = POACHER_DETECTION_RADIUS ** 2
+
+
+_NO_RANGER_VIEW = RangerView()
+_NO_POACHER_VIEW = PoacherView()
+
+
+def _bucket(entities, size):
+    cells: dict[tuple[int, int], list] = {}
+    for e in entities:
+        cells.setdefault((int(e.pos.x // size), int(e.pos.y // size)), []).append(e)
+    return cells
+
+
+class CombatSystem:
+    def __init__(self):
+        self.cell = max(RANGER_DETECTION_RADIUS, POACHER_DETECTION_RADIUS)
+        self.ranger_views: dict = {}
+        self.poacher_views: dict = {}
+
+    def ranger_view(self, ranger) -> RangerView:
+        return self.ranger_views.get(ranger, _NO_RANGER_VIEW)
+
+    def poacher_view(self, poacher) -> PoacherView:
+        return self.poacher_views.get(poacher, _NO_POACHER_VIEW)
+
+    def update(self, rangers, poachers, animals) -> None:
+        size = self.cell
+        gun2 = RANGER_DETECTION_RADIUS ** 2
+        spear2 = RANGER_SPEAR_RANGE ** 2
+        flee2 = POACHER_DETECTION_RADIUS ** 2
+
+        ranger_views = self.ranger_views = {r: RangerView() for r in rangers}
+        poacher_views = self.poacher_views = {}
+        ranger_cells = _bucket(rangers, size)
+        animal_cells = _bucket((a for a in animals if a.is_alive), size)
+
+        for p in poachers:
+            if p.health <= 0 or p.dying:
+                continue
+            view = poacher_views[p] = PoacherView()
+            px, py = p.pos
+            cx, cy = int(px // size), int(py // size)
+            for dx in (-1, 0, 1):
+                for dy in (-1, 0, 1):
+                    cell = (cx + dx, cy + dy)
+
+                    # (ranger, poacher) pairs
+                    for r in ranger_cells.get(cell, ()):
+                        d2 = (r.pos.x - px) ** 2 + (r.pos.y - py) ** 2
+                        if d2 < gun2:
+                            rv = ranger_views[r]
+                            rv.in_gun_range.append(p)
+                            if d2 < spear2:
+                                rv.in_spear_range.append(p)
+                            if d2 < rv.target_d2:
+                                rv.target, rv.target_d2 = p, d2
+                        if r.health > 0 and d2 < flee2 and d2 < view.threat_d2:
+                            view.threat, view.threat_d2 = r, d2
+
+                    # (poacher, animal) pairs
+                    for a in animal_cells.get(cell, ()):
+                        d2 = (a.pos.x - px) ** 2 + (a.pos.y - py) ** 2
+                        if d2 < view.prey_d2:
+                            view.prey, view.prey_d2 = a, d2
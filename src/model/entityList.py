@@ -0,0 +1,68 @@
+# ──────────────────────────────────────────────────────────────────────────────
+#  entityList.py – packed entity list with O(1) membership and swap-remove
+# ──────────────────────────────────────────────────────────────────────────────
+#  Items live in a plain list plus an item → slot map, so membership, index()
+#  and remove() are O(1). remove() swaps the last item into the hole, which
+#  means the order is NOT stable across removals.
+# ──────────────────────────────────────────────────────────────────────────────
+
+
+class EntityList:
+    """Packed list with O(1) membership, index lookup and swap-remove."""
+
+    __slots__ = ("_items", "_slots")
+
+    def __init__(self, items=()):
+        self._items = []
+        self._slots = {}
+        for item in items:
+            self.append(item)
+
+    def append(self, item) -> None:
+        if item in self._slots:
+            return
+        self._slots[item] = len(self._items)
+        self._items.append(item)
+
+    def remove(self, item) -> None:
+        try:
+            slot = self._slots.pop(item)
+        except KeyError:
+            raise ValueError(f"{item!r} is not in the list") from None
+        last = self._items.pop()
+        if last is not item:
+            self._items[slot] = last
+            self._slots[last] = slot
+
+    def discard(self, item) -> None:
+        if item in self._slots:
+            self.remove(item)
+
+    def index(self, item) -> int:
+        try:
+            return self._slots[item]
+        except KeyError:
+            raise ValueError(f"{item!r} is not in the list") from None
+
+    def slots(self) -> dict:
+        """A copy of the item → index map, e.g. to resolve links in a snapshot."""
+        return dict(self._slots)
+
+    def clear(self) -> None:
+        self._items.clear()
+        self._slots.clear()
+
+    def __contains__(self, item) -> bool:
+        return item in self._slots
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __iter__(self):
+        return iter(self._items)
+
+    def __getitem__(self, index):
+        return self._items[index]
+
+    def __repr__(self) -> str:
+        return f"EntityList({self._items!r})"
@@ -0,0 +1,141 @@
+# ──────────────────────────────────────────────────────────────────────────────
+#  entityRegistry.py – dense per-type entity collections for the simulation
+# ──────────────────────────────────────────────────────────────────────────────
+#  Map.step() runs one straight pass per entity type over these collections
+#  instead of walking every sprite (terrain included) and dispatching on type.
+#
+#  - Every collection is an EntityList (O(1) membership and swap-remove).
+#  - Entities that die during an update pass are queued with despawn() and
+#    only removed by flush() once the pass is over, so the lists never change
+#    under a running loop.
+# ──────────────────────────────────────────────────────────────────────────────
+from collections import Counter
+
+from src.model.animals import (
+    Animal, Herbivore, Carnivore, Omnivore, INTERACTION_RADIUS, PREY_DETECTION_RADIUS,
+)
+from src.model.poacher import Poacher
+from src.model.entityList import EntityList
+from src.model.herd import HerdManager
+from src.model.breedingIndex import BreedingIndex
+from src.model.proximityService import ProximityService
+from src.model.combatSystem import CombatSystem
+from src.model.pathfinder import Navigator
+
+
+class EntityRegistry:
+    """
+    - animals holds every animal; herbivores / carnivores / omnivores hold the
+      same objects split by class.
+    - corpses holds poachers playing their death animation: they are no longer
+      targets, but still need updating until they remove themselves.
+    - ponds holds the animated water sprites placed from the store.
+    - species counts the living animals of each group_type, herding or not.
+    - herds groups the herding animals by group_type (see herd.py).
+    - breeding indexes animals by (group_type, gender) for mate lookup.
+    - proximity buckets the diet lists for prey and threat queries.
+    - combat pairs rangers, poachers and animals once per tick.
+    - pathfinder is the map's Pathfinder (set by the Map once the world is
+      built); rangers and animals added afterwards get a Navigator on it.
+    """
+
+    def __init__(self):
+        self.animals    = EntityList()
+        self.herbivores = EntityList()
+        self.carnivores = EntityList()
+        self.omnivores  = EntityList()
+        self.rangers    = EntityList()
+        self.poachers   = EntityList()
+        self.corpses    = EntityList()
+        self.jeeps      = EntityList()
+        self.ponds      = EntityList()
+        self.species    = Counter()
+        self.herds      = HerdManager(self.animals)
+        self.breeding   = BreedingIndex(INTERACTION_RADIUS)
+        self.proximity  = ProximityService(
+            {"herbivore": self.herbivores, "carnivore": self.carnivores, "omnivore": self.omnivores},
+            prey_radius=PREY_DETECTION_RADIUS, threat_margin=Animal.DETECTION_RADIUS,
+        )
+        self.combat     = CombatSystem()
+        self.pathfinder = None
+
+        self._despawn_queue: list = []
+
+    def _diet_list(self, animal: Animal) -> EntityList | None:
+        if isinstance(animal, Herbivore):
+            return self.herbivores
+        if isinstance(animal, Carnivore):
+            return self.carnivores
+        if isinstance(animal, Omnivore):
+            return self.omnivores
+        return None
+
+    # ──────────────────────────────────────────────────────────────────────────
+    # Adding
+    # ──────────────────────────────────────────────────────────────────────────
+    def add_animal(self, animal: Animal) -> None:
+        self.animals.append(animal)
+        self.classify(animal)
+
+    def add_ranger(self, ranger) -> None:
+        self.rangers.append(ranger)
+        ranger.navigator = self._navigator()
+
+    def _navigator(self) -> Navigator | None:
+        return Navigator(self.pathfinder) if self.pathfinder is not None else None
+
+    def classify(self, animal: Animal) -> None:
+        """File an animal already in `animals` (e.g. a newborn) under its diet."""
+        diet = self._diet_list(animal)
+        if diet is not None:
+            diet.append(animal)
+            animal.proximity = self.proximity
+        animal.navigator = self._navigator()
+        self.species[animal.group_type] += 1
+        self.herds.join(animal)
+        self.breeding.add(animal)
+
+    # ──────────────────────────────────────────────────────────────────────────
+    # Removing
+    # ──────────────────────────────────────────────────────────────────────────
+    def remove_animal(self, animal: Animal) -> None:
+        if animal not in self.animals:
+            return
+        self.animals.remove(animal)
+        diet = self._diet_list(animal)
+        if diet is not None:
+            diet.discard(animal)
+        animal.proximity = None
+        animal.navigator = None
+        self.species[animal.group_type] -= 1
+        if not self.species[animal.group_type]:
+            del self.species[animal.group_type]
+        self.herds.leave(animal)
+        self.breeding.remove(animal)
+
+    def remove_poacher(self, poacher: Poacher) -> None:
+        """Stop targeting `poacher`; keep updating it while its death plays out."""
+        self.poachers.discard(poacher)
+        if poacher.alive():
+            self.corpses.append(poacher)
+
+    def despawn(self, entity) -> None:
+        """Queue `entity` for removal at the next flush()."""
+        self._despawn_queue.append(entity)
+
+    def flush(self) -> None:
+        for entity in self._despawn_queue:
+            if isinstance(entity, Animal):
+                self.remove_animal(entity)
+            elif isinstance(entity, Poacher):
+                self.remove_poacher(entity)
+        self._despawn_queue.clear()
+
+    def clear_animals(self) -> None:
+        self.animals.clear()
+        self.herbivores.clear()
+        self.carnivores.clear()
+        self.omnivores.clear()
+        self.species.clear()
+        self.herds.clear()
+        self.breeding.clear()
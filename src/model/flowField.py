@@ -0,0 +1,101 @@
+# ──────────────────────────────────────────────────────────────────────────────
+#  flowField.py – one shared movement field per destination
+# ──────────────────────────────────────────────────────────────────────────────
+#  Group move orders (several rangers, a whole herd) use a flow field instead
+#  of one A* search per agent. A FlowField holds, for the tile grid of the
+#  Pathfinder:
+#
+#      cost   Dijkstra distance to the goal cell, in tiles (integration field)
+#      next   per cell, the neighbour one step closer to the goal (vector field)
+#
+#  Building a field costs one pass over the grid. After that, any number of
+#  agents sample it in O(1) with direction_at(). FlowFields keeps the most
+#  recently used fields per goal cell and drops them all when the
+#  Pathfinder's grid changes.
+# ──────────────────────────────────────────────────────────────────────────────
+import heapq
+
+from pygame.math import Vector2
+
+from src.config.settings import TILE_SIZE
+from src.model.pathfinder import Pathfinder, NEIGHBOURS
+
+FLOW_CACHE_SIZE = 16            # Fields kept (least recently used dropped first)
+FLOW_ARRIVE_COST = 1.5          # Tiles from the goal at which a group order is done
+
+_NO_STEP = 255
+_INF = float("inf")
+
+
+class FlowField:
+    __slots__ = ("pathfinder", "goal", "cost", "next")
+
+    def __init__(self, pathfinder: Pathfinder, goal: tuple[int, int]):
+        self.pathfinder = pathfinder
+        self.goal = goal
+        cols, rows = pathfinder.cols, pathfinder.rows
+        self.cost = [_INF] * (cols * rows)
+        self.next = bytearray([_NO_STEP]) * (cols * rows)
+        self._integrate()
+
+    def _integrate(self) -> None:
+        pf, cols, cost = self.pathfinder, self.pathfinder.cols, self.cost
+        walkable = pf.walkable
+        gx, gy = self.goal
+        cost[gy * cols + gx] = 0.0
+        open_ = [(0.0, self.goal)]
+        while open_:
+            c, (x, y) = heapq.heappop(open_)
+            if c > cost[y * cols + x]:
+                continue
+            for i, (dx, dy, step) in enumerate(NEIGHBOURS):
+                nx, ny = x + dx, y + dy
+                if not walkable((nx, ny)):
+                    continue
+                # Same corner rule as the A* search
+                if dx and dy and not (walkable((nx, y)) and walkable((x, ny))):
+                    continue
+                nc = c + step
+                j = ny * cols + nx
+                if nc < cost[j]:
+                    cost[j] = nc
+                    self.next[j] = i ^ 1 if i < 4 else 11 - i    # the reverse move
+                    heapq.heappush(open_, (nc, (nx, ny)))
+
+    def cost_at(self, pos) -> float:
+        """Tiles to walk from `pos` to the goal (inf if unreachable)."""
+        x, y = self.pathfinder.cell_of(pos)
+        return self.cost[y * self.pathfinder.cols + x]
+
+    def direction_at(self, pos: Vector2) -> Vector2 | None:
+        """Unit vector towards the next cell on the way, or None at the goal / if cut off."""
+        x, y = self.pathfinder.cell_of(pos)
+        i = self.next[y * self.pathfinder.cols + x]
+        if i == _NO_STEP:
+            return None
+        dx, dy, _ = NEIGHBOURS[i]
+        v = Vector2((x + dx + 0.5) * TILE_SIZE, (y + dy + 0.5) * TILE_SIZE) - pos
+        return v.normalize() if v.length_squared() else None
+
+
+class FlowFields:
+    """LRU cache of FlowField by goal cell, tied to one Pathfinder's grid."""
+
+    def __init__(self, pathfinder: Pathfinder, size: int = FLOW_CACHE_SIZE):
+        self.pathfinder = pathfinder
+        self.size = size
+        self._fields: dict[tuple[int, int], FlowField] = {}
+        self._version = pathfinder.version
+
+    def get(self, goal_pos) -> FlowField:
+        if self._version != self.pathfinder.version:
+            self._fields.clear()                    # grid edited: every field is stale
+            self._version = self.pathfinder.version
+        goal = self.pathfinder.cell_of(goal_pos)
+        field = self._fields.pop(goal, None)
+        if field is None:
+            field = FlowField(self.pathfinder, goal)
+            if len(self._fields) >= self.size:
+                del self._fields[next(iter(self._fields))]
+        self._fields[goal] = field                  # young end
+        return field
@@ -0,0 +1,185 @@
+# ──────────────────────────────────────────────────────────────────────────────
+#  herd.py – herds as shared objects, one per group_type
+# ──────────────────────────────────────────────────────────────────────────────
+#  A Herd owns its members, a leader, and the per-tick steering data the
+#  followers read: the centroid and each member's separation push. That data
+#  is computed once per herd per tick in Herd.update(), not per follower.
+#
+#  Membership only changes through HerdManager.join() / leave(), which the
+#  EntityRegistry calls when animals are added, removed or die. The outsider
+#  list (every animal not in the herd, used for follower collisions) is
+#  cached and only rebuilt after such a change.
+#
+#  A herd sent somewhere holds the FlowField of that destination; every
+#  member walks it (see Animal._follow_herd_order) until the centroid
+#  arrives. The order is dropped if the members' mean distance to the goal
+#  has not shrunk for HERD_ORDER_STALL seconds, or after HERD_ORDER_TIMEOUT.
+# ──────────────────────────────────────────────────────────────────────────────
+from pygame.math import Vector2
+
+from src.model.entityList import EntityList
+from src.model.flowField import FLOW_ARRIVE_COST
+
+HERD_STUCK_TIME = 1.5           # Seconds before a stuck leader hands over
+HERD_SEPARATION_DIST = 24       # Members closer than this push apart
+HERD_COHESION_WEIGHT = 0.35     # Pull towards the herd centroid (vs. 1.0 towards the leader)
+HERD_SEPARATION_WEIGHT = 1.5
+HERD_ORDER_STALL = 10.0         # Seconds without getting closer before a move order is dropped
+HERD_ORDER_TIMEOUT = 180.0      # Longest a move order is followed
+
+# The cell itself plus the four neighbours "after" it: every adjacent pair of
+# cells is visited exactly once
+_HALF_NEIGHBOURHOOD = ((0, 0), (1, -1), (1, 0), (1, 1), (0, 1))
+
+
+class Herd:
+    __slots__ = ("group_type", "manager", "members", "leader", "centroid", "separation",
+                 "destination", "order_best", "order_stall", "order_age",
+                 "_outsiders", "_outsiders_version")
+
+    def __init__(self, group_type: str, manager: "HerdManager"):
+        self.group_type = group_type
+        self.manager = manager
+        self.members = EntityList()
+        self.leader = None
+        self.centroid = Vector2()
+        self.separation: dict = {}          # member -> push away from crowded mates
+        self.destination = None             # FlowField of a move order, None when free
+        self.order_best = float("inf")      # lowest mean member cost seen on this order
+        self.order_stall = 0.0              # seconds since order_best last improved
+        self.order_age = 0.0
+        self._outsiders: list = []
+        self._outsiders_version = -1
+
+    def elect_leader(self) -> None:
+        """First member (in herd order) that is neither stuck nor fleeing."""
+        for a in self.members:
+            if a._stuck <= HERD_STUCK_TIME and not a.fleeing:
+                self.leader = a
+                return
+        self.leader = self.members[0] if self.members else None
+
+    def order(self, field) -> None:
+        """Send the herd along `field` (a FlowField), or free it with None."""
+        self.destination = field
+        self.order_best = float("inf")
+        self.order_stall = self.order_age = 0.0
+
+    def outsiders(self) -> list:
+        """Animals of other group types; rebuilt only after membership changes."""
+        version = self.manager.version
+        if self._outsiders_version != version:
+            self._outsiders = [a for a in self.manager.animals if a.group_type != self.group_type]
+            self._outsiders_version = version
+        return self._outsiders
+
+    def update(self, dt: float) -> None:
+        leader = self.leader
+        if leader is None or leader._stuck > HERD_STUCK_TIME or leader.fleeing:
+            self.elect_leader()
+
+        members = self.members
+        n = len(members)
+        cx = cy = 0.0
+        for a in members:
+            cx += a.pos.x
+            cy += a.pos.y
+        self.centroid.update(cx / n, cy / n)
+        if self.destination is not None:
+            self._check_order(dt)
+
+        # Separation: bucket members into cells one separation distance wide, so
+        # each member only checks the 3x3 cells around it (each pair once)
+        push = self.separation
+        push.clear()
+        size = HERD_SEPARATION_DIST
+        limit = size * size
+        cells: dict[tuple[int, int], list] = {}
+        for a in members:
+            cells.setdefault((int(a.pos.x // size), int(a.pos.y // size)), []).append(a)
+
+        for (cx, cy), cell in cells.items():
+            for nx, ny in _HALF_NEIGHBOURHOOD:
+                other = cell if (nx, ny) == (0, 0) else cells.get((cx + nx, cy + ny))
+                if other is None:
+                    continue
+                for i, a in enumerate(cell):
+                    for b in (other[i + 1:] if other is cell else other):
+                        dx = a.pos.x - b.pos.x
+                        dy = a.pos.y - b.pos.y
+                        d2 = dx * dx + dy * dy
+                        if 0 < d2 < limit:
+                            # Stronger the closer they are (1/d falloff on a unit vector)
+                            fx, fy = dx / d2, dy / d2
+                            pa = push.get(a)
+                            if pa is None:
+                                pa = push[a] = Vector2()
+                            pb = push.get(b)
+                            if pb is None:
+                                pb = push[b] = Vector2()
+                            pa.x += fx; pa.y += fy
+                            pb.x -= fx; pb.y -= fy
+
+
+    def _check_order(self, dt: float) -> None:
+        field = self.destination
+        if field.cost_at(self.centroid) <= FLOW_ARRIVE_COST:
+            self.order(None)
+            return
+        costs = [c for c in map(field.cost_at, (a.pos for a in self.members)) if c != float("inf")]
+        mean = sum(costs) / len(costs) if costs else float("inf")
+        if mean < self.order_best - 0.1:
+            self.order_best = mean
+            self.order_stall = 0.0
+        else:
+            self.order_stall += dt
+        self.order_age += dt
+        if self.order_stall > HERD_ORDER_STALL or self.order_age > HERD_ORDER_TIMEOUT:
+            print(f"[HERD] {self.group_type} gave up on its move order")
+            self.order(None)
+
+
+class HerdManager:
+    """Herds keyed by group_type; `animals` is the registry's full animal list."""
+
+    def __init__(self, animals: EntityList):
+        self.animals = animals
+        self.herds: dict[str, Herd] = {}
+        self.version = 0                    # bumped whenever any animal comes or goes
+
+    def join(self, animal) -> None:
+        self.version += 1
+        if not animal.HERDS:
+            animal.herd = None
+            return
+        herd = self.herds.get(animal.group_type)
+        if herd is None:
+            herd = self.herds[animal.group_type] = Herd(animal.group_type, self)
+        herd.members.append(animal)
+        animal.herd = herd
+        if herd.leader is None:
+            herd.leader = animal
+
+    def leave(self, animal) -> None:
+        self.version += 1
+        herd = animal.herd
+        if herd is None:
+            return
+        herd.members.discard(animal)
+        herd.separation.pop(animal, None)
+        animal.herd = None
+        if not herd.members:
+            del self.herds[herd.group_type]
+        elif herd.leader is animal:
+            herd.elect_leader()
+
+    def clear(self) -> None:
+        for herd in self.herds.values():
+            for a in herd.members:
+                a.herd = None
+        self.herds.clear()
+        self.version += 1
+
+    def update(self, dt: float) -> None:
+        for herd in self.herds.values():
+            herd.update(dt)
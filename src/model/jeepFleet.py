@@ -0,0 +1,165 @@
+# ──────────────────────────────────────────────────────────────────────────────
+#  jeepFleet.py – arc-length jeep route and the fleet of jeeps sharing it
+# ──────────────────────────────────────────────────────────────────────────────
+#  JeepRoute turns the TMX 'jeep_path' points into a closed tour starting and
+#  ending at the depot (JeepStart). It precomputes:
+#
+#      cum      distance along the route at every point
+#      facing   sprite direction of every segment
+#      buckets  first segment of every ROUTE_SAMPLE-pixel stretch of road
+#
+#  so locate(distance) finds the point on the road in O(1) and a jeep only
+#  ever keeps a single number, its distance along the route.
+#
+#  JeepFleet runs any number of jeeps on one route:
+#  - jeeps wait in a depot queue; only the front one takes on tourists, from
+#    the entrance queue of VisitorDemand.
+#  - a ready jeep departs once the previous one is JEEP_HEADWAY ahead.
+#  - running jeeps never close up to less than JEEP_MIN_GAP.
+#  - arriving jeeps unload and join the back of the queue.
+#  Buying a jeep just adds one more to the queue. set_route() swaps the tour
+#  (the Map builds it from the RoadGraph) for the queue at once and for
+#  running jeeps when they are back.
+# ──────────────────────────────────────────────────────────────────────────────
+from collections import deque
+
+from src.model.jeep import Jeep
+from src.model.visitorDemand import VisitorDemand
+
+ROUTE_SAMPLE = 8.0              # Pixels of road per lookup bucket
+JEEP_HEADWAY = 400.0            # Road distance to the previous jeep before departing
+JEEP_MIN_GAP = 120.0            # Running jeeps never get closer than this
+JEEP_QUEUE_GAP = 90.0           # Spacing of jeeps parked behind the depot
+
+
+def _facing(dx: float, dy: float) -> str:
+    """Sprite direction for a move of (dx, dy), horizontal winning ties."""
+    if abs(dx) > abs(dy):
+        return 'right' if dx > 0 else 'left'
+    return 'down' if dy > 0 else 'up'
+
+
+class JeepRoute:
+    def __init__(self, points, start=None):
+        pts = [tuple(map(float, p)) for p in points]
+        if start is not None:
+            pts.insert(0, tuple(map(float, start)))
+        if pts and pts[-1] != pts[0]:
+            pts.append(pts[0])                          # close the tour at the depot
+        # Drop zero-length segments so every lookup divides by a real length
+        self.points = [p for i, p in enumerate(pts) if i == 0 or p != pts[i - 1]]
+
+        self.cum = [0.0]
+        self.facing = []
+        for (x0, y0), (x1, y1) in zip(self.points, self.points[1:]):
+            self.cum.append(self.cum[-1] + ((x1 - x0) ** 2 + (y1 - y0) ** 2) ** 0.5)
+            self.facing.append(_facing(x1 - x0, y1 - y0))
+        self.length = self.cum[-1]
+
+        self.buckets = []
+        seg = 0
+        for k in range(int(self.length // ROUTE_SAMPLE) + 1):
+            while seg < len(self.facing) - 1 and self.cum[seg + 1] <= k * ROUTE_SAMPLE:
+                seg += 1
+            self.buckets.append(seg)
+
+    def locate(self, distance: float) -> tuple[float, float, str]:
+        """(x, y, facing) at `distance` along the route, clamped to its ends."""
+        if not self.facing:
+            x, y = self.points[0] if self.points else (0.0, 0.0)
+            return x, y, 'down'
+        d = min(max(distance, 0.0), self.length)
+        seg = self.buckets[int(d // ROUTE_SAMPLE)]
+        while seg < len(self.facing) - 1 and self.cum[seg + 1] < d:
+            seg += 1                                    # at most a step or two
+        (x0, y0), (x1, y1) = self.points[seg], self.points[seg + 1]
+        t = (d - self.cum[seg]) / (self.cum[seg + 1] - self.cum[seg])
+        return x0 + (x1 - x0) * t, y0 + (y1 - y0) * t, self.facing[seg]
+
+
+class JeepFleet:
+    """`jeeps` is the list every jeep is kept in (the registry's, for drawing)."""
+
+    def __init__(self, route: JeepRoute, jeeps, groups, map_ref, visitors: VisitorDemand):
+        self.route = route
+        self.visitors = visitors
+        self.jeeps = jeeps
+        self.groups = groups
+        self.map = map_ref
+        self.depot: deque[Jeep] = deque()   # waiting, front one boarding
+        self.running: list[Jeep] = []       # on the road, in departure order
+
+    def add(self) -> Jeep:
+        jeep = Jeep(self.route, self.groups, self.map)
+        self.jeeps.append(jeep)
+        self.depot.append(jeep)
+        self._park()
+        return jeep
+
+    def clear(self) -> None:
+        for jeep in self.jeeps:
+            jeep.kill()
+        self.jeeps.clear()
+        self.depot.clear()
+        self.running.clear()
+
+    def set_route(self, route: JeepRoute) -> None:
+        """Tour for every departure from now on; jeeps on the road finish their own first."""
+        self.route = route
+        self._park()
+
+    def _park(self) -> None:
+        """Line the waiting jeeps up on the road behind the depot."""
+        length = self.route.length
+        for k, jeep in enumerate(self.depot):
+            jeep.route = self.route
+            jeep.place(max(length - k * JEEP_QUEUE_GAP, 0.0) if k else 0.0)
+
+    def update(self, dt: float) -> None:
+        if self.depot:
+            front = self.depot[0]
+            front.board(dt, self.visitors)
+            if front.ready_to_depart and (not self.running or
+                                          self.running[-1].distance >= JEEP_HEADWAY):
+                self.running.append(self.depot.popleft())
+                self._park()
+
+        ahead = None
+        arrived = []
+        for jeep in self.running:
+            d = jeep.distance + jeep.speed * dt
+            if ahead is not None:
+                d = min(d, ahead.distance - JEEP_MIN_GAP)
+            if d >= jeep.route.length:      # a jeep on an older, longer tour may still be out
+                arrived.append(jeep)
+                d = jeep.route.length
+            jeep.place(max(d, jeep.distance))
+            ahead = jeep
+
+        if arrived:
+            for jeep in arrived:
+                jeep.unload()
+                self.running.remove(jeep)
+                self.depot.append(jeep)
+            self._park()
+
+    # ──────────────────────────────────────────────────────────────────────────
+    # Save / restore
+    # ──────────────────────────────────────────────────────────────────────────
+    def states(self) -> tuple:
+        """(distance, at_depot, tourists, ready, boarding_timer) per jeep, depot queue first."""
+        return tuple(
+            (j.distance, at_depot, j.tourist_count, j.ready_to_depart, j.boarding_timer)
+            for at_depot, group in ((True, self.depot), (False, self.running)) for j in group
+        )
+
+    def restore(self, states) -> None:
+        self.clear()
+        for distance, at_depot, tourists, ready, boarding in states:
+            jeep = Jeep(self.route, self.groups, self.map, distance)
+            jeep.tourist_count = tourists
+            jeep.ready_to_depart = bool(ready)
+            jeep.boarding_timer = boarding
+            self.jeeps.append(jeep)
+            (self.depot if at_depot else self.running).append(jeep)
+        self._park()
@@ -0,0 +1,285 @@
+# ──────────────────────────────────────────────────────────────────────────────
+#  pathfinder.py – A* over the walkable tile grid, with caching and a budget
+# ──────────────────────────────────────────────────────────────────────────────
+#  The grid has one cell per TILE_SIZE tile. A cell is blocked when a hitbox
+#  of the collision sprites (TMX 'hit' tiles, trees, ponds, flowers, ...)
+#  reaches into its central PATH_CLEARANCE square, the room an entity needs
+#  to pass through the cell centre. A flower at the edge of a tile leaves
+#  it walkable; one in the middle does not.
+#
+#  - request() queues a search and returns a PathRequest right away. Searches
+#    run in update(), which Map.step() calls once per frame. update() expands
+#    at most PATH_NODE_BUDGET nodes per call, across all pending requests, so
+#    a long search is spread over several frames.
+#  - Finished paths are cached by (start cell, goal cell). Identical pending
+#    requests share one search.
+#  - invalidate(rect) re-rasterises the cells under `rect` after something is
+#    placed on the map. It also drops the cache and restarts pending searches.
+#
+#  Navigator is the per-entity side. It steers straight at the target while
+#  the line is clear, and follows a path once the line is blocked.
+# ──────────────────────────────────────────────────────────────────────────────
+import heapq
+from collections import deque
+
+import pygame
+from pygame.math import Vector2
+
+from src.config.settings import TILE_SIZE
+
+PATH_NODE_BUDGET = 400          # A* node expansions per frame, over all requests
+PATH_CACHE_SIZE = 256           # Finished paths kept (oldest dropped first)
+PATH_CLEARANCE = 32             # Side of the free square a walkable cell needs at its centre
+WAYPOINT_REACHED = TILE_SIZE / 3
+NAV_STALL_STEPS = 15            # steer() calls without moving before a path is forced
+
+_SQRT2 = 2 ** 0.5
+NEIGHBOURS = (
+    (1, 0, 1.0), (-1, 0, 1.0), (0, 1, 1.0), (0, -1, 1.0),
+    (1, 1, _SQRT2), (1, -1, _SQRT2), (-1, 1, _SQRT2), (-1, -1, _SQRT2),
+)
+
+
+def _octile(a: tuple[int, int], b: tuple[int, int]) -> float:
+    dx, dy = abs(a[0] - b[0]), abs(a[1] - b[1])
+    return max(dx, dy) + (_SQRT2 - 1) * min(dx, dy)
+
+
+class PathRequest:
+    """One search from `start` to `goal` (cells). `path` is set once `done`."""
+
+    __slots__ = ("start", "goal", "version", "done", "path",
+                 "_open", "_g", "_came_from", "_closed", "_counter")
+
+    def __init__(self, start: tuple[int, int], goal: tuple[int, int], version: int):
+        self.start = start
+        self.goal = goal
+        self.version = version
+        self.done = False
+        self.path: tuple | None = None      # waypoints (world cell centres), None if unreachable
+        self._reset()
+
+    def _reset(self) -> None:
+        self._open = [(_octile(self.start, self.goal), 0, self.start)]
+        self._g = {self.start: 0.0}
+        self._came_from: dict = {}
+        self._closed: set = set()
+        self._counter = 1                   # heap tie-break, keeps searches deterministic
+
+    @property
+    def found(self) -> bool:
+        return self.path is not None
+
+
+class Pathfinder:
+    def __init__(self, map_rect: pygame.Rect, collision_sprites, budget: int = PATH_NODE_BUDGET):
+        self.collision_sprites = collision_sprites
+        self.cols = max(1, -(-map_rect.width // TILE_SIZE))
+        self.rows = max(1, -(-map_rect.height // TILE_SIZE))
+        self.blocked = bytearray(self.cols * self.rows)
+        self.budget = budget
+        self.version = 0                    # bumped on every invalidate()
+
+        self._cache: dict[tuple, tuple | None] = {}
+        self._pending: deque[PathRequest] = deque()
+        self._pending_by_key: dict[tuple, PathRequest] = {}
+        self._rasterise(pygame.Rect(0, 0, self.cols * TILE_SIZE, self.rows * TILE_SIZE))
+
+    # ──────────────────────────────────────────────────────────────────────────
+    # Grid
+    # ──────────────────────────────────────────────────────────────────────────
+    def cell_of(self, pos) -> tuple[int, int]:
+        x = min(max(int(pos[0] // TILE_SIZE), 0), self.cols - 1)
+        y = min(max(int(pos[1] // TILE_SIZE), 0), self.rows - 1)
+        return x, y
+
+    @staticmethod
+    def cell_centre(cell: tuple[int, int]) -> tuple[float, float]:
+        return (cell[0] + 0.5) * TILE_SIZE, (cell[1] + 0.5) * TILE_SIZE
+
+    def walkable(self, cell: tuple[int, int]) -> bool:
+        x, y = cell
+        return 0 <= x < self.cols and 0 <= y < self.rows and not self.blocked[y * self.cols + x]
+
+    def _rasterise(self, area: pygame.Rect) -> None:
+        """Recompute blocked flags for every cell touching `area`."""
+        x0, y0 = self.cell_of(area.topleft)
+        x1, y1 = self.cell_of((area.right - 1, area.bottom - 1))
+        blocked: set[tuple[int, int]] = set()
+        inset = (TILE_SIZE - PATH_CLEARANCE) // 2
+        region = pygame.Rect(x0 * TILE_SIZE, y0 * TILE_SIZE,
+                             (x1 - x0 + 1) * TILE_SIZE, (y1 - y0 + 1) * TILE_SIZE)
+        for sprite in self.collision_sprites:
+            box = getattr(sprite, "hitbox", sprite.rect).clip(region)
+            if not box.width or not box.height:
+                continue
+            bx0, by0 = self.cell_of(box.topleft)
+            bx1, by1 = self.cell_of((box.right - 1, box.bottom - 1))
+            for cy in range(by0, by1 + 1):
+                for cx in range(bx0, bx1 + 1):
+                    centre = pygame.Rect(cx * TILE_SIZE + inset, cy * TILE_SIZE + inset,
+                                         PATH_CLEARANCE, PATH_CLEARANCE)
+                    if box.colliderect(centre):
+                        blocked.add((cx, cy))
+
+        for cy in range(y0, y1 + 1):
+            for cx in range(x0, x1 + 1):
+                self.blocked[cy * self.cols + cx] = (cx, cy) in blocked
+
+    def invalidate(self, rect: pygame.Rect | None = None) -> None:
+        """The world changed under `rect` (whole map if None): re-rasterise, drop stale paths."""
+        self._rasterise(rect if rect is not None else
+                        pygame.Rect(0, 0, self.cols * TILE_SIZE, self.rows * TILE_SIZE))
+        self.version += 1
+        self._cache.clear()
+        for req in self._pending:
+            req.version = self.version
+            req._reset()
+
+    def line_clear(self, a, b) -> bool:
+        """True if the segment a→b crosses no blocked cell (the two end cells excepted)."""
+        start, goal = self.cell_of(a), self.cell_of(b)
+        dx, dy = b[0] - a[0], b[1] - a[1]
+        steps = int(max(abs(dx), abs(dy)) // (TILE_SIZE / 2)) + 1
+        for i in range(1, steps):
+            t = i / steps
+            cell = self.cell_of((a[0] + dx * t, a[1] + dy * t))
+            if cell != start and cell != goal and not self.walkable(cell):
+                return False
+        return True
+
+    # ──────────────────────────────────────────────────────────────────────────
+    # Requests
+    # ──────────────────────────────────────────────────────────────────────────
+    def request(self, start_pos, goal_pos) -> PathRequest:
+        key = (self.cell_of(start_pos), self.cell_of(goal_pos))
+        pending = self._pending_by_key.get(key)
+        if pending is not None:
+            return pending
+
+        req = PathRequest(key[0], key[1], self.version)
+        if key in self._cache:
+            req.path = self._cache[key] = self._cache.pop(key)     # move to the young end
+            req.done = True
+            return req
+        if key[0] == key[1]:
+            self._finish(req, (self.cell_centre(key[1]),))
+            return req
+
+        self._pending.append(req)
+        self._pending_by_key[key] = req
+        return req
+
+    def update(self) -> None:
+        budget = self.budget
+        while budget > 0 and self._pending:
+            req = self._pending[0]
+            budget -= self._expand(req, budget)
+            if req.done:
+                self._pending.popleft()
+                del self._pending_by_key[(req.start, req.goal)]
+
+    def _finish(self, req: PathRequest, path: tuple | None) -> None:
+        req.path = path
+        req.done = True
+        self._cache[(req.start, req.goal)] = path
+        if len(self._cache) > PATH_CACHE_SIZE:
+            del self._cache[next(iter(self._cache))]
+
+    def _expand(self, req: PathRequest, budget: int) -> int:
+        """Run A* on `req` for up to `budget` expansions; returns how many were used."""
+        goal, open_, g, came_from, closed = req.goal, req._open, req._g, req._came_from, req._closed
+        used = 0
+        while open_ and used < budget:
+            _, _, cell = heapq.heappop(open_)
+            if cell in closed:
+                continue
+            if cell == goal:
+                cells = [cell]
+                while cell in came_from:
+                    cell = came_from[cell]
+                    cells.append(cell)
+                cells.reverse()
+                self._finish(req, tuple(self.cell_centre(c) for c in cells[1:]))
+                return used
+            closed.add(cell)
+            used += 1
+
+            x, y = cell
+            for dx, dy, cost in NEIGHBOURS:
+                nxt = (x + dx, y + dy)
+                if nxt in closed or not (nxt == goal or self.walkable(nxt)):
+                    continue
+                # No cutting corners past a blocked tile
+                if dx and dy and not (self.walkable((x + dx, y)) and self.walkable((x, y + dy))):
+                    continue
+                ng = g[cell] + cost
+                if ng < g.get(nxt, float("inf")):
+                    g[nxt] = ng
+                    came_from[nxt] = cell
+                    heapq.heappush(open_, (ng + _octile(nxt, goal), req._counter, nxt))
+                    req._counter += 1
+
+        if not open_:
+            self._finish(req, None)         # goal unreachable
+        return max(used, 1)
+
+
+class Navigator:
+    """Per-entity path following on top of a shared Pathfinder."""
+
+    __slots__ = ("pathfinder", "request", "waypoint", "_last_pos", "_stalled")
+
+    def __init__(self, pathfinder: Pathfinder):
+        self.pathfinder = pathfinder
+        self.request: PathRequest | None = None
+        self.waypoint = 0
+        self._last_pos = (0.0, 0.0)
+        self._stalled = 0                   # consecutive steer() calls without moving
+
+    def clear(self) -> None:
+        self.request = None
+
+    def steer(self, pos: Vector2, target, force: bool = False) -> Vector2 | None:
+        """
+        Unit vector from `pos` towards `target`, or None when already there.
+        Straight line while it is clear. Otherwise (or with `force`, or after
+        NAV_STALL_STEPS calls without moving) the next waypoint of a path;
+        straight until that path is ready.
+        """
+        if pos.distance_squared_to(self._last_pos) > 0.25:
+            self._stalled = 0
+        else:
+            self._stalled += 1
+        self._last_pos = (pos.x, pos.y)
+        force = force or self._stalled >= NAV_STALL_STEPS
+
+        pf = self.pathfinder
+        req = self.request
+        if req is not None and (req.goal != pf.cell_of(target) or req.version != pf.version):
+            req = self.request = None
+        if req is None:
+            if not force and pf.line_clear(pos, target):
+                return self._towards(pos, target)
+            req = self.request = pf.request(pos, target)
+            self.waypoint = 0
+
+        if not req.done:
+            return self._towards(pos, target)
+        path = req.path
+        if path is None:
+            self.request = None                             # unreachable: keep pushing straight
+            return self._towards(pos, target)
+
+        limit = WAYPOINT_REACHED * WAYPOINT_REACHED
+        while self.waypoint < len(path) and pos.distance_squared_to(path[self.waypoint]) < limit:
+            self.waypoint += 1
+        if self.waypoint >= len(path) - 1:
+            self.request = None                             # in the goal tile
+            return self._towards(pos, target)
+        return self._towards(pos, path[self.waypoint])
+
+    @staticmethod
+    def _towards(pos: Vector2, point) -> Vector2 | None:
+        v = Vector2(point) - pos
+        return v.normalize() if v.length_squared() else None
@@ -0,0 +1,112 @@
+# ──────────────────────────────────────────────────────────────────────────────
+#  patrolPlanner.py – ranger patrol routes drawn from a poaching heatmap
+# ──────────────────────────────────────────────────────────────────────────────
+#  RiskHeatmap divides the map into square sectors PATROL_SECTOR tiles wide
+#  and keeps a decaying risk score per sector:
+#
+#      Map.spawn_poacher()      +HEAT_SPAWN where a poacher appears
+#      Poacher._hunt_animals()  +HEAT_ATTACK per hit, +HEAT_KILL per kill
+#
+#  Every PATROL_REPLAN_INTERVAL seconds of game time, PatrolPlanner decays
+#  the heat (half-life HEAT_HALF_LIFE) and gives each free AI ranger a route
+#  of up to PATROL_ROUTE_LEN sectors. Routes are built greedily for coverage:
+#  a ranger takes the sector with the best heat-to-distance ratio from where
+#  it is, then the next best from there, and so on. A sector taken by one
+#  ranger is not handed to another. Rangers loop their route between
+#  replans. With no heat anywhere they keep the old step pattern.
+# ──────────────────────────────────────────────────────────────────────────────
+from src.config.settings import TILE_SIZE
+from src.model.pathfinder import Pathfinder
+
+PATROL_SECTOR = 4               # Sector side, in tiles
+PATROL_ROUTE_LEN = 4            # Sectors per ranger route
+PATROL_REPLAN_INTERVAL = 120.0  # Game seconds between replans
+PATROL_MIN_HEAT = 0.5           # Colder sectors are not worth a detour
+PATROL_DISTANCE_SCALE = 1024.0  # Pixels of travel that halve a sector's appeal
+
+HEAT_HALF_LIFE = 300.0          # Game seconds for a sector's heat to halve
+HEAT_SPAWN = 1.0
+HEAT_ATTACK = 1.0
+HEAT_KILL = 3.0
+
+
+class RiskHeatmap:
+    def __init__(self, cols: int, rows: int):
+        self.cols = cols
+        self.rows = rows
+        self.heat = [0.0] * (cols * rows)
+
+    def sector_of(self, pos) -> int:
+        size = PATROL_SECTOR * TILE_SIZE
+        x = min(max(int(pos[0] // size), 0), self.cols - 1)
+        y = min(max(int(pos[1] // size), 0), self.rows - 1)
+        return y * self.cols + x
+
+    def add(self, pos, weight: float) -> None:
+        self.heat[self.sector_of(pos)] += weight
+
+    def decay(self, elapsed: float) -> None:
+        factor = 0.5 ** (elapsed / HEAT_HALF_LIFE)
+        self.heat = [h * factor for h in self.heat]
+
+
+class PatrolPlanner:
+    def __init__(self, pathfinder: Pathfinder):
+        self.pathfinder = pathfinder
+        cols = -(-pathfinder.cols // PATROL_SECTOR)
+        rows = -(-pathfinder.rows // PATROL_SECTOR)
+        self.heatmap = RiskHeatmap(cols, rows)
+        self.timer = 0.0
+        self._anchors: list = []            # per sector: walkable point nearest its centre, or None
+        self._anchors_version = -1
+
+    def _sector_anchors(self) -> list:
+        """Walkable cell centre closest to each sector's centre (rebuilt after map edits)."""
+        pf = self.pathfinder
+        if self._anchors_version == pf.version:
+            return self._anchors
+        anchors = []
+        for sy in range(self.heatmap.rows):
+            for sx in range(self.heatmap.cols):
+                mid = ((sx + 0.5) * PATROL_SECTOR, (sy + 0.5) * PATROL_SECTOR)
+                cells = [(x, y)
+                         for y in range(sy * PATROL_SECTOR, min((sy + 1) * PATROL_SECTOR, pf.rows))
+                         for x in range(sx * PATROL_SECTOR, min((sx + 1) * PATROL_SECTOR, pf.cols))
+                         if pf.walkable((x, y))]
+                if cells:
+                    best = min(cells, key=lambda c: (c[0] + 0.5 - mid[0]) ** 2 + (c[1] + 0.5 - mid[1]) ** 2)
+                    anchors.append(pf.cell_centre(best))
+                else:
+                    anchors.append(None)
+        self._anchors = anchors
+        self._anchors_version = pf.version
+        return anchors
+
+    def update(self, dt: float, rangers) -> None:
+        self.timer += dt
+        if self.timer < PATROL_REPLAN_INTERVAL:
+            return
+        self.heatmap.decay(self.timer)
+        self.timer = 0.0
+        self.replan(rangers)
+
+    def replan(self, rangers) -> None:
+        anchors = self._sector_anchors()
+        heat = self.heatmap.heat
+        open_sectors = {i for i, h in enumerate(heat) if h >= PATROL_MIN_HEAT and anchors[i] is not None}
+
+        for ranger in rangers:
+            if ranger.controllable or ranger.health <= 0:
+                continue
+            route = []
+            x, y = ranger.pos
+            while open_sectors and len(route) < PATROL_ROUTE_LEN:
+                def appeal(i):
+                    ax, ay = anchors[i]
+                    dist = ((ax - x) ** 2 + (ay - y) ** 2) ** 0.5
+                    return heat[i] / (1.0 + dist / PATROL_DISTANCE_SCALE), -i
+                best = max(open_sectors, key=appeal)
+                open_sectors.discard(best)
+                route.append(anchors[best])
+                x, y = anchors[best]
+            ranger.set_patrol_route(route)
@@ -1,7 +1,12 @@
-import random, pygame
+import pygame
 from pygame.math import Vector2
 from src.model.character import Character
-from src.utils.support import import_folder
+from src.model.patrolPlanner import HEAT_ATTACK, HEAT_KILL
+from src.utils.rng import WorldRNG, DEFAULT_RNG
+from src.model.animation import (
+    FrameTable, state_id, quantise, NO_SIDEWAYS, DEATH_ACTIONS,
+    IDLE, WALK, SPEAR_ATTACK, SPEAR, DOWN, DIRECTION_NAMES,
+)
 
 POACHER_DETECTION_RADIUS = 180
 POACHER_FLEE_SPEED = 40
@@ -12,12 +17,21 @@ POACHER_ATTACK_COOLDOWN = 1.0
 
 class Poacher(Character):
     _DIRS = ["down", "down_left", "down_right", "up", "up_left", "up_right"]
-    _DIRS_8 = ["up", "down", "left", "right", "up_left", "up_right", "down_left", "down_right"]
+    _frames: FrameTable | None = None   # shared by every poacher, loaded once
 
-    def __init__(self, pos: tuple[int, int], groups, map_rect: pygame.Rect):
+    __slots__ = (
+        "rng", "weapon", "spear_attacking", "random_direction", "random_move_timer",
+        "random_idle_timer", "idle_duration", "dying", "_death_done", "_death_hold",
+        "_death_pause", "_death_variant", "hunted_animals", "current_target_animal",
+        "last_attack_time", "spawn_time", "risk",
+    )
+
+    def __init__(self, pos: tuple[int, int], groups, map_rect: pygame.Rect, rng: WorldRNG | None = None):
         super().__init__(pos, groups, map_rect)
-        self._load_assets()
-        self.status = "idle_spear_down"
+        self.rng = rng or DEFAULT_RNG
+        self.animations = self._load_assets()
+        self.action = IDLE
+        self.status = state_id(IDLE, SPEAR, DOWN)
         self.image = self.animations[self.status][0]
         self.rect = self.image.get_rect(center=pos)
 
@@ -27,7 +41,7 @@ class Poacher(Character):
         self.random_move_timer = 0.0
         self.idle_phase = False
         self.random_idle_timer = 0.0
-        self.idle_duration = random.uniform(1.0, 2.5)
+        self.idle_duration = self.rng.movement.uniform(1.0, 2.5)
 
         self.dying = False
         self._death_done = False
@@ -38,21 +52,25 @@ class Poacher(Character):
         self.hunted_animals = []
         self.current_target_animal = None
         self.last_attack_time = 0.0
+        self.spawn_time = 0.0  # map simulation time; set by Map.spawn_poacher
+        self.risk = None       # RiskHeatmap of the map, likewise
 
 
-    def _load_assets(self):
-        self.animations = {}
-        base = "src/assets/characters/poacher"
-        
-        for d in self._DIRS_8:
-            suf = "down_left" if d == "left" else "down_right" if d == "right" else d
-            self.animations[f"idle_spear_{d}"] = import_folder(f"{base}/idle/spear/{suf}")
-            self.animations[f"walk_spear_{d}"] = import_folder(f"{base}/walk/spear/{suf}")
-            self.animations[f"spear_attack_{d}"] = import_folder(f"{base}/attack/spear_attack/{suf}")
-        for variant in ("death", "death_Gun", "death_Spear"):
-            lower = variant.lower()
-            for d in self._DIRS:
-                self.animations[f"{lower}_{d}"] = import_folder(f"{base}/death/{variant}/{d}")
+    @staticmethod
+    def _load_assets() -> FrameTable:
+        if Poacher._frames is None:
+            frames = FrameTable()
+            base = "src/assets/characters/poacher"
+            for d in sorted(set(NO_SIDEWAYS)):
+                suf = DIRECTION_NAMES[d]
+                frames.load(IDLE, SPEAR, d, f"{base}/idle/spear/{suf}")
+                frames.load(WALK, SPEAR, d, f"{base}/walk/spear/{suf}")
+                frames.load(SPEAR_ATTACK, SPEAR, d, f"{base}/attack/spear_attack/{suf}")
+            for variant, action in DEATH_ACTIONS.items():
+                for suf in Poacher._DIRS:
+                    frames.load(action, SPEAR, DIRECTION_NAMES.index(suf), f"{base}/death/{variant}/{suf}")
+            Poacher._frames = frames
+        return Poacher._frames
 
 
 
@@ -63,17 +81,9 @@ class Poacher(Character):
 
 
 
-    def _dir_label(self):
-        dx, dy = int(round(self.last_direction.x)), int(round(self.last_direction.y))
-
-        if dx == -1 and dy == -1: return "up_left"
-        if dx == 1 and dy == -1: return "up_right"
-        if dx == -1 and dy == 1: return "down_left"
-        if dx == 1 and dy == 1: return "down_right"
-        if dx == -1: return "down_left"
-        if dx == 1: return "down_right"
-        if dy == -1: return "up"
-        return "down"
+    def _direction(self):
+        """Sheet direction of last_direction (sideways uses the diagonal-down sheets)."""
+        return NO_SIDEWAYS[quantise(self.last_direction.x, self.last_direction.y)]
     
 
 
@@ -87,17 +97,16 @@ class Poacher(Character):
 
     def _set_status(self):
         if self.dying: return
-        lbl = self._dir_label()
+        d = self._direction()
 
-        if self.spear_attacking: self.status = f"spear_attack_{lbl}"
-        elif self.direction.length_squared() > 0: self.status = f"walk_spear_{lbl}"
-        else: self.status = f"idle_spear_{lbl}"
-        if self.status not in self.animations:
-            self.status = "idle_spear_down"
+        if self.spear_attacking: self.action = SPEAR_ATTACK
+        elif self.direction.length_squared() > 0: self.action = WALK
+        else: self.action = IDLE
+        self.status = state_id(self.action, SPEAR, d)
 
 
     def animate(self, dt):
-        animation = self.animations.get(self.status)
+        animation = self.animations[self.status]
         if not animation:
             return
 
@@ -110,7 +119,7 @@ class Poacher(Character):
         self.frame_index += speed * dt
         if self.frame_index >= len(frames):
             self.frame_index = 0
-            if "spear_attack" in self.status:
+            if self.action == SPEAR_ATTACK:
                 self.spear_attacking = False
             elif self.dying:
                 self._death_done = True
@@ -121,12 +130,12 @@ class Poacher(Character):
 
 
 
-    def _should_flee(self, rangers):
-        for r in rangers:
-            if r.health > 0 and self.pos.distance_to(r.pos) < POACHER_DETECTION_RADIUS:
-                direction = self.pos - r.pos
-                return direction.normalize() if direction.length_squared() else None
-        return None
+    def _flee_vector(self, view):
+        threat = view.threat
+        if threat is None or threat.health <= 0:
+            return None
+        direction = self.pos - threat.pos
+        return direction.normalize() if direction.length_squared() else None
 
     def _random_move(self, dt):
         if self.idle_phase:
@@ -135,57 +144,53 @@ class Poacher(Character):
             if self.random_idle_timer >= self.idle_duration:
                 self.idle_phase = False
                 self.random_idle_timer = 0.0
-                self.idle_duration = random.uniform(1.0, 2.5)
+                self.idle_duration = self.rng.movement.uniform(1.0, 2.5)
         else:
             self.random_move_timer += dt
             if self.random_move_timer >= 1.5:
                 self.random_move_timer = 0.0
-                self.idle_phase = random.choice([True, False])
+                self.idle_phase = self.rng.movement.choice([True, False])
                 if not self.idle_phase:
-                    self.random_direction = random.choice([
+                    self.random_direction = self.rng.movement.choice([
                         Vector2(1, 0), Vector2(-1, 0), Vector2(0, 1), Vector2(0, -1),
                         Vector2(1, 1), Vector2(-1, -1), Vector2(-1, 1), Vector2(1, -1)
                     ])
             self.direction = Vector2() if self.idle_phase else self.random_direction
 
-    def _hunt_animals(self, animals, current_time) -> bool:
-        nearest_animal = None
-        min_dist = POACHER_DETECTION_RADIUS
-
-        for animal in animals:
-            if not animal.is_alive:
-                continue
-            dist = self.pos.distance_to(animal.pos)
-            if dist < min_dist:
-                min_dist = dist
-                nearest_animal = animal
-
-        if nearest_animal:
-            to_animal = nearest_animal.pos - self.pos
-            if to_animal.length_squared() > 0:
-                self.direction = to_animal.normalize()
-                self.last_direction = self.direction.copy()
-            self.speed = POACHER_NORMAL_SPEED
+    def _hunt_animals(self, view, current_time) -> bool:
+        nearest_animal = view.prey
+        if nearest_animal is None or not nearest_animal.is_alive:
+            return False
+        min_dist = self.pos.distance_to(nearest_animal.pos)
 
-            if min_dist < POACHER_ATTACK_RANGE:
-                if current_time - self.last_attack_time > POACHER_ATTACK_COOLDOWN:
-                    self.spear_attacking = True
-                    self.last_attack_time = current_time
-                    nearest_animal.health -= POACHER_ATTACK_DAMAGE
-                    print(f"[ATTACK] {nearest_animal.name} → health: {nearest_animal.health}")
-
-                    # Make animal flee
-                    if hasattr(nearest_animal, "flee_from"):
-                        nearest_animal.flee_from(self.pos)
-
-                    if nearest_animal.health <= 0:
-                        nearest_animal.is_alive = False
-                        nearest_animal.kill()
-                        self.hunted_animals.append(nearest_animal)
-                        print(f"[KILL] Poacher killed {nearest_animal.name} ({nearest_animal.species})")
-                        self.current_target_animal = None
-            return True
-        return False
+        to_animal = nearest_animal.pos - self.pos
+        if to_animal.length_squared() > 0:
+            self.direction = to_animal.normalize()
+            self.last_direction = self.direction.copy()
+        self.speed = POACHER_NORMAL_SPEED
+
+        if min_dist < POACHER_ATTACK_RANGE:
+            if current_time - self.last_attack_time > POACHER_ATTACK_COOLDOWN:
+                self.spear_attacking = True
+                self.last_attack_time = current_time
+                nearest_animal.health -= POACHER_ATTACK_DAMAGE
+                if self.risk is not None:
+                    self.risk.add(self.pos, HEAT_ATTACK)
+                print(f"[ATTACK] {nearest_animal.name} → health: {nearest_animal.health}")
+
+                # Make animal flee
+                if hasattr(nearest_animal, "flee_from"):
+                    nearest_animal.flee_from(self.pos)
+
+                if nearest_animal.health <= 0:
+                    nearest_animal.is_alive = False
+                    nearest_animal.kill()
+                    self.hunted_animals.append(nearest_animal)
+                    if self.risk is not None:
+                        self.risk.add(self.pos, HEAT_KILL)
+                    print(f"[KILL] Poacher killed {nearest_animal.name} ({nearest_animal.species})")
+                    self.current_target_animal = None
+        return True
 
     def take_damage(self, dmg, weapon="generic"):
         if self.dying: return
@@ -202,14 +207,16 @@ class Poacher(Character):
         self.dying = True
         self.direction = Vector2()
         self.speed = 0
-        self.status = f"{self._death_variant.lower()}_{self._dir_label()}"
-        if self.status not in self.animations:
-            self.status = f"{self._death_variant.lower()}_down"
+        self.action = DEATH_ACTIONS[self._death_variant]
+        self.status = state_id(self.action, SPEAR, self._direction())
         self.frame_index = 0
         print(f"[DEATH] Poacher died. Hunted {len(self.hunted_animals)} animals.")
 
-    def update(self, dt, rangers=None, animals=None):
-        current_time = pygame.time.get_ticks() / 1000  # Convert to seconds
+    def update(self, dt, combat=None, current_time=0.0):
+        """
+        `combat` holds this tick's ranger / poacher / animal pairs (see combatSystem.py);
+        `current_time` is the map's simulation clock in seconds (used for attack cooldowns).
+        """
 
         if self.dying:
             self._animate(dt)
@@ -219,11 +226,12 @@ class Poacher(Character):
                     self.kill()
             return
 
-        flee = self._should_flee(rangers or [])
+        view = combat.poacher_view(self) if combat else None
+        flee = self._flee_vector(view) if view else None
         if flee:
             self.direction = flee
             self.speed = POACHER_FLEE_SPEED
-        elif animals and self._hunt_animals(animals, current_time):
+        elif view and self._hunt_animals(view, current_time):
             pass
         else:
             self.speed = POACHER_NORMAL_SPEED
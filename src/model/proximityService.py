@@ -0,0 +1,95 @@
+# ──────────────────────────────────────────────────────────────────────────────
+#  proximityService.py – shared predator / prey / threat queries
+# ──────────────────────────────────────────────────────────────────────────────
+#  Animals of each diet type (herbivore, omnivore, carnivore) are bucketed into
+#  square cells PREY_DETECTION_RADIUS wide, so every query only visits the 3x3
+#  cells around the asking animal.
+#
+#  sighting(animal) answers both questions an animal asks in its update, the
+#  nearest valid prey and the first threat in reach, in one pass. The
+#  answer is cached for the rest of the tick, so hunting and fleeing share it.
+# ──────────────────────────────────────────────────────────────────────────────
+from typing import NamedTuple
+
+# Who flees from whom and who hunts whom, by Animal.type
+THREATS = {
+    "herbivore": ("carnivore", "omnivore"),
+    "omnivore":  ("carnivore",),
+    "carnivore": (),
+}
+PREY = {
+    "carnivore": ("herbivore", "omnivore"),
+    "omnivore":  ("herbivore",),
+    "herbivore": (),
+}
+
+
+class Sighting(NamedTuple):
+    prey: object | None       # nearest valid prey within the prey radius
+    threat: object | None     # first predator whose rect is within the threat margin
+
+
+def is_valid_prey(hunter, prey) -> bool:
+    """Carnivores leave healthy bears alone."""
+    return not (hunter.type == "carnivore" and prey.type == "omnivore" and
+                "bear" in prey.species.lower() and prey.health >= 50)
+
+
+class ProximityService:
+    def __init__(self, diets: dict, prey_radius: float, threat_margin: float):
+        self.diets = diets                  # diet type -> EntityList of that diet
+        self.prey_radius = prey_radius
+        self.threat_margin = threat_margin  # total rect inflation, as in Rect.inflate
+        self.cell = prey_radius             # threat reach (margin/2 + half sizes) is smaller
+        self._buckets: dict[str, dict[tuple[int, int], list]] = {}
+        self._bucket_tick: dict[str, int] = {}
+        self._sightings: dict = {}
+        self.tick = 0
+
+    def begin_tick(self) -> None:
+        self.tick += 1
+        self._sightings.clear()
+
+    def _diet_buckets(self, diet: str) -> dict[tuple[int, int], list]:
+        if self._bucket_tick.get(diet) == self.tick:
+            return self._buckets[diet]
+        size = self.cell
+        buckets: dict[tuple[int, int], list] = {}
+        for a in self.diets[diet]:
+            buckets.setdefault((int(a.pos.x // size), int(a.pos.y // size)), []).append(a)
+        self._buckets[diet] = buckets
+        self._bucket_tick[diet] = self.tick
+        return buckets
+
+    def _nearby(self, animal, diets):
+        size = self.cell
+        cx, cy = int(animal.pos.x // size), int(animal.pos.y // size)
+        for diet in diets:
+            buckets = self._diet_buckets(diet)
+            for dx in (-1, 0, 1):
+                for dy in (-1, 0, 1):
+                    yield from buckets.get((cx + dx, cy + dy), ())
+
+    def sighting(self, animal) -> Sighting:
+        cached = self._sightings.get(animal)
+        if cached is not None:
+            return cached
+
+        prey, best = None, self.prey_radius * self.prey_radius
+        for other in self._nearby(animal, PREY[animal.type]):
+            if other is animal or not other.is_alive or not is_valid_prey(animal, other):
+                continue
+            d2 = animal.pos.distance_squared_to(other.pos)
+            if d2 < best:
+                prey, best = other, d2
+
+        threat = None
+        margin = self.threat_margin
+        for other in self._nearby(animal, THREATS[animal.type]):
+            if other is not animal and other.is_alive and \
+                    animal.rect.colliderect(other.rect.inflate(margin, margin)):
+                threat = other
+                break
+
+        result = self._sightings[animal] = Sighting(prey, threat)
+        return result
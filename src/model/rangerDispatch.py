@@ -0,0 +1,140 @@
+# ──────────────────────────────────────────────────────────────────────────────
+#  rangerDispatch.py – send the nearest free rangers after new poachers
+# ──────────────────────────────────────────────────────────────────────────────
+#  Map.spawn_poacher() tells the dispatcher about every new poacher. Ranking
+#  works in two steps, so a spawn never costs more than a frame:
+#
+#  1. The free AI rangers are bucketed into DISPATCH_BUCKET squares. A ring
+#     search around the poacher picks the DISPATCH_CANDIDATES closest in a
+#     straight line.
+#  2. Each candidate gets a Pathfinder.request() towards the poacher. The A*
+#     searches run under the Pathfinder's per-frame node budget. Once they
+#     have all finished, the DISPATCH_PER_POACHER candidates with the
+#     shortest reachable paths are assigned.
+#
+#  Assigned rangers walk after the poacher with their Navigator (the path
+#  just searched is in the Pathfinder cache). The combat view takes over
+#  once the poacher comes into detection range.
+#
+#  Assignments are stable. A ranger keeps its poacher until that poacher dies
+#  or leaves, or the ranger is taken over by the player or ordered elsewhere.
+#  Only then is it released, and released rangers are handed to poachers that
+#  still have fewer than DISPATCH_PER_POACHER hunters.
+# ──────────────────────────────────────────────────────────────────────────────
+from src.config.settings import TILE_SIZE
+from src.model.pathfinder import Pathfinder
+
+DISPATCH_PER_POACHER = 2        # Rangers sent after each poacher
+DISPATCH_CANDIDATES = 4         # Closest rangers (straight line) whose paths are searched
+DISPATCH_BUCKET = 8 * TILE_SIZE # Side of the squares the straight-line query buckets rangers in
+
+
+def nearest_rangers(rangers, pos, count: int, bucket: int = DISPATCH_BUCKET) -> list:
+    """The `count` rangers closest to `pos` in a straight line, nearest first (ties by list order)."""
+    buckets: dict[tuple[int, int], list] = {}
+    for i, r in enumerate(rangers):
+        buckets.setdefault((int(r.pos.x // bucket), int(r.pos.y // bucket)), []).append((i, r))
+    if not buckets:
+        return []
+
+    px, py = pos[0], pos[1]
+    bx, by = int(px // bucket), int(py // bucket)
+    reach = max(max(abs(x - bx), abs(y - by)) for x, y in buckets)
+    found = []
+    for ring in range(reach + 1):
+        for x in range(bx - ring, bx + ring + 1):
+            for y in range(by - ring, by + ring + 1):
+                if max(abs(x - bx), abs(y - by)) != ring:
+                    continue                # inner rings were searched already
+                for i, r in buckets.get((x, y), ()):
+                    dx, dy = r.pos.x - px, r.pos.y - py
+                    found.append((dx * dx + dy * dy, i, r))
+        # Rangers beyond this ring are at least ring * bucket away
+        if len(found) >= count:
+            found.sort(key=lambda entry: entry[:2])
+            if found[count - 1][0] <= (ring * bucket) ** 2:
+                break
+    found.sort(key=lambda entry: entry[:2])
+    return [r for _, _, r in found[:count]]
+
+
+def _path_length(start, path) -> float:
+    length, (x, y) = 0.0, (start[0], start[1])
+    for nx, ny in path:
+        length += ((nx - x) ** 2 + (ny - y) ** 2) ** 0.5
+        x, y = nx, ny
+    return length
+
+
+class RangerDispatcher:
+    def __init__(self, pathfinder: Pathfinder):
+        self.pathfinder = pathfinder
+        self.assignments: dict = {}         # ranger -> poacher it is after
+        self.pending: dict = {}             # poacher -> (rangers wanted, [(ranger, PathRequest)])
+        self._dirty = False                 # something changed: rerun the assignment
+        self._seen = (0, 0)                 # (rangers, poachers) counts last tick
+
+    @staticmethod
+    def _available(ranger) -> bool:
+        return not ranger.controllable and ranger.health > 0 and ranger.move_order is None
+
+    def poacher_spawned(self, poacher, rangers) -> None:
+        self._propose(poacher, rangers, DISPATCH_PER_POACHER)
+
+    def release(self, ranger) -> None:
+        if self.assignments.pop(ranger, None) is not None:
+            ranger.assignment = None
+            self._dirty = True
+
+    def _free(self, ranger) -> bool:
+        return ranger not in self.assignments and self._available(ranger)
+
+    def _propose(self, poacher, rangers, wanted: int) -> None:
+        """Queue path searches from the rangers closest to `poacher`."""
+        if wanted <= 0 or poacher in self.pending:
+            return
+        free = [r for r in rangers if self._free(r)]
+        candidates = nearest_rangers(free, poacher.pos, max(wanted, DISPATCH_CANDIDATES))
+        if candidates:
+            self.pending[poacher] = (wanted, [(r, self.pathfinder.request(r.pos, poacher.pos))
+                                              for r in candidates])
+
+    def _resolve(self, rangers, poachers) -> None:
+        """Assign the rangers of every proposal whose searches have all finished."""
+        for poacher, (wanted, proposals) in list(self.pending.items()):
+            if poacher.health <= 0 or poacher.dying or poacher not in poachers:
+                del self.pending[poacher]
+                continue
+            if not all(req.done for _, req in proposals):
+                continue
+            del self.pending[poacher]
+            ranked = sorted(
+                ((_path_length(r.pos, req.path), i, r) for i, (r, req) in enumerate(proposals)
+                 if req.found and r in rangers and self._free(r)),
+                key=lambda entry: entry[:2],
+            )
+            for _, _, ranger in ranked[:wanted]:
+                self.assignments[ranger] = poacher
+                ranger.assignment = poacher
+
+    def update(self, rangers, poachers) -> None:
+        """Once per tick, before the rangers move: drop finished assignments, refill."""
+        for ranger, poacher in list(self.assignments.items()):
+            if (poacher.health <= 0 or poacher.dying or poacher not in poachers or
+                    ranger not in rangers or not self._available(ranger)):
+                self.release(ranger)
+
+        seen = (len(rangers), len(poachers))
+        if seen != self._seen:              # rangers bought, poachers gone or loaded
+            self._seen = seen
+            self._dirty = True
+        if self._dirty:
+            self._dirty = False
+            hunters: dict = {}
+            for poacher in self.assignments.values():
+                hunters[poacher] = hunters.get(poacher, 0) + 1
+            for poacher in poachers:
+                if poacher.health > 0 and not poacher.dying:
+                    self._propose(poacher, rangers, DISPATCH_PER_POACHER - hunters.get(poacher, 0))
+
+        self._resolve(rangers, poachers)
@@ -12,8 +12,11 @@ import pygame
 from pygame.math import Vector2
 
 from src.model.character import Character
-from src.model.poacher   import Poacher
-from src.utils.support   import import_folder
+from src.model.animation import (
+    FrameTable, state_id, quantise, ATTACK_ACTIONS,
+    IDLE, WALK, SHOOTING, SPEAR_ATTACK, NORMAL, GUN, SPEAR,
+    UP, DOWN, LEFT, RIGHT, UP_LEFT, UP_RIGHT, DOWN_LEFT, DOWN_RIGHT,
+)
 from src.config.settings import *
 
 # ───────────────────────────── CONSTANTS ──────────────────────────────
@@ -21,9 +24,16 @@ RANGER_DETECTION_RADIUS = 180          # gun range & chase radius
 RANGER_SPEAR_RANGE      = 50           # spear attack range
 RANGER_CHASE_SPEED      = 60
 RANGER_NORMAL_SPEED     = 40
+PATROL_WAYPOINT_RADIUS  = 48           # close enough to a patrol waypoint to move on
 
 GUN_DAMAGE              = 20           # HP taken from Poacher per gun hit
 SPEAR_DAMAGE            = 10           # HP taken from Poacher per spear hit
+
+# sheet folder of every compass direction
+RANGER_DIR_FOLDERS = {
+    UP: 'up', DOWN: 'down', LEFT: 'left', RIGHT: 'right',
+    UP_LEFT: 'left_up', UP_RIGHT: 'right_up', DOWN_LEFT: 'left_down', DOWN_RIGHT: 'right_down',
+}
 # ───────────────────────────────────────────────────────────────────────
 
 
@@ -32,6 +42,13 @@ class Ranger(Character):
     WEAPON_TYPES         = ['normal', 'gun', 'spear']
     current_weapon_index = 0        
     COUNT = 1    
+    _frames: FrameTable | None = None   # shared by every ranger, loaded once
+
+    __slots__ = (
+        "name", "collision_sprites", "controllable", "input_actions", "weapon", "weapon_id",
+        "shooting", "spear_attacking", "_damage_done_this_anim", "hitbox", "navigator",
+        "move_order", "assignment", "patrol_route", "patrol_index",
+    )
 
     # ─────────────────────────── INIT ────────────────────────────
     def __init__(
@@ -51,14 +68,22 @@ class Ranger(Character):
         # ── gameplay state ───────────────────────────────────────
         self.collision_sprites = collision_sprites
         self.controllable      = controllable
+        self.input_actions     = None       # InputActions while player-controlled
         self.weapon            = self.WEAPON_TYPES[self.current_weapon_index]
+        self.weapon_id         = self.current_weapon_index
         self.shooting          = False
         self.spear_attacking   = False
-        self.status            = 'idle_normal_down'
+        self.action            = IDLE
+        self.status            = state_id(IDLE, NORMAL, DOWN)
         self._damage_done_this_anim = False   # “one hit per anim” flag
+        self.navigator         = None       # Navigator on the map's Pathfinder, set by the registry
+        self.move_order        = None       # FlowField of a group move order, None when free
+        self.assignment        = None       # Poacher the RangerDispatcher sent this ranger after
+        self.patrol_route: list = []        # waypoints from the PatrolPlanner, looped
+        self.patrol_index      = 0
 
         # ── sprite visuals ───────────────────────────────────────
-        self._import_assets()
+        self.animations = self._import_assets()
         self.image  = self.animations[self.status][self.frame_index]
         self.rect   = self.image.get_rect(center=pos)
         self.z      = LAYERS['main']
@@ -67,47 +92,33 @@ class Ranger(Character):
     # ──────────────────────── ASSET LOADING ───────────────────────
     
     
-    def _import_assets(self) -> None:
-        self.animations: dict[str, list[pygame.Surface]] = {}
-        dirs = [
-            'up', 'down', 'left', 'right',
-            'left_down', 'left_up', 'right_down', 'right_up'
-        ]
-        for weapon in self.WEAPON_TYPES:
-            for d in dirs:
-                suf = f'{d}_down' if d in ('left', 'right') else d
-                base = f'src/assets/characters/ranger'
-                self.animations[f'idle_{weapon}_{d}'] = import_folder(f'{base}/idle/{weapon}/{suf}')
-                self.animations[f'walk_{weapon}_{d}'] = import_folder(f'{base}/walk/{weapon}/{suf}')
-        for atk in ('shooting', 'spear_attack'):
-            for d in dirs:
-                path = f'src/assets/characters/ranger/attack/{atk}/{d}'
-                self.animations[f'{atk}_{d}'] = import_folder(path)
-
-    # ───────────────────── DIRECTION LABEL (for anim key) ────────────
-    def _dir_label(self) -> str:
-        dx, dy = int(round(self.last_direction.x)), int(round(self.last_direction.y))
-        if   dx == -1 and dy == 0: return 'left'
-        elif dx ==  1 and dy == 0: return 'right'
-        elif dy == -1:
-            return 'left_up'   if dx == -1 else 'right_up'   if dx == 1 else 'up'
-        elif dy ==  1:
-            return 'left_down' if dx == -1 else 'right_down' if dx == 1 else 'down'
-        return 'down'
-
-
-
+    @staticmethod
+    def _import_assets() -> FrameTable:
+        if Ranger._frames is None:
+            frames = FrameTable()
+            base = 'src/assets/characters/ranger'
+            for weapon_id, weapon in enumerate(Ranger.WEAPON_TYPES):
+                for d, folder in RANGER_DIR_FOLDERS.items():
+                    suf = f'{folder}_down' if folder in ('left', 'right') else folder
+                    frames.load(IDLE, weapon_id, d, f'{base}/idle/{weapon}/{suf}')
+                    frames.load(WALK, weapon_id, d, f'{base}/walk/{weapon}/{suf}')
+            for action, weapon_id, atk in ((SHOOTING, GUN, 'shooting'), (SPEAR_ATTACK, SPEAR, 'spear_attack')):
+                for d, folder in RANGER_DIR_FOLDERS.items():
+                    frames.load(action, weapon_id, d, f'{base}/attack/{atk}/{folder}')
+            Ranger._frames = frames
+        return Ranger._frames
 
     # ─────────────────────── STATE & ANIMATION ───────────────────────
     def _set_status(self) -> None:
-        label = self._dir_label()
-        if   self.spear_attacking: self.status = f'spear_attack_{label}'
-        elif self.shooting       : self.status = f'shooting_{label}'
+        d = quantise(self.last_direction.x, self.last_direction.y)
+        if   self.spear_attacking: self.action, weapon = SPEAR_ATTACK, SPEAR
+        elif self.shooting       : self.action, weapon = SHOOTING, GUN
         elif self.direction.length_squared() > 0:
-            self.last_direction = self.direction.copy()
-            self.status = f'walk_{self.weapon}_{label}'
+            self.last_direction.update(self.direction)
+            self.action, weapon = WALK, self.weapon_id
         else:
-            self.status = f'idle_{self.weapon}_{label}'
+            self.action, weapon = IDLE, self.weapon_id
+        self.status = state_id(self.action, weapon, d)
 
 
 
@@ -116,7 +127,7 @@ class Ranger(Character):
         self.frame_index += 8 * dt
         if self.frame_index >= len(frames):
             self.frame_index = 0
-            if 'spear_attack' in self.status or 'shooting' in self.status:
+            if self.action in ATTACK_ACTIONS:
                 # attack animation finished → reset flags
                 self.spear_attacking = self.shooting = False
                 self._damage_done_this_anim = False
@@ -129,20 +140,22 @@ class Ranger(Character):
 
     # ────────────────────── PLAYER INPUT HANDLER ─────────────────────
     def _handle_player_input(self, dt: float) -> None:
-        keys  = pygame.key.get_pressed()
-        ctrl  = keys[pygame.K_LCTRL] or keys[pygame.K_RCTRL]
+        actions = self.input_actions
+        if actions is None:
+            self.direction.xy = 0, 0
+            return
 
-        # cycle weapon with Z / X
-        if ctrl and keys[pygame.K_z]:
-            Ranger.current_weapon_index = (Ranger.current_weapon_index - 1) % len(self.WEAPON_TYPES)
-            pygame.time.wait(150)
-        if ctrl and keys[pygame.K_x]:
-            Ranger.current_weapon_index = (Ranger.current_weapon_index + 1) % len(self.WEAPON_TYPES)
-            pygame.time.wait(150)
+        # cycle weapon with Ctrl + Z / X (edge-triggered, repeats while held)
+        if actions.pressed('weapon_prev'):
+            Ranger.cycle_weapon(-1)
+            self._sync_weapon_choice()
+        if actions.pressed('weapon_next'):
+            Ranger.cycle_weapon(+1)
+            self._sync_weapon_choice()
 
         # movement
-        dx = keys[pygame.K_RIGHT] - keys[pygame.K_LEFT]
-        dy = keys[pygame.K_DOWN]  - keys[pygame.K_UP]
+        dx = actions.held('move_right') - actions.held('move_left')
+        dy = actions.held('move_down')  - actions.held('move_up')
         self.direction.xy = dx, dy
         if dx != 0 or dy != 0:
             self.groups()[0].reset_to_follow()
@@ -150,15 +163,34 @@ class Ranger(Character):
             self.direction /= 1.4142
 
         # attack on Ctrl + A while standing
-        if self.direction.length_squared() == 0 and ctrl and keys[pygame.K_a]:
+        if self.direction.length_squared() == 0 and actions.held('attack'):
             if self.weapon == 'gun':
                 self._trigger_shoot()
             elif self.weapon == 'spear':
                 self._trigger_spear()
 
+    # ─────────────────────── CONTROL HAND-OVER ───────────────────────
+    def set_controllable(self, controllable: bool, input_actions=None) -> None:
+        """Switch between keyboard and AI control without rebuilding the ranger."""
+        self.controllable = controllable
+        self.input_actions = input_actions if controllable else None
+        self.direction    = Vector2()
+        self.z            = self.rect.centery if controllable else LAYERS['main']
+
+    def set_patrol_route(self, route: list) -> None:
+        """Patrol `route` (world points) in a loop; an empty route restores the step pattern."""
+        self.patrol_route = route
+        self.patrol_index = 0
+
     # ─────────────────────── WEAPON ACTIONS ─────────────────────────
+    @classmethod
+    def cycle_weapon(cls, step: int) -> None:
+        """Select the previous (-1) / next (+1) weapon; called once per key-down."""
+        cls.current_weapon_index = (cls.current_weapon_index + step) % len(cls.WEAPON_TYPES)
+
     def _sync_weapon_choice(self) -> None:
-        self.weapon = self.WEAPON_TYPES[self.current_weapon_index]
+        self.weapon_id = self.current_weapon_index
+        self.weapon = self.WEAPON_TYPES[self.weapon_id]
 
     def _trigger_shoot(self) -> None:
         if not self.shooting and self.weapon == 'gun':
@@ -173,39 +205,50 @@ class Ranger(Character):
             self._damage_done_this_anim = False
 
     # ───────────────────── DAMAGE APPLICATION ──────────────────────
-    def _deal_damage(self, poachers: list[Poacher]) -> None:
+    def _deal_damage(self, view: "RangerView") -> None:
         if self._damage_done_this_anim:
             return
 
         if self.shooting:
-            for p in poachers:
-                if p.health > 0 and self.pos.distance_to(p.pos) < RANGER_DETECTION_RADIUS:
+            for p in view.in_gun_range:
+                if p.health > 0:
                     p.take_damage(GUN_DAMAGE)
             self._damage_done_this_anim = True
 
         elif self.spear_attacking:
-            for p in poachers:
-                if p.health > 0 and self.pos.distance_to(p.pos) < RANGER_SPEAR_RANGE:
+            for p in view.in_spear_range:
+                if p.health > 0:
                     p.take_damage(SPEAR_DAMAGE)
             self._damage_done_this_anim = True
 
     # ──────────────────────── AI HELPERS ───────────────────────────
-    def _vector_to_nearest(self, poachers: list[Poacher]) -> Vector2 | None:
-        nearest, best_d2 = None, RANGER_DETECTION_RADIUS ** 2
-        for p in poachers:
-            if p.health <= 0:
-                continue
-            d2 = self.pos.distance_squared_to(p.pos)
-            if d2 < best_d2:
-                nearest, best_d2 = p, d2
-        if nearest:
-            v = nearest.pos - self.pos
-            return v.normalize() if v.length_squared() else None
-        return None
-
-    def _spear_reachable(self, poachers: list[Poacher]) -> bool:
-        return any(p.health > 0 and self.pos.distance_to(p.pos) < RANGER_SPEAR_RANGE
-                   for p in poachers)
+    def _steer_to(self, point) -> Vector2 | None:
+        """Unit vector towards `point`, around obstacles when a Navigator is attached."""
+        if self.navigator is not None:
+            return self.navigator.steer(self.pos, point)
+        v = Vector2(point) - self.pos
+        return v.normalize() if v.length_squared() else None
+
+    def _vector_to_target(self, view: "RangerView") -> Vector2 | None:
+        target = view.target
+        if target is None or target.health <= 0:
+            return None
+        return self._steer_to(target.pos)
+
+    def _follow_patrol_route(self) -> bool:
+        """Walk the planned patrol loop; False when there is none."""
+        route = self.patrol_route
+        if not route:
+            return False
+        if self.pos.distance_squared_to(route[self.patrol_index]) < PATROL_WAYPOINT_RADIUS ** 2:
+            self.patrol_index = (self.patrol_index + 1) % len(route)
+        step = self._steer_to(route[self.patrol_index])
+        self.direction = step if step is not None else Vector2()
+        return True
+
+    @staticmethod
+    def _spear_reachable(view: "RangerView") -> bool:
+        return any(p.health > 0 for p in view.in_spear_range)
 
     # ───────────────────────── MOVEMENT w/ COLLISION ───────────────
 
@@ -258,34 +301,47 @@ class Ranger(Character):
                     self.pos.y = self.hitbox.centery
 
     # ────────────────────────── UPDATE LOOP ───────────────────────
-    def update(self, dt: float, poachers: list[Poacher] | None = None) -> None:
+    def update(self, dt: float, combat: "CombatSystem | None" = None) -> None:
+        """`combat` holds this tick's ranger / poacher pairs (see combatSystem.py)."""
         self._sync_weapon_choice()
+        view = combat.ranger_view(self) if combat else None
 
         # 1) player vs. AI inputs
         if self.controllable:
             self._handle_player_input(dt)
         else:
-            if poachers:
-                vec = self._vector_to_nearest(poachers)
-                if vec:
-                    # chase
-                    self.direction = vec
-                    self.speed     = RANGER_CHASE_SPEED
-                    # auto-attack
-                    if self.weapon == 'spear' and self._spear_reachable(poachers):
-                        self._trigger_spear()
-                    elif self.weapon == 'gun' and not self.shooting:
-                        self._trigger_shoot()
+            vec = self._vector_to_target(view) if view else None
+            if vec:
+                # chase
+                self.direction = vec
+                self.speed     = RANGER_CHASE_SPEED
+                # auto-attack
+                if self.weapon == 'spear' and self._spear_reachable(view):
+                    self._trigger_spear()
+                elif self.weapon == 'gun' and not self.shooting:
+                    self._trigger_shoot()
+            elif self.assignment is not None:
+                # dispatched → head for the poacher until it is in range
+                self.speed = RANGER_CHASE_SPEED
+                step = self._steer_to(self.assignment.pos)
+                self.direction = step if step is not None else Vector2()
+            elif self.move_order is not None:
+                # ordered somewhere → walk the shared flow field
+                self.speed = RANGER_NORMAL_SPEED
+                step = self.move_order.direction_at(self.pos)
+                if step is None:
+                    self.move_order = None     # arrived (or cut off)
+                    self.direction = Vector2()
                 else:
-                    self.speed = RANGER_NORMAL_SPEED
-                    self.patrol_input(dt)      # no target → patrol
+                    self.direction = step
             else:
                 self.speed = RANGER_NORMAL_SPEED
-                self.patrol_input(dt)
+                if not self._follow_patrol_route():
+                    self.patrol_input(dt)      # no target, no plan → step pattern
 
         # 2) apply damage (once per anim cycle)
-        if poachers:
-            self._deal_damage(poachers)
+        if view:
+            self._deal_damage(view)
 
         # 3) housekeeping
         self._set_status()
@@ -296,6 +352,8 @@ class Ranger(Character):
 # ║                PLAYER-CONTROLLED SUBCLASS                      ║
 # ╚═════════════════════════════════════════════════════════════════╝
 class ControllableRanger(Ranger):
+    __slots__ = ()
+
     def __init__(self, pos, group, map_rect, collision_sprites):
         super().__init__(pos, group, map_rect, collision_sprites, controllable=True)
         self.z = self.rect.centery
@@ -0,0 +1,249 @@
+# ──────────────────────────────────────────────────────────────────────────────
+#  roadGraph.py – the road tiles compiled into a graph for jeep routing
+# ──────────────────────────────────────────────────────────────────────────────
+#  Road tiles (the TMX 'roadtiles' layer plus roads the player builds) are
+#  4-connected cells. RoadGraph keeps:
+#
+#      nodes   cells where roads meet or end, and every tile added later
+#      edges   the run of road between two nodes, as its list of cells
+#
+#  Searches are Dijkstra over the nodes, so they cost in intersections, not
+#  tiles. One search from a node answers every route starting there, so the
+#  search trees are cached per (source, kind), ROUTE_CACHE_SIZE of them:
+#
+#      shortest(a, b)  fewest tiles
+#      scenic(a, b)    tiles with water in view (within SCENIC_RADIUS) count
+#                      SCENIC_DISCOUNT of a tile, so the lakeside road wins
+#
+#  add_tile() merges one new road tile in place. The tile becomes a node, a
+#  road it joins in the middle is split into two edges there, and one-tile
+#  edges link it to its neighbours. Nothing is rebuilt; only the cached
+#  searches are dropped.
+#
+#  tour() is the jeep tour. It takes the TOUR_STOPS lookouts (the nodes whose
+#  roads have the most water in view), drives to the nearest one not yet seen
+#  by the scenic route, and so on, then takes the shortest route to the exit.
+# ──────────────────────────────────────────────────────────────────────────────
+import heapq
+from collections import OrderedDict
+
+ROUTE_CACHE_SIZE = 32           # Search trees kept (least recently used dropped first)
+SCENIC_RADIUS = 3               # Tiles around a road tile in which water is in view
+SCENIC_DISCOUNT = 0.25          # Cost of a tile with a view, for scenic routes
+TOUR_STOPS = 3                  # Lookouts a jeep tour drives past
+
+_STEPS = ((1, 0), (-1, 0), (0, 1), (0, -1))
+_INF = float("inf")
+
+
+class RoadEdge:
+    __slots__ = ("a", "b", "cells", "length", "scenic", "view")
+
+    def __init__(self, cells: list, in_view: set):
+        self.a = cells[0]
+        self.b = cells[-1]
+        self.cells = cells
+        self.length = float(len(cells) - 1)
+        # A step costs the mean of its two tiles, so both directions cost the same
+        cost = [SCENIC_DISCOUNT if c in in_view else 1.0 for c in cells]
+        self.scenic = sum(cost[i] + cost[i + 1] for i in range(len(cells) - 1)) / 2
+        self.view = sum(1 for c in cells[1:-1] if c in in_view)
+
+
+class RoadGraph:
+    def __init__(self, cells, water=()):
+        self.cells: set = set(cells)
+        self.water: set = set(water)
+        self.in_view: set = {c for c in self.cells if self._sees_water(c)}
+        self.nodes: set = set()
+        self.edges: dict[int, RoadEdge] = {}
+        self.adj: dict = {}                 # node -> ids of the edges that touch it
+        self.on_edge: dict = {}             # cell inside an edge -> that edge's id
+        self.version = 0                    # bumped whenever a tile is added
+        self._next_id = 0
+        self._searches: OrderedDict = OrderedDict()
+        self._build()
+
+    # ──────────────────────────────────────────────────────────────────────────
+    # Building
+    # ──────────────────────────────────────────────────────────────────────────
+    def _sees_water(self, cell) -> bool:
+        x, y = cell
+        r = SCENIC_RADIUS
+        return any((x + dx, y + dy) in self.water
+                   for dy in range(-r, r + 1) for dx in range(-r, r + 1))
+
+    def _neighbours(self, cell) -> list:
+        x, y = cell
+        return [(x + dx, y + dy) for dx, dy in _STEPS if (x + dx, y + dy) in self.cells]
+
+    def _build(self) -> None:
+        for cell in sorted(self.cells):
+            if len(self._neighbours(cell)) != 2:
+                self._add_node(cell)
+        for node in sorted(self.nodes):
+            self._walk_from(node)
+        # Whatever is left lies on a loop without any junction: pin one node on each
+        for cell in sorted(self.cells):
+            if cell not in self.nodes and cell not in self.on_edge:
+                self._add_node(cell)
+                self._walk_from(cell)
+
+    def _add_node(self, cell) -> None:
+        self.nodes.add(cell)
+        self.adj.setdefault(cell, set())
+
+    def _walk_from(self, node) -> None:
+        """Add every edge leaving `node` that is not in the graph yet."""
+        for first in self._neighbours(node):
+            if first in self.on_edge:
+                continue                    # walked already, from the other end
+            if first in self.nodes:
+                if not any(self.edges[e].cells in ([node, first], [first, node]) for e in self.adj[first]):
+                    self._link([node, first])
+                continue
+            cells, prev, cur = [node], node, first
+            while cur not in self.nodes:
+                cells.append(cur)
+                prev, cur = cur, next(n for n in self._neighbours(cur) if n != prev)
+            cells.append(cur)
+            self._link(cells)
+
+    def _link(self, cells: list) -> int:
+        edge = RoadEdge(cells, self.in_view)
+        eid = self._next_id
+        self._next_id += 1
+        self.edges[eid] = edge
+        self.adj[edge.a].add(eid)
+        self.adj[edge.b].add(eid)
+        for c in cells[1:-1]:
+            self.on_edge[c] = eid
+        return eid
+
+    def _unlink(self, eid: int) -> RoadEdge:
+        edge = self.edges.pop(eid)
+        self.adj[edge.a].discard(eid)
+        self.adj[edge.b].discard(eid)
+        for c in edge.cells[1:-1]:
+            del self.on_edge[c]
+        return edge
+
+    def _split(self, cell) -> None:
+        """Make `cell`, inside an edge, a node; the edge becomes two."""
+        edge = self._unlink(self.on_edge[cell])
+        i = edge.cells.index(cell)
+        self._add_node(cell)
+        self._link(edge.cells[:i + 1])
+        self._link(edge.cells[i:])
+        self._searches.clear()              # cached trees name the old edge
+
+    def add_tile(self, cell) -> bool:
+        """Merge one new road tile into the graph; False if it is road already."""
+        cell = (int(cell[0]), int(cell[1]))
+        if cell in self.cells:
+            return False
+        self.cells.add(cell)
+        if self._sees_water(cell):
+            self.in_view.add(cell)
+        self._add_node(cell)
+        for n in self._neighbours(cell):
+            if n in self.on_edge:
+                self._split(n)
+            self._link([cell, n])
+        self.version += 1
+        self._searches.clear()
+        return True
+
+    # ──────────────────────────────────────────────────────────────────────────
+    # Queries
+    # ──────────────────────────────────────────────────────────────────────────
+    def nearest(self, cell):
+        """Road cell closest to `cell`, None without any road."""
+        if not self.cells:
+            return None
+        x, y = cell
+        return min(self.cells, key=lambda c: ((c[0] - x) ** 2 + (c[1] - y) ** 2, c))
+
+    def _search(self, source, scenic: bool):
+        """(cost, came_from) of every node reachable from `source`, cached."""
+        key = (source, scenic)
+        tree = self._searches.get(key)
+        if tree is not None:
+            self._searches.move_to_end(key)
+            return tree
+        cost = {source: 0.0}
+        came_from: dict = {}
+        open_ = [(0.0, source)]
+        while open_:
+            c, node = heapq.heappop(open_)
+            if c > cost[node]:
+                continue
+            for eid in sorted(self.adj[node]):
+                edge = self.edges[eid]
+                other = edge.b if edge.a == node else edge.a
+                nc = c + (edge.scenic if scenic else edge.length)
+                if nc < cost.get(other, _INF):
+                    cost[other] = nc
+                    came_from[other] = (eid, node)
+                    heapq.heappush(open_, (nc, other))
+        tree = (cost, came_from)
+        self._searches[key] = tree
+        if len(self._searches) > ROUTE_CACHE_SIZE:
+            self._searches.popitem(last=False)
+        return tree
+
+    def _route(self, a, b, scenic: bool):
+        if a not in self.cells or b not in self.cells:
+            return None
+        for cell in (a, b):
+            if cell not in self.nodes:
+                self._split(cell)
+        cost, came_from = self._search(a, scenic)
+        if b not in cost:
+            return None
+        cells = [b]
+        node = b
+        while node != a:
+            eid, prev = came_from[node]
+            edge = self.edges[eid]
+            run = edge.cells if edge.b == node else edge.cells[::-1]
+            cells.extend(reversed(run[:-1]))
+            node = prev
+        cells.reverse()
+        return cells
+
+    def shortest(self, a, b):
+        """Road cells from `a` to `b` by the fewest tiles, None if not connected."""
+        return self._route(a, b, False)
+
+    def scenic(self, a, b):
+        """Road cells from `a` to `b` favouring tiles with water in view, None if not connected."""
+        return self._route(a, b, True)
+
+    def _node_view(self, node) -> int:
+        return sum(self.edges[e].view for e in self.adj[node]) + (node in self.in_view)
+
+    def tour(self, entrance, exit_, stops: int = TOUR_STOPS):
+        """Road cells of a jeep tour from `entrance` past the lookouts to `exit_`, None if cut off."""
+        if entrance not in self.cells or exit_ not in self.cells:
+            return None
+        if entrance not in self.nodes:
+            self._split(entrance)
+        cost, _ = self._search(entrance, False)
+        lookouts = sorted((n for n in cost if n != entrance and self._node_view(n) > 0),
+                          key=lambda n: (-self._node_view(n), n))[:stops]
+        if not lookouts:                    # nothing to see: drive to the far end and back
+            far = max(cost, key=lambda n: (cost[n], n))
+            lookouts = [far] if far != entrance else []
+
+        cells, here = [entrance], entrance
+        while lookouts:
+            scenic_cost, _ = self._search(here, True)
+            stop = min(lookouts, key=lambda n: (scenic_cost[n], n))
+            lookouts.remove(stop)
+            cells += self.scenic(here, stop)[1:]
+            here = stop
+        back = self.shortest(here, exit_)
+        if back is None or len(cells) + len(back) <= 2:
+            return None
+        return cells + back[1:]
@@ -1,5 +1,4 @@
 import os, sys
-from random import randint, choice
 
 import pygame
 from pytmx.util_pygame import load_pygame
@@ -11,21 +10,49 @@ from src.model.animals import Carnivore, Herbivore, Omnivore, Animal
 from src.model.poacher import Poacher
 from src.utils.support import import_folder
 from src.utils.sound_manager import play_background_music
+from src.utils.rng import WorldRNG
 from src.view.storeUI import StoreUI
 from src.view.pauseMenu import PauseMenu
 from src.view.timeIndicator import TimeIndicator
 from src.view.dayNightCycle import DayNightCycle
-from src.model.jeep import Jeep
+from src.view.minimap import Minimap
+from src.view.statsChart import StatsChart
+from src.view.densityOverlay import DensityOverlay
+from src.controller.inputActions import InputActions
+from src.model.jeepFleet import JeepRoute, JeepFleet
+from src.model.roadGraph import RoadGraph
+from src.model.visitorDemand import VisitorDemand
+from src.model.statsRecorder import StatsRecorder
+from src.model.waterLayer import WaterLayer
+from src.model.autoSave import AutoSave
+from src.model.entityRegistry import EntityRegistry
+from src.model.pathfinder import Pathfinder
+from src.model.flowField import FlowFields
+from src.model.rangerDispatch import RangerDispatcher
+from src.model.patrolPlanner import PatrolPlanner, HEAT_SPAWN
+
+
+# Win conditions per difficulty: thresholds that must hold for `months` months in a row
+DIFFICULTY_LEVELS = {
+    'easy':    {'months': 3,  'visitors': 80,  'herbivores': 20, 'carnivores': 10, 'capital': 15000},
+    'medium':  {'months': 6,  'visitors': 100, 'herbivores': 30, 'carnivores': 15, 'capital': 20000},
+    'hard':    {'months': 12, 'visitors': 120, 'herbivores': 40, 'carnivores': 20, 'capital': 35000}
+}
 
 
 class Map:
     """Manages the terrain, all entities, and overlay UI for a single level."""
 
-    def __init__(self, difficulty: str, game_reference=None):
+    def __init__(self, difficulty: str, game_reference=None, seed: int | None = None):
         # ── Surfaces / Fonts ─────────────────────────────────────────
         self.display_surface = pygame.display.get_surface()
         self.font = pygame.font.Font(None, 24)
 
+        # ── Simulation clock & random streams ───────────────────────
+        self.rng = WorldRNG(seed)
+        self.sim_time = 0.0  # game seconds simulated so far (scaled by the speed multiplier)
+        self.recorder = None  # ReplayRecorder while a session is being recorded
+
         # ── Economy & Stats ─────────────────────────────────────────
         self.visitor_count = 0
         self.capital = 10_000
@@ -52,6 +79,8 @@ class Map:
         self.pause_menu     = PauseMenu(10, 10, 40, 40, "Pause", self.font, (0, 0, 0), game_reference)
         self.store_ui       = StoreUI(self)
         self.paused         = False
+        self.input          = InputActions()
+        self.autosave       = AutoSave()
         self.store_ui = StoreUI(self)
         self.store_ui.generate_animal_store_items()
         self.day_night_cycle = DayNightCycle(self, self.time_indicator)
@@ -75,36 +104,45 @@ class Map:
         self.tmx_items  = load_pygame(self.tmx)
         self.map_surface = pygame.image.load(self.png).convert_alpha()
         self.map_rect    = self.map_surface.get_rect(topleft=(0, 0))
+        self.minimap     = Minimap(self, self.map_surface)
+        self.minimap_rect = self.minimap.rect
 
         # ── Master Sprite Group And Collision Sprites ──────────────────────────────────────
         self.all_sprites = CameraGroup(self.map_rect.width, self.map_rect.height)
         self.collision_sprites = pygame.sprite.Group()
 
+        # ── Entity Collections ──────────────────────────────────────
+        # Map.animals, .herbivores, ... are the registry's lists under their old names
+        self.registry   = EntityRegistry()
+        self.animals    = self.registry.animals
+        self.herbivores = self.registry.herbivores
+        self.carnivores = self.registry.carnivores
+        self.omnivores  = self.registry.omnivores
+        self.rangers    = self.registry.rangers
+        self.poachers   = self.registry.poachers
+
         # ── Poacher Timing ──────────────────────────────────────────
-        self.poachers           = [] 
         self.poacher_timer      = 0.0
         self.poacher_add_time   = 60.0
         self.poacher_remove_time = 100.0
 
-        # ── Animal Collections ──────────────────────────────────────
-        self.herbivores = []
-        self.carnivores = []
-        self.omnivores  = []
-        self.animals    = []
-
         # ── Build World ─────────────────────────────────────────────
         self._setup_tiles_and_deco()
+        self.pathfinder = Pathfinder(self.map_rect, self.collision_sprites)
+        self.registry.pathfinder = self.pathfinder
+        self.flow_fields = FlowFields(self.pathfinder)
+        self.dispatcher = RangerDispatcher(self.pathfinder)
+        self.patrol = PatrolPlanner(self.pathfinder)
         self._spawn_entities()
+        self.stats = StatsRecorder()
+        self.stats_chart = StatsChart(self.stats)
+        self.density_overlay = DensityOverlay(self.map_rect.width, self.map_rect.height)
+        self.all_sprites.overlay = self.density_overlay
 
         # ── Win & loss condition ────────────────────────────────────
         self.win_streak_months = 0
         
-        difficulty_levels = {
-            'easy':    {'months': 3,  'visitors': 80,  'herbivores': 20, 'carnivores': 10, 'capital': 15000},
-            'medium':  {'months': 6,  'visitors': 100, 'herbivores': 30, 'carnivores': 15, 'capital': 20000},
-            'hard':    {'months': 12, 'visitors': 120, 'herbivores': 40, 'carnivores': 20, 'capital': 35000}
-        }
-        self.win_conditions = difficulty_levels[self.difficulty]
+        self.win_conditions = dict(DIFFICULTY_LEVELS[self.difficulty])
         self.game_result = None  # 'win' or 'loss'
         self.result_time = 0
         self.new_game_requested = False
@@ -131,7 +169,8 @@ class Map:
         body_shape: str = "normal",
         collision_sprites = None,
         group_type: str | None = None,
-        gender: str = None
+        gender: str = None,
+        variant: str | None = None
     ) -> Animal:
         """Central helper to create an animal, track it and add to the right lists."""
 
@@ -139,16 +178,13 @@ class Map:
             name, species, age, pos,
             self.all_sprites, self.map_rect, price,
             speed=speed, scale=scale, body_shape=body_shape,
-            group_type=group_type, gender=gender
+            group_type=group_type, gender=gender, variant=variant, rng=self.rng
         )
 
         # Assign tile collision group here 
         a.collision_sprites = self.collision_sprites
 
-        self.animals.append(a)
-        if   isinstance(a, Herbivore):  self.herbivores.append(a)
-        elif isinstance(a, Carnivore):  self.carnivores.append(a)
-        elif isinstance(a, Omnivore):   self.omnivores.append(a)
+        self.registry.add_animal(a)
         return a
 
     # ─────────────────────────────────────────────────────────────
@@ -169,26 +205,22 @@ class Map:
         for x, y, surf in self.tmx_items.get_layer_by_name('fence').tiles():
             Generic((x * TILE_SIZE, y * TILE_SIZE), surf, self.all_sprites)
 
-        # Road
-        self.road_positions = []
-
-       # Road tiles (visible + path)
-        # Load road tile positions for the Jeep path
-        if 'roadtiles' in self.tmx_items.layernames:
-            for obj in self.tmx_items.get_layer_by_name('roadtiles'):
-                if hasattr(obj, 'x') and hasattr(obj, 'y'):
-                    x = int(obj.x + obj.width // 2)
-                    y = int(obj.y + obj.height // 2)
-                    self.road_positions.append((x, y))
-
-            print(f"✅ Loaded {len(self.road_positions)} roadtiles from Tiled.")
-        else:
-            print("❌ 'roadtiles' layer missing from Tiled map!")
-
-        # THEN: Render the roadtiles so they appear on screen
+        # Road: render the roadtiles and compile them into the jeep road graph
+        road_cells = []
+        self.road_tile = None
         if 'roadtiles' in self.tmx_items.layernames:
             for x, y, surf in self.tmx_items.get_layer_by_name('roadtiles').tiles():
                 Generic((x * TILE_SIZE, y * TILE_SIZE), surf, self.all_sprites, z=LAYERS['road'])  # visual display
+                road_cells.append((x, y))
+                self.road_tile = self.road_tile or surf
+            print(f"✅ Loaded {len(road_cells)} roadtiles from Tiled.")
+        else:
+            print("❌ 'roadtiles' layer missing from Tiled map!")
+        # Lakes: water the grass layer does not cover
+        grass = {(x, y) for x, y, _ in self.tmx_items.get_layer_by_name('grass').tiles()}
+        lakes = [(x, y) for x, y, _ in self.tmx_items.get_layer_by_name('water').tiles() if (x, y) not in grass]
+        self.roads = RoadGraph(road_cells, lakes)
+        self.placed_roads = []          # road cells the player built, in order (saved)
         #path for the jeep
         self.jeep_path = []
         self.jeep_end_point = None
@@ -205,10 +237,10 @@ class Map:
         
         
         
-        # Water tiles (animated)
+        # Water tiles (animated by one shared clock, composited into chunks)
         water_frames = import_folder('src/assets/graphics/water')  # Fixed path
-        for x, y, surf in self.tmx_items.get_layer_by_name('water').tiles():
-            Water((x * TILE_SIZE, y * TILE_SIZE), water_frames, self.all_sprites)
+        water_tiles = [(x * TILE_SIZE, y * TILE_SIZE) for x, y, _ in self.tmx_items.get_layer_by_name('water').tiles()]
+        self.water_layer = WaterLayer(water_tiles, water_frames, self.all_sprites)
 
         # Trees
         for obj in self.tmx_items.get_layer_by_name('trees'):
@@ -261,10 +293,6 @@ class Map:
         for layer in ("house_floor", "house_walls", "fence", "tiles"):
             for x, y, surf in self.tmx_items.get_layer_by_name(layer).tiles():
                 Generic((x * TILE_SIZE, y * TILE_SIZE), surf, self.all_sprites, LAYERS["house_floor"])
-        water_frames = import_folder("src/assets/graphics/water")
-
-        for x, y, _ in self.tmx_items.get_layer_by_name("water").tiles():
-            Water((x * TILE_SIZE, y * TILE_SIZE), water_frames, self.all_sprites)
 
         for deco in ("flowers","mushrooms"):
             for obj in self.tmx_items.get_layer_by_name(deco):
@@ -278,18 +306,6 @@ class Map:
                 Tree((obj.x, obj.y), obj.image, [self.all_sprites, self.collision_sprites], obj.name)
             #elif obj.name == 'bush':
             #    Bush((obj.x, obj.y), obj.image, [self.all_sprites, self.collision_sprites])
-
-
-            # TILE-BASED road path
-            if 'roadtiles' in self.tmx_items.layernames:
-                for x, y, _ in self.tmx_items.get_layer_by_name('roadtiles').tiles():
-                    world_x = x * TILE_SIZE + TILE_SIZE // 2
-                    world_y = y * TILE_SIZE + TILE_SIZE // 2
-                    self.road_positions.append((world_x, world_y))
-
-                print(f"✅ Built path from {len(self.road_positions)} roadtiles.")
-            else:
-                print("❌ 'roadtiles' layer missing!")
     # ─────────────────────────────────────────────────────────────
     # Dynamic entities
     # ─────────────────────────────────────────────────────────────
@@ -301,8 +317,6 @@ class Map:
                 player_spawn = (obj.x, obj.y)
                 break  # Stop after first match
         # ── Rangers ───────────────────────────────────────────────
-        self.rangers = []
-
         # 1. Use spawn position from map if found
         if player_spawn:
             ranger = ControllableRanger(player_spawn, self.all_sprites, self.map_rect, self.collision_sprites)
@@ -310,14 +324,13 @@ class Map:
             # fallback to default position if not set
             ranger = ControllableRanger((740, 660), self.all_sprites, self.map_rect, self.collision_sprites)
 
-        self.rangers.append(ranger)
+        self.registry.add_ranger(ranger)
         self.ranger = ranger  # Set as active
+        ranger.set_controllable(True, self.input)
 
         # 2. Add the other (non-controllable) rangers as usual
-        self.rangers.append(Ranger((1200, 660), self.all_sprites, self.map_rect, self.collision_sprites))
-        self.rangers.append(Ranger((700,  720), self.all_sprites, self.map_rect, self.collision_sprites))
-        self.rangers.append(Ranger((1350, 760), self.all_sprites, self.map_rect, self.collision_sprites))
-        self.rangers.append(Ranger((1700,1250), self.all_sprites, self.map_rect, self.collision_sprites))
+        for pos in ((1200, 660), (700, 720), (1350, 760), (1700, 1250)):
+            self.registry.add_ranger(Ranger(pos, self.all_sprites, self.map_rect, self.collision_sprites))
         self.current_ranger_index = 0
 
         # ── Herbivores ───────────────────────────────────────────
@@ -368,118 +381,142 @@ class Map:
         self.add_animal(Omnivore, "Stretch3", "giraffe/2", 6,(1450, 850), price=350, speed=40, scale=1.6, body_shape="tall",   group_type="giraffe",gender="female")
         self.add_animal(Omnivore, "Stretch4", "giraffe/2", 6,(1490, 700), price=350, speed=40, scale=1.6, body_shape="tall",   group_type="giraffe",gender="male")
 
-        # ── Jeep ───────────────────────────────────────────────
+        # ── Jeeps ──────────────────────────────────────────────
         for obj in self.tmx_items.objects:
             if obj.name == "JeepStart":
                 x = int(obj.x + obj.width // 2)
                 y = int(obj.y + obj.height // 2)
                 print(f"🚙 Spawning Jeep at tile: ({x}, {y})")
                 self.jeep_start = (x, y)
-                self.jeep = Jeep((x, y), self.jeep_path, self.jeep_end_point, [self.all_sprites], map_ref=self)
+        self.visitors = VisitorDemand()
+        self.fleet = JeepFleet(self._jeep_route(), self.registry.jeeps, [self.all_sprites],
+                               map_ref=self, visitors=self.visitors)
+        if self.jeep_start is not None:
+            self.fleet.add()
     # ─────────────────────────────────────────────────────────────
     # Gameplay loop
     # ─────────────────────────────────────────────────────────────
     def switch_ranger(self):
-        pygame.time.wait(150)
-        old = self.rangers[self.current_ranger_index]
-        pos = old.pos
-        old.kill()
-        self.rangers[self.current_ranger_index] = Ranger(pos, self.all_sprites, self.map_rect, self.collision_sprites)
-
+        """Hand keyboard control to the next ranger; both rangers keep their state."""
+        self.ranger.set_controllable(False)
         self.current_ranger_index = (self.current_ranger_index + 1) % len(self.rangers)
-
-        new = self.rangers[self.current_ranger_index]
-        pos = new.pos
-        new.kill()
-        ctrl = ControllableRanger(pos, self.all_sprites, self.map_rect, self.collision_sprites)
-        self.rangers[self.current_ranger_index] = ctrl
-        self.ranger = ctrl
+        self.ranger = self.rangers[self.current_ranger_index]
+        self.ranger.set_controllable(True, self.input)
         self.all_sprites.reset_to_follow()
 
-    def run(self, dt: float, events):
+    def step(self, dt: float):
+        """
+        Advance the simulation by one tick without drawing anything.
+        run() calls this every unpaused frame; headless tools call it directly,
+        and with the same seed and inputs every call sequence replays identically.
+        """
+        if self.recorder:
+            self.recorder.stepped()
         adjusted_dt = dt * self.time_indicator.time_multiplier
+        self.sim_time += adjusted_dt
+        self.time_indicator.update(dt)
+        self.water_layer.update(adjusted_dt)
+
+        registry = self.registry
+        self.pathfinder.update()        # queued path searches, within the node budget
+
+        # ── Animals ────────────────────────────────────────────
+        # Babies are appended to `animals` during the pass; they start next tick
+        animals = registry.animals
+        registry.herds.update(adjusted_dt)
+        registry.breeding.begin_tick()
+        registry.proximity.begin_tick()
+        count = len(animals)
+        for i in range(count):
+            a = animals[i]
+            a.update(adjusted_dt, animals)
+            if not a.is_alive:
+                registry.despawn(a)
+                self.stats.deaths += 1
+        self.stats.births += len(animals) - count
+        for i in range(count, len(animals)):
+            baby = animals[i]
+            baby.collision_sprites = self.collision_sprites
+            registry.classify(baby)
+        registry.flush()
+
+        # ── Rangers, vehicles, ponds ───────────────────────────
+        # Dispatch first, so freed rangers pick up a poacher this tick. Combat
+        # pairs are built once here, after animals moved; rangers and poachers
+        # below only read their own view of them
+        self.dispatcher.update(registry.rangers, registry.poachers)
+        self.patrol.update(adjusted_dt, registry.rangers)
+        registry.combat.update(registry.rangers, registry.poachers, registry.animals)
+        for r in registry.rangers:
+            r.update(adjusted_dt, registry.combat)
+        self.visitors.update(adjusted_dt, self.sim_time, len(registry.species), len(animals),
+                             self.day_night_cycle.get_current_hour())
+        self.fleet.update(adjusted_dt)
+        for w in registry.ponds:
+            w.update(adjusted_dt)
+
+        if self.input.pressed('switch_ranger'):
+            self.switch_ranger()
+
+        # ── Poacher Logic ─────────────────────────────────────
+        self.poacher_timer += adjusted_dt
+        if self.poacher_timer >= self.poacher_add_time:
+            self.spawn_poacher()
+            self.poacher_timer = 0.0
+
+        # 1) DEAD poachers (health ≤ 0) move to corpses for their death animation
+        # 2) EXPIRED poachers (alive longer than poacher_remove_time) leave the map
+        for p in registry.poachers:
+            if p.health <= 0:
+                p.die()
+                registry.despawn(p)
+            elif self.sim_time - p.spawn_time >= self.poacher_remove_time:
+                p.kill()
+                registry.despawn(p)
+        registry.flush()
+
+        for poacher in registry.poachers:
+            kills = len(poacher.hunted_animals)
+            poacher.update(adjusted_dt, registry.combat, self.sim_time)
+            self.stats.poacher_kills += len(poacher.hunted_animals) - kills
+        for corpse in registry.corpses:
+            corpse.update(adjusted_dt)
+        for corpse in [c for c in registry.corpses if not c.alive()]:
+            registry.corpses.remove(corpse)
+
+        # ── Statistics (one sample per in-game hour) ──────────
+        clock = self.time_indicator
+        self.stats.update(int(clock.elapsed_seconds * clock.hours_per_day / clock.get_seconds_per_day()),
+                          self.capital, self.visitor_count,
+                          len(registry.herbivores), len(registry.carnivores), len(registry.omnivores))
+
+        # ── Game end conditions, autosave ─────────────────────
+        self.autosave.update()          # next chunk of a running capture, if any
+        self.check_win_loss(adjusted_dt)
+
+    def run(self, dt: float, events):
         self.all_sprites.handle_mouse_drag(events)
         self.display_surface.fill("black")
+        self.density_overlay.update(dt, self.animals)
         self.all_sprites.custom_draw(self.ranger)
         
 
         self.paused = self.pause_menu.menu_open
         if not self.paused:
-            self.time_indicator.update(dt)
-
-            # ── Update & prune animals ─────────────────────────────
-            for a in self.animals[:]:
-                a.update(adjusted_dt, self.animals)
-                if not a.is_alive:
-                    self.animals.remove(a)
-                    try:
-                        if isinstance(a, Herbivore):
-                            self.herbivores.remove(a)
-                        elif isinstance(a, Carnivore):
-                            self.carnivores.remove(a)
-                        elif isinstance(a, Omnivore):
-                            self.omnivores.remove(a)
-                    except ValueError:
-                            print(f"[WARN] Tried to remove {a.name} from specific list but it was not found (since it was only added in animals list not sublists).")
-
-
-            # ── Update everything else ─────────────────────────────
-            for s in self.all_sprites:
-                # if not isinstance(s, Animal):
-                #     s.update(adjusted_dt)
-
-                #     for s in self.all_sprites:
-                if isinstance(s, Ranger):
-                    s.update(adjusted_dt, self.poachers)
-                elif not isinstance(s, Animal):
-                    s.update(adjusted_dt)
-
-                if isinstance(s, Jeep):
-                    s.update(adjusted_dt)
-                    s.draw(self.display_surface, self.all_sprites.offset)
-
+            self.step(dt)
+            for j in self.registry.jeeps:
+                j.draw(self.display_surface, self.all_sprites.offset)
             self.all_sprites.handle_mouse_drag(events, allow_dragging=not bool(self.placement_mode))
 
-            if pygame.key.get_pressed()[pygame.K_TAB]:
-                self.switch_ranger()
-
-            ################################################################################
-            # ── Poacher Logic ─────────────────────────────────────            
-            self.poacher_timer += adjusted_dt
-            if self.poacher_timer >= self.poacher_add_time:
-                self.spawn_poacher()
-                self.poacher_timer = 0.0
-
-            # ──────────────────────────────────────────────────────────────
-            # 1) remove DEAD poachers (health ≤ 0)               NEW
-            # 2) remove EXPIRED poachers (spawned too long ago)  unchanged
-            # ──────────────────────────────────────────────────────────────
-            alive_poachers: list[Poacher] = []
-            for p in self.poachers:
-                if p.health <= 0:
-                    p.die()                               
-                    continue                             
-
-                # 2) over lifetime limit ?
-                lifetime_ms = pygame.time.get_ticks() - p.spawn_time
-                if lifetime_ms >= self.poacher_remove_time * 1000:
-                    p.kill()
-                    continue
-
-                # otherwise: still alive & inside lifetime – keep it
-                alive_poachers.append(p)
-
-            self.poachers = alive_poachers
-            ################################################################################
-
         # ── Always draw overlays ──────────────────────────────────
         self.day_night_cycle.draw(self.all_sprites.offset)
         self.time_indicator.draw(self.display_surface)
         self.pause_menu.draw(self.display_surface)
         self.display_surface.blit(self.day_night_icon, self.day_night_rect)
         self.store_ui.draw()
-        self.draw_minimap()
+        self.draw_minimap(dt)
         self.draw_stats_bar()
+        self.stats_chart.draw(self.display_surface)
         self.display_surface.blit(self.icon_day_night, self.day_night_rect)
 
         ################################################################################
@@ -493,12 +530,9 @@ class Map:
         # for poacher in self.poachers:
         #     poacher.draw_detection_range(self.display_surface, self.all_sprites.offset)
 
-        for poacher in self.poachers:
-            poacher.update(adjusted_dt, self.rangers, self.animals)
         ################################################################################
 
         # ── Always check game end conditions ──────────────────────
-        self.check_win_loss(adjusted_dt)
         self.draw_game_result()
         # Check game over click
         if self.game_result:
@@ -581,48 +615,137 @@ class Map:
                         cancel_btn = self.placement_buttons.get("cancel")
 
                         if place_btn and place_btn.collidepoint(event.pos):
-                            from src.model.sprites import Generic
-                            pos = self.placement_mode["target"]
-                            # Generic(pos, self.placement_mode["image"], self.all_sprites, z=LAYERS['main'])
-                            # self.capital -= self.placement_mode["price"]
-
-                            if self.placement_mode["type"] == 'tree' or self.placement_mode["type"] == 'flower':
-                                Tree(pos, self.placement_mode["image"], [self.all_sprites, self.collision_sprites], "big")
-                            elif self.placement_mode["type"] == 'pond':
-                                water_frames = import_folder("src/assets/graphics/water")
-                                Water(pos, water_frames, [self.all_sprites, self.collision_sprites], z=LAYERS["main"])
-
-                            #elif obj.name == 'bush':
-                            #    Bush(pos), self.placement_mode["image"], [self.all_sprites, self.collision_sprites])
-                            else:
-                                Generic(pos, self.placement_mode["image"], self.all_sprites, z=LAYERS['main'])
-                                self.capital -= self.placement_mode["price"]
-        
-
-                            # Reset target to allow placing again
-                            self.placement_mode["target"] = None
-                            self.placement_buttons = {}
+                            self.place_item(self.placement_mode["target"])
 
                         elif cancel_btn and cancel_btn.collidepoint(event.pos):
-                            self.placement_mode = None
-                            self.placement_buttons = {}
+                            self.cancel_placement()
 
     # ─────────────────────────────────────────────────────────────
     # Helpers
     # ─────────────────────────────────────────────────────────────
     def spawn_poacher(self):
         margin = 100
-        x = randint(margin, self.map_rect.width  - margin)
-        y = randint(margin, self.map_rect.height - margin)
-        p = Poacher((x, y), self.all_sprites, self.map_rect)
-        p.spawn_time = pygame.time.get_ticks()
+        x = self.rng.spawns.randint(margin, self.map_rect.width  - margin)
+        y = self.rng.spawns.randint(margin, self.map_rect.height - margin)
+        p = Poacher((x, y), self.all_sprites, self.map_rect, rng=self.rng)
+        p.spawn_time = self.sim_time
+        p.risk = self.patrol.heatmap
+        self.patrol.heatmap.add(p.pos, HEAT_SPAWN)
         self.poachers.append(p)
+        self.dispatcher.poacher_spawned(p, self.rangers)
+
+    def _jeep_route(self):
+        """Jeep tour over the road graph, or the hand-drawn jeep_path if the roads do not connect."""
+        if self.jeep_start is not None:
+            entrance = self.roads.nearest((self.jeep_start[0] // TILE_SIZE, self.jeep_start[1] // TILE_SIZE))
+            end = self.jeep_end_point or self.jeep_start
+            exit_ = self.roads.nearest((end[0] // TILE_SIZE, end[1] // TILE_SIZE))
+            cells = self.roads.tour(entrance, exit_) if entrance is not None else None
+            if cells:
+                half = TILE_SIZE // 2
+                return JeepRoute([(x * TILE_SIZE + half, y * TILE_SIZE + half) for x, y in cells],
+                                 start=self.jeep_start)
+        return JeepRoute(self.jeep_path, start=self.jeep_start)
+
+    def _record(self, command, *args):
+        """Log a player command for replay (see src/controller/replay.py)."""
+        if self.recorder:
+            self.recorder.command(command, *args)
 
     def toggle_day_night(self):
         """Toggle between day and night modes"""
         print("Map.toggle_day_night called")
+        self._record("toggle_day_night")
         is_night = self.day_night_cycle.toggle()
         return is_night
+
+    def set_time_mode(self, mode):
+        self._record("set_time_mode", mode)
+        self.time_indicator.time_mode = mode
+
+    def place_item(self, pos):
+        """Put the decoration currently in placement mode at world position `pos`."""
+        if not self.placement_mode:
+            return
+        self._record("place_item", tuple(pos))
+        from src.model.sprites import Generic
+
+        if self.placement_mode["type"] == 'tree' or self.placement_mode["type"] == 'flower':
+            tree = Tree(pos, self.placement_mode["image"], [self.all_sprites, self.collision_sprites], "big")
+            self.pathfinder.invalidate(tree.hitbox)
+        elif self.placement_mode["type"] == 'pond':
+            water_frames = import_folder("src/assets/graphics/water")
+            pond = Water(pos, water_frames, [self.all_sprites, self.collision_sprites], z=LAYERS["main"])
+            self.registry.ponds.append(pond)
+            self.pathfinder.invalidate(pond.hitbox)
+        elif self.placement_mode["type"] == 'road':
+            cell = (int((pos[0] + TILE_SIZE // 2) // TILE_SIZE), int((pos[1] + TILE_SIZE // 2) // TILE_SIZE))
+            if cell in self.roads.water or not self.pathfinder.walkable(cell):
+                print(f"Cannot build road on {cell}: water or blocked")
+            elif self.lay_road(cell, self.placement_mode["image"]):
+                self.capital -= self.placement_mode["price"]
+                self.fleet.set_route(self._jeep_route())
+
+        #elif obj.name == 'bush':
+        #    Bush(pos), self.placement_mode["image"], [self.all_sprites, self.collision_sprites])
+        else:
+            Generic(pos, self.placement_mode["image"], self.all_sprites, z=LAYERS['main'])
+            self.capital -= self.placement_mode["price"]
+
+        # Reset target to allow placing again
+        self.placement_mode["target"] = None
+        self.placement_buttons = {}
+
+    def lay_road(self, cell, image=None):
+        """Add one road tile the player built; False if the cell is road already."""
+        from src.model.sprites import Generic
+
+        if not self.roads.add_tile(cell):
+            return False
+        self.placed_roads.append(cell)
+        image = image or self.road_tile or pygame.Surface((TILE_SIZE, TILE_SIZE))
+        Generic((cell[0] * TILE_SIZE, cell[1] * TILE_SIZE), image, self.all_sprites, z=LAYERS['road'])
+        return True
+
+    def cancel_placement(self):
+        self._record("cancel_placement")
+        self.placement_mode = None
+        self.placement_buttons = {}
+
+    def sell_animal(self, animal):
+        """Remove `animal` from the park and refund its price."""
+        if animal not in self.animals:
+            return False
+        self._record("sell_animal", self.animals.index(animal))
+        self.capital += animal.price
+        self.registry.remove_animal(animal)
+        self.chipped_animals.discard(animal)
+        animal.kill()
+        return True
+
+    def order_rangers(self, indices, pos):
+        """Send the AI rangers at `indices` (into self.rangers) to world position `pos`."""
+        self._record("order_rangers", tuple(indices), tuple(pos))
+        field = self.flow_fields.get(pos)
+        for i in indices:
+            self.rangers[i].move_order = field
+
+    def order_herd(self, group_type, pos):
+        """Send the whole herd of `group_type` to `pos`; False if there is none or it cannot get there."""
+        self._record("order_herd", group_type, tuple(pos))
+        herd = self.registry.herds.herds.get(group_type)
+        if herd is None:
+            return False
+        field = self.flow_fields.get(pos)
+        if herd.leader is None or field.cost_at(herd.leader.pos) == float("inf"):
+            return False
+        herd.order(field)
+        return True
+
+    def chip_animal(self, animal, cost):
+        self._record("chip_animal", self.animals.index(animal), cost)
+        self.chipped_animals.add(animal)
+        self.capital -= cost
     
     def draw_placement_prompt(self, events):
         mouse = pygame.mouse.get_pos()
@@ -673,59 +796,9 @@ class Map:
         self.capital -= price
         self.placement_mode = None
 
-    def draw_minimap(self):
-        mini_w, mini_h = 250, 250
-        mini = pygame.Surface((mini_w, mini_h), pygame.SRCALPHA)
-        mini.fill((30, 30, 30, 180))
-
-        sx, sy = mini_w / self.map_rect.width, mini_h / self.map_rect.height
-
-        # Show animals:
-        visible_animals = self.animals if not self.day_night_cycle.is_night else self.chipped_animals
-        for a in visible_animals:
-            pygame.draw.circle(mini, (0, 200, 0), (int(a.rect.centerx * sx), int(a.rect.centery * sy)), 2)
-
-        # Show rangers
-        for idx, r in enumerate(self.rangers):
-            color = (255, 0, 0) if idx == self.current_ranger_index else (220, 220, 220)
-            pygame.draw.circle(mini, color, (int(r.rect.centerx * sx), int(r.rect.centery * sy)), 3)
-
-        # Camera view rectangle
-        offset_x = self.all_sprites.offset.x
-        offset_y = self.all_sprites.offset.y
-
-        view = pygame.Rect(
-            int(offset_x * sx),
-            int(offset_y * sy),
-            int(SCREEN_WIDTH * sx),
-            int(SCREEN_HEIGHT * sy)
-        )
-
-        view = pygame.Rect(int(offset_x * sx), int(offset_y * sy), int(SCREEN_WIDTH * sx), int(SCREEN_HEIGHT * sy))
-        pygame.draw.rect(mini, (255, 255, 0), view, 2)
-
-        # Draw border
-        pygame.draw.rect(mini, (255, 255, 255), mini.get_rect(), 2)
-
-        # ── Blit to screen
-        minimap_pos = (10, SCREEN_HEIGHT - mini_h - 10)
-        self.minimap_rect = pygame.Rect(minimap_pos, (mini_w, mini_h))  # <-- Store rect for click detection
-        self.display_surface.blit(mini, minimap_pos)
-
-        # ── Handle click on minimap
-        if pygame.mouse.get_pressed()[0]:  # left click
-            mouse_x, mouse_y = pygame.mouse.get_pos()
-            if self.minimap_rect.collidepoint(mouse_x, mouse_y):
-                rel_x = (mouse_x - self.minimap_rect.left) / mini_w
-                rel_y = (mouse_y - self.minimap_rect.top) / mini_h
-                map_x = rel_x * self.map_rect.width
-                map_y = rel_y * self.map_rect.height
-
-                # Set camera offset to center on clicked point
-                self.all_sprites.offset.x = max(0, min(map_x - SCREEN_WIDTH // 2, self.map_rect.width - SCREEN_WIDTH))
-                self.all_sprites.offset.y = max(0, min(map_y - SCREEN_HEIGHT // 2, self.map_rect.height - SCREEN_HEIGHT))
-
-                self.all_sprites.manual_override = True  # Activate manual drag mode
+    def draw_minimap(self, dt):
+        self.minimap.draw(self.display_surface, self.all_sprites.offset, dt)
+        self.minimap.handle_click(self.all_sprites)
 
     def draw_stats_bar(self):
         """Draws the top-right stats bar showing visitors, animals, rangers, poachers, and capital."""
@@ -770,11 +843,13 @@ class Map:
 
 
     def buy_item(self, item_type, animal_type=None, item_price=None):
+        self._record("buy_item", item_type, animal_type, item_price)
         decor_image_map = {
             "pond": "Water",
             "flower": "flower",
             "tree": "tree",
-            "bush": "bush"
+            "bush": "bush",
+            "road": "road"
         }
 
         prices = {
@@ -783,7 +858,8 @@ class Map:
             "pond": 100,
             "flower": 10,
             "tree": 50,
-            "bush": 25
+            "bush": 25,
+            "road": 20
         }
 
         if item_type != "animal" and item_type not in prices:
@@ -802,7 +878,7 @@ class Map:
             return False
 
         if item_type == 'animal':
-            pos = (randint(500, 1500), randint(500, 1500))
+            pos = (self.rng.spawns.randint(500, 1500), self.rng.spawns.randint(500, 1500))
             species_map = {
                 "cow": "cow",
                 "deer": "deer",
@@ -865,7 +941,10 @@ class Map:
             image_name = decor_image_map[item_type]
             image_path = f"src/assets/graphics/environment/{image_name}.png"
             try:
-                image = pygame.image.load(image_path).convert_alpha()
+                if item_type == 'road':         # one tile of the map's own road
+                    image = self.road_tile or pygame.Surface((TILE_SIZE, TILE_SIZE))
+                else:
+                    image = pygame.image.load(image_path).convert_alpha()
                 # IMPROVED: Initialize placement mode with cursor-following behavior
                 self.placement_mode = {
                     "type": item_type,
@@ -881,9 +960,14 @@ class Map:
                 print(f"Error loading {item_type}: {e}")
                 return False
 
+        elif item_type == 'jeep':
+            self.fleet.add()
+            self.capital -= price
+            return True
+
         elif item_type == 'ranger':
             ranger = Ranger((1000, 1000), self.all_sprites, self.map_rect, self.collision_sprites)
-            self.rangers.append(ranger)
+            self.registry.add_ranger(ranger)
             self.capital -= price
             return True
 
@@ -937,6 +1021,8 @@ class Map:
             if self.win_streak_months >= cond['months']:
                 print("🎉 Congratulations! You won the game!")
                 self.end_game("win")
+            else:
+                self.autosave.request(self)  # snapshot only; written off-thread
 
     def end_game(self, result):
         self.game_result = result  # 'win' or 'loss'
@@ -1010,6 +1096,7 @@ class CameraGroup(pygame.sprite.Group):
         self.dragging = False
         self.last_mouse_pos = pygame.Vector2()
         self.manual_override = False  # Enables drag-scroll override
+        self.overlay = None           # drawn over the ground layers, under everything else
 
     def handle_mouse_drag(self, events, allow_dragging=True):
         for event in events:
@@ -1040,8 +1127,16 @@ class CameraGroup(pygame.sprite.Group):
             self.offset.x = max(0, min(self.offset.x, self.map_width - SCREEN_WIDTH))
             self.offset.y = max(0, min(self.offset.y, self.map_height - SCREEN_HEIGHT))
 
+        view = pygame.Rect(self.offset.x, self.offset.y, SCREEN_WIDTH, SCREEN_HEIGHT)
+        overlay = self.overlay if self.overlay is not None and self.overlay.visible else None
         for sprite in sorted(self.sprites(), key=lambda s: getattr(s, 'z', s.rect.centery)):
+            if overlay is not None and getattr(sprite, 'z', sprite.rect.centery) > LAYERS['fence']:
+                overlay.draw(self.display_surface, self.offset)
+                overlay = None
+            if not view.colliderect(sprite.rect):
+                continue
             offset_rect = sprite.rect.copy()
             offset_rect.center -= self.offset
             self.display_surface.blit(sprite.image, offset_rect)
-
+        if overlay is not None:
+            overlay.draw(self.display_surface, self.offset)
@@ -0,0 +1,379 @@
+# ──────────────────────────────────────────────────────────────────────────────
+#  saveGame.py – compact binary snapshots of a running park
+# ──────────────────────────────────────────────────────────────────────────────
+#  capture_snapshot(map)  → ParkSnapshot (plain tuples, no sprite references)
+#  SnapshotCapture(map)   → the same, CAPTURE_CHUNK animals per step()
+#  encode_snapshot(snap)  → bytes        (fixed-size struct records)
+#  decode_snapshot(data)  → ParkSnapshot
+#  apply_snapshot(map, s) → rebuilds entities on an existing Map
+#
+#  File layout (little endian):
+#      header   magic b"SAFR", u16 version, u16 reserved
+#      world    capital, visitors, clock, win streak, timers, control state
+#      counts   strings, animals, rangers, poachers, jeeps, roads
+#      strings  u16 length + utf-8 bytes each (names, species, groups …)
+#      records  animals, rangers, poachers, jeeps, roads – one struct each
+# ──────────────────────────────────────────────────────────────────────────────
+import os
+import struct
+import zlib
+from typing import NamedTuple
+
+from src.model.animals import Herbivore, Carnivore, Omnivore
+from src.model.rangers import Ranger
+from src.model.poacher import Poacher
+
+SAVE_MAGIC = b"SAFR"
+SAVE_VERSION = 5
+SAVE_DIR = "saves"
+QUICKSAVE_PATH = os.path.join(SAVE_DIR, "quicksave.sav")
+CAPTURE_CHUNK = 200             # Animals a SnapshotCapture copies per tick (under 1 ms)
+
+# --------------------------------------------------------------------------- #
+#  Record layouts                                                             #
+# --------------------------------------------------------------------------- #
+_HEADER = struct.Struct("<4sHH")
+# capital, visitors, elapsed_seconds, time_mode, time_multiplier, win_streak,
+# month_timer, poacher_timer, current_ranger, weapon_index, difficulty (string id),
+# visitors queued at the entrance, fraction of a visitor still to arrive
+_WORLD = struct.Struct("<didBfHffBBHHf")
+# strings, animals, rangers, poachers, jeeps, roads
+_COUNTS = struct.Struct("<IIIIII")
+_STRING_LEN = struct.Struct("<H")
+# kind, name, species, group_type, variant, body_shape, gender, flags, facing,
+# age, age_clock, price, speed, base_scale, scale, health, hunger, thirst,
+# x, y, gestation, father, mother, leader
+_ANIMAL = struct.Struct("<B5H3B2fi9f3i")
+# x, y, health, weapon_id
+_RANGER = struct.Struct("<3fB")
+# x, y, health, simulated seconds since spawn
+_POACHER = struct.Struct("<4f")
+# distance along the route, at_depot, tourists, ready_to_depart, boarding_timer
+# (depot queue first, then running jeeps in departure order)
+_JEEP = struct.Struct("<fBBBf")
+# tile x, y of a road the player built (in building order)
+_ROAD = struct.Struct("<hh")
+
+ANIMAL_KINDS = (Herbivore, Carnivore, Omnivore)
+GENDERS = ("male", "female")
+
+PREGNANT, CHIPPED, FLEEING, IDLING, GONE = 1, 2, 4, 8, 16
+NO_LINK = -1
+
+
+class SaveError(Exception):
+    """Raised when a save file is missing, truncated or from another format."""
+
+
+class ParkSnapshot(NamedTuple):
+    """Immutable copy of the park state; safe to hand to another thread."""
+    world: tuple
+    strings: tuple
+    animals: tuple
+    rangers: tuple
+    poachers: tuple
+    jeeps: tuple
+    roads: tuple = ()
+
+    @property
+    def difficulty(self) -> str:
+        return self.strings[self.world[10]]
+
+
+# --------------------------------------------------------------------------- #
+#  Capture                                                                    #
+# --------------------------------------------------------------------------- #
+def capture_snapshot(game_map) -> ParkSnapshot:
+    """Copy everything a save needs out of `game_map` into plain tuples."""
+    capture = SnapshotCapture(game_map, chunk=len(game_map.animals) + 1)
+    snapshot = capture.step()
+    while snapshot is None:
+        snapshot = capture.step()
+    return snapshot
+
+
+class SnapshotCapture:
+    """
+    capture_snapshot() spread over several ticks, for the autosave.
+    - Each step() copies up to `chunk` animals. The step after the last
+      chunk adds the rangers, poachers, jeeps and world counters and
+      returns the snapshot.
+    - The animal list is frozen when the capture starts, so indices and
+      links stay valid. Animals gone by the last step are kept as GONE
+      records, which apply_snapshot() skips. Babies born meanwhile are
+      not saved.
+    """
+
+    def __init__(self, game_map, chunk: int = CAPTURE_CHUNK):
+        self.map = game_map
+        self.chunk = chunk
+        self.animals = tuple(game_map.animals)
+        self.index_of = game_map.animals.slots()
+        self.strings: dict[str, int] = {}
+        self.records: list = []
+
+    def intern(self, text) -> int:
+        text = text or ""
+        index = self.strings.get(text)
+        if index is None:
+            index = self.strings[text] = len(self.strings)
+        return index
+
+    def link(self, other) -> int:
+        return NO_LINK if other is None else self.index_of.get(other, NO_LINK)
+
+    def step(self) -> ParkSnapshot | None:
+        done = len(self.records)
+        if done < len(self.animals):
+            self._copy_animals(self.animals[done:done + self.chunk])
+            return None
+        return self._finish()
+
+    def _copy_animals(self, animals) -> None:
+        intern, link = self.intern, self.link
+        chipped = self.map.chipped_animals
+        append = self.records.append
+        for a in animals:
+            kind = 0 if isinstance(a, Herbivore) else 1 if isinstance(a, Carnivore) else 2
+            flags = ((PREGNANT if a.is_pregnant else 0) | (CHIPPED if a in chipped else 0) |
+                     (FLEEING if a.fleeing else 0) | (IDLING if a.idle else 0))
+            append((
+                kind, intern(a.name), intern(a.species), intern(a.group_type),
+                intern(a.variant), intern(a.body_shape),
+                GENDERS.index(a.gender), flags, a.status,
+                a.age, a.age_clock, int(a.price), a.speed, a.base_scale, a.scale,
+                a.health, a.hunger_level, a.thirst_level,
+                a.pos.x, a.pos.y, a.gestation_timer,
+                link(a._stored_father), link(a.mother), link(a.herd_leader),
+            ))
+
+    def _finish(self) -> ParkSnapshot:
+        game_map = self.map
+        records = self.records
+        for a in self.index_of.keys() - game_map.animals.slots().keys():
+            i = self.index_of[a]
+            records[i] = records[i][:7] + (records[i][7] | GONE,) + records[i][8:]
+
+        now = game_map.sim_time
+        rangers = tuple((r.pos.x, r.pos.y, r.health, r.weapon_id) for r in game_map.rangers)
+        poachers = tuple(
+            (p.pos.x, p.pos.y, p.health, now - getattr(p, "spawn_time", now))
+            for p in game_map.poachers if not p.dying
+        )
+
+        jeeps = game_map.fleet.states()
+
+        clock = game_map.time_indicator
+        world = (
+            game_map.capital, game_map.visitor_count, clock.elapsed_seconds,
+            clock.time_modes.index(clock.time_mode), clock.time_multiplier,
+            game_map.win_streak_months, getattr(game_map, "month_timer", 0.0),
+            game_map.poacher_timer, game_map.current_ranger_index,
+            Ranger.current_weapon_index, self.intern(clock.difficulty),
+            game_map.visitors.waiting, game_map.visitors.carry,
+        )
+        return ParkSnapshot(world, tuple(self.strings), tuple(records), rangers, poachers, jeeps,
+                            tuple(game_map.placed_roads))
+
+
+# --------------------------------------------------------------------------- #
+#  Binary encoding                                                            #
+# --------------------------------------------------------------------------- #
+def encode_snapshot(snapshot: ParkSnapshot) -> bytes:
+    encoded = [s.encode("utf-8") for s in snapshot.strings]
+    parts = [
+        _HEADER.pack(SAVE_MAGIC, SAVE_VERSION, 0),
+        _WORLD.pack(*snapshot.world),
+        _COUNTS.pack(len(encoded), len(snapshot.animals), len(snapshot.rangers),
+                     len(snapshot.poachers), len(snapshot.jeeps), len(snapshot.roads)),
+    ]
+    for raw in encoded:
+        parts.append(_STRING_LEN.pack(len(raw)))
+        parts.append(raw)
+    parts.extend(_ANIMAL.pack(*a) for a in snapshot.animals)
+    parts.extend(_RANGER.pack(*r) for r in snapshot.rangers)
+    parts.extend(_POACHER.pack(*p) for p in snapshot.poachers)
+    parts.extend(_JEEP.pack(*j) for j in snapshot.jeeps)
+    parts.extend(_ROAD.pack(*r) for r in snapshot.roads)
+    return b"".join(parts)
+
+
+def _records(layout: struct.Struct, data: bytes, offset: int, count: int) -> tuple[tuple, int]:
+    end = offset + layout.size * count
+    if end > len(data):
+        raise SaveError("save file is truncated")
+    return tuple(layout.iter_unpack(data[offset:end])), end
+
+
+def decode_snapshot(data: bytes) -> ParkSnapshot:
+    if len(data) < _HEADER.size + _WORLD.size + _COUNTS.size:
+        raise SaveError("save file is truncated")
+    magic, version, _ = _HEADER.unpack_from(data, 0)
+    if magic != SAVE_MAGIC:
+        raise SaveError("not a Safari Park save file")
+    if version != SAVE_VERSION:
+        raise SaveError(f"unsupported save version {version}")
+
+    offset = _HEADER.size
+    world = _WORLD.unpack_from(data, offset)
+    offset += _WORLD.size
+    n_strings, n_animals, n_rangers, n_poachers, n_jeeps, n_roads = _COUNTS.unpack_from(data, offset)
+    offset += _COUNTS.size
+
+    strings = []
+    for _ in range(n_strings):
+        (length,) = _STRING_LEN.unpack_from(data, offset)
+        offset += _STRING_LEN.size
+        strings.append(data[offset:offset + length].decode("utf-8"))
+        offset += length
+
+    animals, offset = _records(_ANIMAL, data, offset, n_animals)
+    rangers, offset = _records(_RANGER, data, offset, n_rangers)
+    poachers, offset = _records(_POACHER, data, offset, n_poachers)
+    jeeps, offset = _records(_JEEP, data, offset, n_jeeps)
+    roads, offset = _records(_ROAD, data, offset, n_roads)
+    return ParkSnapshot(world, tuple(strings), animals, rangers, poachers, jeeps, roads)
+
+
+# --------------------------------------------------------------------------- #
+#  Restore                                                                    #
+# --------------------------------------------------------------------------- #
+def apply_snapshot(game_map, snapshot: ParkSnapshot) -> None:
+    """Replace the entities and counters of `game_map` with the snapshot's."""
+    strings = snapshot.strings
+    if game_map.recorder:
+        game_map.recorder.detach("park state replaced by a saved game")
+
+    # ── Animals ───────────────────────────────────────────────
+    for a in game_map.animals:
+        a.kill()
+    game_map.registry.clear_animals()
+    game_map.chipped_animals.clear()
+
+    restored = []
+    for (kind, name, species, group_type, variant, body_shape, gender, flags, facing,
+         age, age_clock, price, speed, base_scale, scale, health, hunger, thirst,
+         x, y, gestation, _father, _mother, _leader) in snapshot.animals:
+        if flags & GONE:                # died or sold while an autosave was captured
+            restored.append(None)
+            continue
+        # Built at its current scale so the cached frames of that size are reused
+        a = game_map.add_animal(
+            ANIMAL_KINDS[kind], strings[name], strings[species], age, (x, y), price,
+            speed=speed, scale=scale, body_shape=strings[body_shape],
+            group_type=strings[group_type], gender=GENDERS[gender], variant=strings[variant],
+        )
+        a.base_scale = base_scale
+        a.age_clock = age_clock
+        a.health, a.hunger_level, a.thirst_level = health, hunger, thirst
+        a.is_pregnant = bool(flags & PREGNANT)
+        a.gestation_timer = gestation
+        a.fleeing = bool(flags & FLEEING)
+        a.idle = bool(flags & IDLING)
+        a.status = facing
+        if flags & CHIPPED:
+            game_map.chipped_animals.add(a)
+        restored.append(a)
+
+    for a, record in zip(restored, snapshot.animals):
+        if a is None:
+            continue
+        father, mother, leader = record[-3:]
+        a._stored_father = restored[father] if father != NO_LINK else None
+        a.mother = restored[mother] if mother != NO_LINK else None
+        if leader != NO_LINK and a.herd is not None and restored[leader] in a.herd.members:
+            a.herd.leader = restored[leader]
+
+    # ── Rangers ───────────────────────────────────────────────
+    for r, (x, y, health, weapon_id) in zip(game_map.rangers, snapshot.rangers):
+        r.pos.update(x, y)
+        r.rect.center = r.pos
+        r.hitbox.center = r.rect.center
+        r.health = health
+        r.weapon_id = weapon_id
+        r.weapon = Ranger.WEAPON_TYPES[weapon_id]
+
+    # ── Poachers ──────────────────────────────────────────────
+    for p in (*game_map.poachers, *game_map.registry.corpses):
+        p.kill()
+    game_map.poachers.clear()
+    game_map.registry.corpses.clear()
+    for x, y, health, age in snapshot.poachers:
+        p = Poacher((x, y), game_map.all_sprites, game_map.map_rect, rng=game_map.rng)
+        p.health = health
+        p.spawn_time = game_map.sim_time - age
+        p.risk = game_map.patrol.heatmap
+        game_map.poachers.append(p)
+
+    # ── Roads, then the jeeps that drive on them ──────────────
+    if any([game_map.lay_road(tuple(cell)) for cell in snapshot.roads]):
+        game_map.fleet.set_route(game_map._jeep_route())
+    game_map.fleet.restore(snapshot.jeeps)
+
+    # ── World counters ────────────────────────────────────────
+    (capital, visitors, elapsed, time_mode, multiplier, win_streak,
+     month_timer, poacher_timer, current_ranger, weapon_index, _, queued, carry) = snapshot.world
+    game_map.capital = int(capital) if capital.is_integer() else capital
+    game_map.visitor_count = visitors
+    game_map.win_streak_months = win_streak
+    game_map.month_timer = month_timer
+    game_map.poacher_timer = poacher_timer
+    game_map.visitors.restore(queued, carry)
+
+    clock = game_map.time_indicator
+    clock.elapsed_seconds = elapsed
+    clock.time_mode = clock.time_modes[time_mode]
+    clock.time_multiplier = multiplier
+    clock._update_time_values()
+
+    Ranger.current_weapon_index = weapon_index
+    game_map.ranger.set_controllable(False)
+    game_map.current_ranger_index = min(current_ranger, len(game_map.rangers) - 1)
+    game_map.ranger = game_map.rangers[game_map.current_ranger_index]
+    game_map.ranger.set_controllable(True, game_map.input)
+    game_map.all_sprites.reset_to_follow()
+
+
+# --------------------------------------------------------------------------- #
+#  Files                                                                      #
+# --------------------------------------------------------------------------- #
+def save_game(game_map, path: str = QUICKSAVE_PATH) -> int:
+    """Write the park to `path`; returns the number of bytes written."""
+    data = encode_snapshot(capture_snapshot(game_map))
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    with open(path, "wb") as f:
+        f.write(data)
+    return len(data)
+
+
+def read_snapshot(path: str = QUICKSAVE_PATH) -> ParkSnapshot:
+    """Read a plain or zlib-compressed (autosave) snapshot from `path`."""
+    try:
+        with open(path, "rb") as f:
+            data = f.read()
+    except OSError as e:
+        raise SaveError(f"cannot read save file {path}: {e}") from e
+    if not data.startswith(SAVE_MAGIC):
+        try:
+            data = zlib.decompress(data)
+        except zlib.error as e:
+            raise SaveError("not a Safari Park save file") from e
+    return decode_snapshot(data)
+
+
+def load_game(path: str = QUICKSAVE_PATH, game_reference=None, current_map=None):
+    """
+    Restore a saved park. The current map is reused when it has the same
+    difficulty (no terrain reload); otherwise a fresh Map is built first.
+    """
+    from src.model.safariMap import Map  # safariMap imports the UI that imports us
+
+    snapshot = read_snapshot(path)
+    if current_map is not None and current_map.recorder:
+        current_map.recorder.detach("park state replaced by a saved game")
+    # Built roads cannot be torn up again, so a map with roads the save lacks is replaced
+    if (current_map is None or current_map.difficulty != snapshot.difficulty.lower() or
+            not set(current_map.placed_roads) <= set(snapshot.roads)):
+        current_map = Map(difficulty=snapshot.difficulty, game_reference=game_reference)
+    apply_snapshot(current_map, snapshot)
+    return current_map
@@ -0,0 +1,116 @@
+# ──────────────────────────────────────────────────────────────────────────────
+#  statsRecorder.py – park history in fixed-size NumPy ring buffers
+# ──────────────────────────────────────────────────────────────────────────────
+#  Map.step() hands the recorder the in-game hour and the current totals every
+#  tick. Each time a new hour starts, one row of METRICS is written:
+#
+#      stocks   capital, visitors, herbivores, carnivores, omnivores
+#               (the value at the end of the hour)
+#      flows    births, deaths, poacher_kills (events during the hour; Map
+#               adds them to the running totals as they happen)
+#
+#  Rows go into three rings: hourly, daily and monthly. Every 24 hours a row
+#  for the day is written, with stocks averaged and flows summed, and every
+#  DAYS_PER_MONTH days one for the month. Each row costs O(1), and the rings
+#  never grow, so memory is the same after an hour or a year of play.
+#
+#  RingBuffer.column() returns one metric oldest-first, for StatsChart.
+# ──────────────────────────────────────────────────────────────────────────────
+import numpy as np
+
+METRICS = ("capital", "visitors", "herbivores", "carnivores", "omnivores",
+           "births", "deaths", "poacher_kills")
+FLOWS = ("births", "deaths", "poacher_kills")
+
+HOURS_PER_DAY = 24
+DAYS_PER_MONTH = 30             # Same calendar as TimeIndicator
+HOURS_KEPT = HOURS_PER_DAY * DAYS_PER_MONTH * 2
+DAYS_KEPT = DAYS_PER_MONTH * 12
+MONTHS_KEPT = 120
+MAX_CATCH_UP = HOURS_PER_DAY * DAYS_PER_MONTH   # Hours filled in after a jump of the clock
+
+
+class RingBuffer:
+    __slots__ = ("data", "head", "count", "total")
+
+    def __init__(self, capacity: int, width: int):
+        self.data = np.zeros((capacity, width))
+        self.head = 0                       # row written next
+        self.count = 0                      # rows held, at most capacity
+        self.total = 0                      # rows ever written
+
+    def push(self, row) -> None:
+        self.data[self.head] = row
+        self.head = (self.head + 1) % len(self.data)
+        self.count = min(self.count + 1, len(self.data))
+        self.total += 1
+
+    def column(self, index: int) -> np.ndarray:
+        """Metric `index` of every row held, oldest first."""
+        if self.count < len(self.data):
+            return self.data[:self.count, index]
+        return np.concatenate((self.data[self.head:, index], self.data[:self.head, index]))
+
+
+class StatsRecorder:
+    def __init__(self):
+        width = len(METRICS)
+        self.hourly = RingBuffer(HOURS_KEPT, width)
+        self.daily = RingBuffer(DAYS_KEPT, width)
+        self.monthly = RingBuffer(MONTHS_KEPT, width)
+
+        # Running totals of the flows, raised by Map as events happen
+        self.births = 0
+        self.deaths = 0
+        self.poacher_kills = 0
+
+        self.hour: int | None = None        # last hour sampled
+        self._flows = np.array([m in FLOWS for m in METRICS])
+        self._flows_seen = np.zeros(len(FLOWS))
+        self._day = np.zeros(width)         # running sums of the open day / month
+        self._day_rows = 0
+        self._month = np.zeros(width)
+        self._month_rows = 0
+
+    def update(self, hour: int, capital, visitors, herbivores, carnivores, omnivores) -> None:
+        """Call every tick with the in-game hour count; samples when a new hour starts."""
+        if self.hour is None or hour < self.hour:   # first tick, or a save was loaded
+            self.hour = hour
+            return
+        if hour == self.hour:
+            return
+
+        totals = np.array((self.births, self.deaths, self.poacher_kills), dtype=float)
+        row = np.empty(len(METRICS))
+        row[:5] = capital, visitors, herbivores, carnivores, omnivores
+        row[5:] = totals - self._flows_seen
+        self._flows_seen = totals
+
+        start = max(self.hour + 1, hour - MAX_CATCH_UP + 1)
+        for h in range(start, hour + 1):
+            self._sample(h, row)
+            row[5:] = 0.0                   # the events belong to the first hour only
+        self.hour = hour
+
+    def _sample(self, hour: int, row: np.ndarray) -> None:
+        self.hourly.push(row)
+        self._day += row
+        self._day_rows += 1
+        if hour % HOURS_PER_DAY != HOURS_PER_DAY - 1:
+            return
+        day = self._close(self._day, self._day_rows)
+        self.daily.push(day)
+        self._day[:] = 0.0
+        self._day_rows = 0
+
+        self._month += day
+        self._month_rows += 1
+        if (hour // HOURS_PER_DAY) % DAYS_PER_MONTH != DAYS_PER_MONTH - 1:
+            return
+        self.monthly.push(self._close(self._month, self._month_rows))
+        self._month[:] = 0.0
+        self._month_rows = 0
+
+    def _close(self, sums: np.ndarray, rows: int) -> np.ndarray:
+        """Row for a finished period: flows summed, stocks averaged."""
+        return np.where(self._flows, sums, sums / max(rows, 1))
@@ -0,0 +1,98 @@
+# ──────────────────────────────────────────────────────────────────────────────
+#  visitorDemand.py – tourist arrivals and the queue at the park entrance
+# ──────────────────────────────────────────────────────────────────────────────
+#  Tourists arrive at VISITOR_PEAK_RATE per game second at most, scaled by
+#  how much the park has to show and the hour:
+#
+#      diversity   species / (species + DIVERSITY_HALF)
+#      population  animals / (animals + POPULATION_HALF)
+#      daylight    0 while the park is closed (outside OPEN_HOURS), rising to
+#                  1 at midday
+#
+#  update() turns rate * dt into whole visitors and carries the fraction over
+#  to the next tick. One tick at 10x speed brings the same visitors as ten
+#  ticks at 1x, and no random draw is involved. Each tick's arrivals join the
+#  queue as one batch. Visitors who find QUEUE_CAPACITY people waiting turn
+#  away, and those who wait longer than VISITOR_PATIENCE give up and leave.
+#
+#  JeepFleet boards the front jeep with take(). The Map counts boarded
+#  tourists in visitor_count, and each pays SAFARI_PASS when its jeep is back
+#  (see jeep.py).
+# ──────────────────────────────────────────────────────────────────────────────
+import math
+from collections import deque
+
+VISITOR_PEAK_RATE = 0.5         # Visitors per game second, at noon in a full park
+DIVERSITY_HALF = 8              # Species for half the demand
+POPULATION_HALF = 20            # Animals for half the demand
+OPEN_HOURS = (5.0, 21.0)        # Gate opening and closing hour (matches daytime)
+QUEUE_CAPACITY = 40             # Visitors waiting before newcomers turn away
+VISITOR_PATIENCE = 90.0         # Game seconds a visitor waits for a jeep
+
+
+class VisitorDemand:
+    def __init__(self):
+        self.queue: deque = deque()         # [arrival time, visitors] batches, oldest first
+        self.waiting = 0
+        self.carry = 0.0                    # fraction of a visitor owed to the next tick
+        self.now = 0.0
+        # Totals since the park opened
+        self.arrived = 0
+        self.turned_away = 0
+        self.gave_up = 0
+
+    @staticmethod
+    def rate(species: int, animals: int, hour: float) -> float:
+        """Visitors per game second for a park with `species` kinds of `animals` at `hour`."""
+        opens, closes = OPEN_HOURS
+        if not opens <= hour < closes or animals <= 0:
+            return 0.0
+        daylight = math.sin(math.pi * (hour - opens) / (closes - opens))
+        diversity = species / (species + DIVERSITY_HALF)
+        population = animals / (animals + POPULATION_HALF)
+        return VISITOR_PEAK_RATE * diversity * population * daylight
+
+    def update(self, dt: float, now: float, species: int, animals: int, hour: float) -> int:
+        """Advance to game time `now`; returns the visitors who joined the queue this tick."""
+        self.now = now
+        while self.queue and now - self.queue[0][0] > VISITOR_PATIENCE:
+            _, count = self.queue.popleft()
+            self.waiting -= count
+            self.gave_up += count
+
+        self.carry += self.rate(species, animals, hour) * dt
+        batch = int(self.carry)
+        if batch <= 0:
+            return 0
+        self.carry -= batch
+        admitted = min(batch, QUEUE_CAPACITY - self.waiting)
+        self.turned_away += batch - admitted
+        if admitted > 0:
+            self.queue.append([now, admitted])
+            self.waiting += admitted
+            self.arrived += admitted
+        return admitted
+
+    def take(self, wanted: int) -> int:
+        """Board up to `wanted` visitors from the front of the queue; returns how many."""
+        taken = 0
+        while self.queue and taken < wanted:
+            batch = self.queue[0]
+            n = min(batch[1], wanted - taken)
+            batch[1] -= n
+            taken += n
+            if batch[1] == 0:
+                self.queue.popleft()
+        self.waiting -= taken
+        return taken
+
+    # ──────────────────────────────────────────────────────────────────────────
+    # Save / restore
+    # ──────────────────────────────────────────────────────────────────────────
+    def restore(self, waiting: int, carry: float) -> None:
+        """Reload a saved queue; the waiting visitors count as arrived just now."""
+        self.queue.clear()
+        self.waiting = min(int(waiting), QUEUE_CAPACITY)
+        if self.waiting:
+            self.queue.append([self.now, self.waiting])
+        self.carry = carry
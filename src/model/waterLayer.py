@@ -0,0 +1,64 @@
+import pygame
+from src.config.settings import *
+from src.model.sprites import Generic
+
+WATER_CHUNK_TILES = 8        # chunk edge length in tiles
+WATER_ANIMATION_SPEED = 4    # frames per second (same as Water.animate)
+
+
+class WaterChunk(Generic):
+    """One pre-composited block of water tiles; its image is swapped by WaterLayer."""
+
+    def __init__(self, pos, frames, groups):
+        self.frames = frames
+        super().__init__(pos=pos, surf=frames[0], groups=groups, z=LAYERS['water'])
+
+
+class WaterLayer:
+    """
+    All static water tiles of the map, animated by a single shared clock.
+
+    Every water frame is composited over the chunk's water mask once, at load
+    time, so advancing the animation only swaps each chunk's image when the
+    frame index actually changes.
+    """
+
+    def __init__(self, tile_positions, frames, groups, chunk_tiles=WATER_CHUNK_TILES):
+        self.frames = frames
+        self.frame_index = 0.0
+        self.current_frame = 0
+        self.chunks: list[WaterChunk] = []
+
+        if not frames:
+            return
+
+        chunk_px = chunk_tiles * TILE_SIZE
+        cells: dict[tuple[int, int], list[tuple[int, int]]] = {}
+        for x, y in tile_positions:
+            cells.setdefault((x // chunk_px, y // chunk_px), []).append((x, y))
+
+        for tiles in cells.values():
+            left = min(x for x, _ in tiles)
+            top = min(y for _, y in tiles)
+            width = max(x for x, _ in tiles) + TILE_SIZE - left
+            height = max(y for _, y in tiles) + TILE_SIZE - top
+
+            chunk_frames = []
+            for frame in frames:
+                surf = pygame.Surface((width, height), pygame.SRCALPHA)
+                surf.blits([(frame, (x - left, y - top)) for x, y in tiles], doreturn=False)
+                chunk_frames.append(surf)
+            self.chunks.append(WaterChunk((left, top), chunk_frames, groups))
+
+    def update(self, dt):
+        if not self.frames:
+            return
+        self.frame_index += WATER_ANIMATION_SPEED * dt
+        if self.frame_index >= len(self.frames):
+            self.frame_index %= len(self.frames)
+
+        frame = int(self.frame_index)
+        if frame != self.current_frame:
+            self.current_frame = frame
+            for chunk in self.chunks:
+                chunk.image = chunk.frames[frame]
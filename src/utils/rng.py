@@ -0,0 +1,33 @@
+import random
+
+RNG_STREAMS = ("movement", "breeding", "spawns", "combat")
+
+
+class WorldRNG:
+    """
+    Independent random streams for the simulation subsystems, all derived from
+    one world seed. Drawing extra numbers in one stream (say, movement) never
+    shifts the sequence another stream (say, breeding) produces, so the same
+    seed and the same inputs replay the same park.
+    """
+
+    def __init__(self, seed: int | None = None):
+        if seed is None:
+            seed = random.SystemRandom().getrandbits(32)
+        self.seed = seed
+        # String seeds hash through SHA-512, so streams don't depend on PYTHONHASHSEED
+        self.movement = random.Random(f"{seed}:movement")
+        self.breeding = random.Random(f"{seed}:breeding")
+        self.spawns   = random.Random(f"{seed}:spawns")
+        self.combat   = random.Random(f"{seed}:combat")
+
+    def getstate(self) -> dict:
+        return {name: getattr(self, name).getstate() for name in RNG_STREAMS}
+
+    def setstate(self, state: dict) -> None:
+        for name in RNG_STREAMS:
+            getattr(self, name).setstate(state[name])
+
+
+# Used by entities created outside a Map (tests, tools); worlds pass their own
+DEFAULT_RNG = WorldRNG()
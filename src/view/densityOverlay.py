@@ -0,0 +1,108 @@
+# ──────────────────────────────────────────────────────────────────────────────
+# densityOverlay.py – heatmap of where the animals are, blended over the ground
+# ──────────────────────────────────────────────────────────────────────────────
+
+import numpy as np
+import pygame
+
+from src.config.settings import SCREEN_WIDTH, SCREEN_HEIGHT
+
+# ──────────────────────────────────────────────────────────────────────────────
+# Resolution, timing & colours
+# ──────────────────────────────────────────────────────────────────────────────
+DENSITY_CELL      = 128         # world pixels per histogram bin
+DENSITY_REFRESH   = 1.0         # seconds between histogram rebuilds
+DENSITY_FULL      = 2           # animals per bin (after blurring) that count as a hot spot
+DENSITY_MAX_ALPHA = 150
+DENSITY_MARGIN    = 2           # bins scaled beyond each side of the viewport
+DENSITY_COLORS    = ((40, 80, 255), (60, 220, 120), (255, 230, 40), (255, 40, 20))
+
+
+def _colour_table(size=256):
+    """(size, 3) lookup table: cold blue through green and yellow to hot red."""
+    stops = np.linspace(0.0, 1.0, len(DENSITY_COLORS))
+    t = np.linspace(0.0, 1.0, size)
+    colours = np.array(DENSITY_COLORS, dtype=float)
+    return np.stack([np.interp(t, stops, colours[:, c]) for c in range(3)], axis=1).astype(np.uint8)
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# DensityOverlay: histogram once a second, one blit per frame
+# ──────────────────────────────────────────────────────────────────────────────
+class DensityOverlay:
+    """
+    - update() bins the animal positions with np.histogram2d every DENSITY_REFRESH
+      seconds. The bins are colour-mapped into a surface with one pixel per bin.
+    - The bins around the viewport are smoothscaled to world size once. This
+      happens again only after the next rebuild, or when the camera leaves
+      the scaled area.
+    - draw() is a single blit; CameraGroup.custom_draw() calls it between the
+      ground layers and the entities. Hidden, the overlay costs nothing.
+    """
+
+    def __init__(self, map_width, map_height, cell=DENSITY_CELL):
+        self.cell = cell
+        self.cols = max(1, -(-map_width // cell))
+        self.rows = max(1, -(-map_height // cell))
+        self.range = ((0, self.cols * cell), (0, self.rows * cell))
+        self.lut = _colour_table()
+        self.visible = False
+        self.timer = DENSITY_REFRESH
+
+        self.bins = pygame.Surface((self.cols, self.rows), pygame.SRCALPHA)
+        self.scaled = None
+        self.window = None              # bin rect the scaled surface covers
+
+    def toggle(self):
+        self.visible = not self.visible
+        self.timer = DENSITY_REFRESH    # rebuild on the next update
+
+    def update(self, dt, animals):
+        if not self.visible:
+            return
+        self.timer += dt
+        if self.timer < DENSITY_REFRESH:
+            return
+        self.timer = 0.0
+
+        if animals:
+            pts = np.array([(a.pos.x, a.pos.y) for a in animals], dtype=np.float32)
+            counts, _, _ = np.histogram2d(pts[:, 0], pts[:, 1], bins=(self.cols, self.rows), range=self.range)
+        else:
+            counts = np.zeros((self.cols, self.rows))
+        # 1-2-1 blur in both directions, so a lone animal is a faint smudge, not a block
+        padded = np.pad(counts, 1)
+        counts = (padded[:-2] + 2 * padded[1:-1] + padded[2:]) / 4
+        counts = (counts[:, :-2] + 2 * counts[:, 1:-1] + counts[:, 2:]) / 4
+        heat = np.minimum(counts / DENSITY_FULL, 1.0)
+
+        # surfarray indexes [x, y], the same order as the histogram bins
+        pygame.surfarray.pixels3d(self.bins)[...] = self.lut[(heat * 255).astype(np.intp)]
+        pygame.surfarray.pixels_alpha(self.bins)[...] = (np.sqrt(heat) * DENSITY_MAX_ALPHA).astype(np.uint8)
+        self.window = None              # rescale on the next draw
+
+    # ──────────────────────────────────────────────────────────────────────────
+    # Drawing
+    # ──────────────────────────────────────────────────────────────────────────
+    def _view_bins(self, offset):
+        """Bin rect covering the viewport at `offset`."""
+        c = self.cell
+        left, top = int(offset.x // c), int(offset.y // c)
+        right = int((offset.x + SCREEN_WIDTH) // c) + 1
+        bottom = int((offset.y + SCREEN_HEIGHT) // c) + 1
+        return pygame.Rect(left, top, right - left, bottom - top)
+
+    def _rescale(self, view):
+        m = DENSITY_MARGIN
+        window = view.inflate(2 * m, 2 * m).clip(self.bins.get_rect())
+        self.window = window
+        self.scaled = pygame.transform.smoothscale(
+            self.bins.subsurface(window), (window.width * self.cell, window.height * self.cell))
+
+    def draw(self, surface, offset):
+        if not self.visible:
+            return
+        view = self._view_bins(offset)
+        if self.window is None or not self.window.contains(view.clip(self.bins.get_rect())):
+            self._rescale(view)
+        surface.blit(self.scaled, (self.window.x * self.cell - offset.x, self.window.y * self.cell - offset.y))
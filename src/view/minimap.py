@@ -0,0 +1,146 @@
+# ──────────────────────────────────────────────────────────────────────────────
+# minimap.py – Pre-rendered minimap with a low-rate entity layer
+# ──────────────────────────────────────────────────────────────────────────────
+
+import numpy as np
+import pygame
+
+from src.config.settings import SCREEN_WIDTH, SCREEN_HEIGHT
+
+# ──────────────────────────────────────────────────────────────────────────────
+# Colours & timings
+# ──────────────────────────────────────────────────────────────────────────────
+MINIMAP_SIZE       = (250, 250)
+MINIMAP_REFRESH_HZ = 5                  # entity layer refresh rate
+TERRAIN_SHADE      = (30, 30, 30, 110)  # darkens the thumbnail so dots stand out
+ANIMAL_COLOR       = (0, 200, 0)
+RANGER_COLOR       = (220, 220, 220)
+ACTIVE_COLOR       = (255, 0, 0)
+VIEW_COLOR         = (255, 255, 0)
+BORDER_COLOR       = (255, 255, 255)
+KEY_COLOR          = (0, 0, 0)          # transparent colour of the entity layer
+
+
+def _disk_offsets(radius):
+    """Pixel offsets (dx, dy) covering a filled disk, used to splat a dot."""
+    r = np.arange(-radius, radius + 1)
+    dx, dy = np.meshgrid(r, r, indexing="ij")
+    inside = dx * dx + dy * dy <= radius * radius
+    return dx[inside], dy[inside]
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# Minimap: terrain thumbnail baked once, entities splatted a few times a second
+# ──────────────────────────────────────────────────────────────────────────────
+class Minimap:
+    """
+    - The terrain thumbnail is scaled from the map PNG once, at construction.
+    - Animals and rangers are splatted into a colour-keyed layer through a
+      pixel array, in one batched numpy write per colour, at MINIMAP_REFRESH_HZ.
+    - The composed surface is reused between refreshes; only the viewport
+      rectangle is drawn every frame, and it is recomputed only when the camera moves.
+    """
+
+    def __init__(self, map_reference, terrain_surface, size=MINIMAP_SIZE, refresh_hz=MINIMAP_REFRESH_HZ):
+        self.map = map_reference
+        self.width, self.height = size
+        self.rect = pygame.Rect((10, SCREEN_HEIGHT - self.height - 10), size)
+
+        map_w, map_h = terrain_surface.get_size()
+        self.sx, self.sy = self.width / map_w, self.height / map_h
+
+        # Terrain thumbnail (baked once)
+        self.terrain = pygame.Surface(size).convert()
+        self.terrain.fill(TERRAIN_SHADE[:3])
+        self.terrain.blit(pygame.transform.smoothscale(terrain_surface, size), (0, 0))
+        shade = pygame.Surface(size, pygame.SRCALPHA)
+        shade.fill(TERRAIN_SHADE)
+        self.terrain.blit(shade, (0, 0))
+        pygame.draw.rect(self.terrain, BORDER_COLOR, self.terrain.get_rect(), 2)
+
+        # Entity layer and composed output (reused every refresh)
+        self.entities = pygame.Surface(size).convert()
+        self.entities.set_colorkey(KEY_COLOR)
+        self.surface = self.terrain.copy()
+
+        self.refresh_interval = 1.0 / refresh_hz
+        self.refresh_timer = self.refresh_interval  # refresh on the first draw
+
+        # Viewport rectangle cache, keyed on the camera offset
+        self._view_key = None
+        self.view_rect = pygame.Rect(0, 0, 0, 0)
+
+        self._small_dot = _disk_offsets(2)
+        self._large_dot = _disk_offsets(3)
+
+    # ──────────────────────────────────────────────────────────────────────────
+    # Entity layer
+    # ──────────────────────────────────────────────────────────────────────────
+    def _splat(self, pixels, positions, color, dot):
+        """Write a dot of `color` at every (x, y) world position in one batch."""
+        if not positions:
+            return
+        pts = np.array(positions, dtype=np.float32)
+        xs = (pts[:, 0] * self.sx).astype(np.intp)
+        ys = (pts[:, 1] * self.sy).astype(np.intp)
+        dx, dy = dot
+        xs = np.clip(xs[:, None] + dx, 0, self.width - 1)
+        ys = np.clip(ys[:, None] + dy, 0, self.height - 1)
+        pixels[xs, ys] = color
+
+    def refresh(self):
+        """Re-splat every entity and recompose the minimap surface."""
+        m = self.map
+        visible_animals = m.animals if not m.day_night_cycle.is_night else m.chipped_animals
+        animals = [a.rect.center for a in visible_animals]
+        active = m.rangers[m.current_ranger_index] if m.rangers else None
+        rangers = [r.rect.center for r in m.rangers if r is not active]
+
+        self.entities.fill(KEY_COLOR)
+        pixels = pygame.surfarray.pixels3d(self.entities)
+        self._splat(pixels, animals, ANIMAL_COLOR, self._small_dot)
+        self._splat(pixels, rangers, RANGER_COLOR, self._large_dot)
+        if active is not None:
+            self._splat(pixels, [active.rect.center], ACTIVE_COLOR, self._large_dot)
+        del pixels  # unlock the surface before blitting
+
+        self.surface.blit(self.terrain, (0, 0))
+        self.surface.blit(self.entities, (0, 0))
+
+    def _viewport(self, offset):
+        key = (int(offset.x), int(offset.y))
+        if key != self._view_key:
+            self._view_key = key
+            self.view_rect = pygame.Rect(
+                self.rect.x + int(key[0] * self.sx),
+                self.rect.y + int(key[1] * self.sy),
+                int(SCREEN_WIDTH * self.sx),
+                int(SCREEN_HEIGHT * self.sy)
+            )
+        return self.view_rect
+
+    # ──────────────────────────────────────────────────────────────────────────
+    # Drawing & input
+    # ──────────────────────────────────────────────────────────────────────────
+    def draw(self, surface, offset, dt):
+        self.refresh_timer += dt
+        if self.refresh_timer >= self.refresh_interval:
+            self.refresh_timer = 0.0
+            self.refresh()
+
+        surface.blit(self.surface, self.rect)
+        pygame.draw.rect(surface, VIEW_COLOR, self._viewport(offset), 2)
+
+    def handle_click(self, camera):
+        """Centre the camera on the point under the mouse while the minimap is held."""
+        if not pygame.mouse.get_pressed()[0]:
+            return
+        mouse_x, mouse_y = pygame.mouse.get_pos()
+        if not self.rect.collidepoint(mouse_x, mouse_y):
+            return
+
+        map_x = (mouse_x - self.rect.left) / self.sx
+        map_y = (mouse_y - self.rect.top) / self.sy
+        camera.offset.x = max(0, min(map_x - SCREEN_WIDTH // 2, camera.map_width - SCREEN_WIDTH))
+        camera.offset.y = max(0, min(map_y - SCREEN_HEIGHT // 2, camera.map_height - SCREEN_HEIGHT))
+        camera.manual_override = True  # Activate manual drag mode
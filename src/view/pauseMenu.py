@@ -2,16 +2,21 @@
 # pauseMenu.py – Handles the in-game pause menu UI and its interactions
 # ──────────────────────────────────────────────────────────────────────────────
 
-import pygame
+import os
 import sys
 
+import pygame
+
+from src.model.saveGame import save_game, load_game, SaveError
+from src.model.autoSave import latest_autosave
+
 # ──────────────────────────────────────────────────────────────────────────────
 # PauseMenu Class – Renders pause overlay, buttons, and handles click events
 # ──────────────────────────────────────────────────────────────────────────────
 class PauseMenu:
     """
     Handles rendering and interaction for the in-game pause menu.
-    Displays options to resume, start a new game, exit, toggle tutorial, and toggle day/night.
+    Displays options to resume, start a new game, save/load, exit, toggle tutorial, and toggle day/night.
     """
 
     def __init__(self, x, y, width, height, text, font, text_color, game_reference=None):
@@ -51,7 +56,7 @@ class PauseMenu:
         # Menu Dimensions & Header Font
         # ──────────────────────────────────────────────────────────────────────
         self.pause_menu_width = 400
-        self.pause_menu_height = 400
+        self.pause_menu_height = 580
         self.menu_rect = pygame.Rect(
             (self.screen_width - self.pause_menu_width) // 2,
             (self.screen_height - self.pause_menu_height) // 2,
@@ -67,6 +72,9 @@ class PauseMenu:
         self.menu_options = [
             "Resume",
             "Start a new game",
+            "Save game",
+            "Load game",
+            "Load autosave",
             "Exit",
             "Tutorial",
             "Day/Night"
@@ -229,6 +237,32 @@ class PauseMenu:
         elif option == "Start a new game":
             self.new_game_requested = True
             self.menu_open = False
+        elif option == "Save game" and self.game_reference and self.game_reference.map:
+            size = save_game(self.game_reference.map)
+            print(f"Game saved ({size} bytes)")
+            self.menu_open = False
+        elif option == "Load game" and self.game_reference and self.game_reference.map:
+            try:
+                self.game_reference.map = load_game(
+                    game_reference=self.game_reference, current_map=self.game_reference.map
+                )
+                print("Game loaded")
+            except SaveError as e:
+                print(f"Could not load game: {e}")
+            self.menu_open = False
+        elif option == "Load autosave" and self.game_reference and self.game_reference.map:
+            path = latest_autosave()
+            if path is None:
+                print("No autosave yet")
+            else:
+                try:
+                    self.game_reference.map = load_game(
+                        path, game_reference=self.game_reference, current_map=self.game_reference.map
+                    )
+                    print(f"Autosave loaded ({os.path.basename(path)})")
+                except SaveError as e:
+                    print(f"Could not load autosave: {e}")
+            self.menu_open = False
         elif option == "Exit":
             pygame.quit()
             sys.exit()
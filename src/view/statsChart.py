@@ -0,0 +1,99 @@
+# ──────────────────────────────────────────────────────────────────────────────
+# statsChart.py – line chart of the park history kept by StatsRecorder
+# ──────────────────────────────────────────────────────────────────────────────
+
+import numpy as np
+import pygame
+
+from src.config.settings import SCREEN_WIDTH, SCREEN_HEIGHT
+from src.model.statsRecorder import METRICS
+
+# ──────────────────────────────────────────────────────────────────────────────
+# Colours & layout
+# ──────────────────────────────────────────────────────────────────────────────
+CHART_SIZE    = (360, 180)
+CHART_BG      = (30, 30, 30, 190)
+CHART_BORDER  = (200, 200, 200)
+CHART_LINE    = (90, 220, 120)
+CHART_TEXT    = (255, 255, 255)
+RESOLUTIONS   = ("hourly", "daily", "monthly")
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# StatsChart: one metric at one resolution, toggled with G
+# ──────────────────────────────────────────────────────────────────────────────
+class StatsChart:
+    """
+    - Reads a column straight from the recorder's ring buffer; nothing is copied
+      per frame.
+    - The plot is rendered to a cached surface, and only again when a row is
+      added or the metric or resolution changes.
+    - Left click on the chart: next metric. Right click: next resolution.
+    """
+
+    def __init__(self, recorder, size=CHART_SIZE):
+        self.recorder = recorder
+        self.rect = pygame.Rect((SCREEN_WIDTH - size[0] - 10, SCREEN_HEIGHT - size[1] - 10), size)
+        self.visible = False
+        self.metric = 0
+        self.resolution = 0
+        self.font = pygame.font.Font(None, 22)
+        self._surface = None
+        self._key = None
+
+    def toggle(self):
+        self.visible = not self.visible
+
+    def handle_event(self, event):
+        """Cycle metric / resolution on a click inside the chart. Returns True if handled."""
+        if not self.visible or event.type != pygame.MOUSEBUTTONDOWN or not self.rect.collidepoint(event.pos):
+            return False
+        if event.button == 1:
+            self.metric = (self.metric + 1) % len(METRICS)
+        elif event.button == 3:
+            self.resolution = (self.resolution + 1) % len(RESOLUTIONS)
+        return True
+
+    # ──────────────────────────────────────────────────────────────────────────
+    # Rendering
+    # ──────────────────────────────────────────────────────────────────────────
+    def draw(self, surface):
+        if not self.visible:
+            return
+        buffer = getattr(self.recorder, RESOLUTIONS[self.resolution])
+        key = (buffer.total, self.metric, self.resolution)
+        if key != self._key:
+            self._surface = self._render(buffer)
+            self._key = key
+        surface.blit(self._surface, self.rect)
+
+    def _render(self, buffer):
+        w, h = self.rect.size
+        chart = pygame.Surface((w, h), pygame.SRCALPHA)
+        pygame.draw.rect(chart, CHART_BG, chart.get_rect(), border_radius=8)
+        pygame.draw.rect(chart, CHART_BORDER, chart.get_rect(), 2, border_radius=8)
+
+        name = METRICS[self.metric].replace("_", " ").title()
+        values = buffer.column(self.metric)
+        title = f"{name} ({RESOLUTIONS[self.resolution]})"
+        if len(values):
+            title += f"  now {values[-1]:,.0f}"
+        chart.blit(self.font.render(title, True, CHART_TEXT), (10, 8))
+
+        left, top, right, bottom = 10, 30, w - 10, h - 22
+        if len(values) < 2:
+            chart.blit(self.font.render("Collecting data…", True, CHART_TEXT), (left, top + 10))
+            return chart
+
+        # At most one point per pixel column: keep the last value of each stride
+        stride = -(-len(values) // (right - left))
+        values = values[stride - 1::stride] if stride > 1 else values
+        lo, hi = float(values.min()), float(values.max())
+        span = hi - lo or 1.0
+        xs = np.linspace(left, right, len(values))
+        ys = bottom - (values - lo) / span * (bottom - top)
+        pygame.draw.lines(chart, CHART_LINE, False, np.column_stack((xs, ys)).tolist(), 2)
+
+        chart.blit(self.font.render(f"{hi:,.0f}", True, CHART_TEXT), (right - 60, top - 2))
+        chart.blit(self.font.render(f"{lo:,.0f}", True, CHART_TEXT), (right - 60, bottom + 4))
+        return chart
@@ -128,7 +128,8 @@ class StoreUI:
             "pond": 100,
             "flower": 10,
             "tree": 50,
-            "bush": 25
+            "bush": 25,
+            "road": 20
         }
 
         store_animals = {
@@ -562,7 +563,7 @@ class StoreUI:
 
         elif item_name == "jeep":
             success = self.game.buy_item("jeep", item_price=item["price"])
-        elif item_name in ["pond", "flower", "tree", "bush"]:
+        elif item_name in ["pond", "flower", "tree", "bush", "road"]:
             success = self.game.buy_item(item_name, item_price=item["price"])
             
         if success:
@@ -580,19 +581,8 @@ class StoreUI:
     # ──────────────────────────────────────────────────────────────────────────────
     def sell_animal(self, index):
         if 0 <= index < len(self.game.animals):
-            animal = self.game.animals[index]
-            self.game.capital += animal.price
-            
-            if animal in self.game.herbivores:
-                self.game.herbivores.remove(animal)
-            elif animal in self.game.carnivores:
-                self.game.carnivores.remove(animal)
-            elif animal in self.game.omnivores:
-                self.game.omnivores.remove(animal)
-                
-            self.game.animals.remove(animal)
-            animal.kill()
-            
+            self.game.sell_animal(self.game.animals[index])
+
             if index >= len(self.game.animals):
                 self.current_item_index = max(0, len(self.game.animals) - 1)
             else:
@@ -701,8 +691,7 @@ class StoreUI:
             if self.chipping_active and event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
                 for button, animal in self.chip_buttons:
                     if button.collidepoint(event.pos):
-                        self.game.chipped_animals.add(animal)
-                        self.game.capital -= self.chip_cost
+                        self.game.chip_animal(animal, self.chip_cost)
                         self.chip_message = f"{animal.name} the {animal.species.split('/')[0]} has been chipped!"
                         self.chip_message_time = pygame.time.get_ticks()
 
@@ -735,19 +724,7 @@ class StoreUI:
 
             if self.confirmation_active:
                 if hasattr(self, 'confirm_rect') and self.confirm_rect.collidepoint(mouse_pos):
-                    if self.animal_to_confirm in self.game.animals:
-                        self.game.capital += self.animal_to_confirm.price
-                        
-                        if self.animal_to_confirm in self.game.herbivores:
-                            self.game.herbivores.remove(self.animal_to_confirm)
-                        elif self.animal_to_confirm in self.game.carnivores:
-                            self.game.carnivores.remove(self.animal_to_confirm)
-                        elif self.animal_to_confirm in self.game.omnivores:
-                            self.game.omnivores.remove(self.animal_to_confirm)
-                        
-                        self.game.animals.remove(self.animal_to_confirm)
-                        self.animal_to_confirm.kill()
-                        
+                    if self.game.sell_animal(self.animal_to_confirm):
                         if self.current_item_index >= len(self.game.animals):
                             self.current_item_index = max(0, len(self.game.animals) - 1)
                     
@@ -0,0 +1,82 @@
+import sys, os, zlib
+import pygame
+import pytest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from src.model.autoSave import AutoSave, autosave_path, latest_autosave
+from src.model.saveGame import (SAVE_MAGIC, GONE, SnapshotCapture, capture_snapshot, apply_snapshot,
+                                encode_snapshot, decode_snapshot, read_snapshot)
+from src.model.safariMap import Map
+
+@pytest.fixture(scope="module", autouse=True)
+def init_pygame():
+    pygame.init()
+    pygame.display.set_mode((800, 600))
+    yield
+    pygame.quit()
+
+def test_slots_rotate_through_a_temp_file(tmp_path, monkeypatch):
+    replaced = []
+    real_replace = os.replace
+    def spy(src, dst):
+        with open(src, "rb") as f:
+            replaced.append((src, dst, f.read()))
+        real_replace(src, dst)
+    monkeypatch.setattr(os, "replace", spy)
+
+    saver = AutoSave(str(tmp_path), slots=3)
+    for i in range(4):
+        saver._write(bytes([i]))
+    assert [dst for _, dst, _ in replaced] == [autosave_path(s, str(tmp_path)) for s in (0, 1, 2, 0)]
+    assert all(src == f"{dst}.tmp" and data == bytes([i]) for i, (src, dst, data) in enumerate(replaced))
+    assert not list(tmp_path.glob("*.tmp"))
+    assert open(autosave_path(0, str(tmp_path)), "rb").read() == bytes([3])
+
+    # A new session carries on with the least recently written slot
+    for slot, mtime in ((0, 300), (1, 100), (2, 200)):
+        os.utime(autosave_path(slot, str(tmp_path)), (mtime, mtime))
+    assert AutoSave(str(tmp_path), slots=3).next_slot == 1
+
+def test_capture_is_chunked_and_skips_animals_gone_meanwhile():
+    game_map = Map("Easy", seed=1)
+    full = capture_snapshot(game_map)
+    capture = SnapshotCapture(game_map, chunk=7)
+    steps = 1
+    while capture.step() is None:
+        steps += 1
+        assert len(capture.records) <= 7 * steps
+    assert steps == -(-len(full.animals) // 7) + 1
+
+    capture = SnapshotCapture(game_map, chunk=7)
+    capture.step()
+    sold = game_map.animals[0]
+    game_map.sell_animal(sold)
+    snapshot = capture.step()
+    while snapshot is None:
+        snapshot = capture.step()
+    index = capture.animals.index(sold)
+    assert snapshot.animals[index][7] & GONE
+    assert snapshot.animals[:index] + snapshot.animals[index + 1:] == tuple(
+        r for r in full.animals if r is not full.animals[index])
+
+    apply_snapshot(game_map, decode_snapshot(encode_snapshot(snapshot)))
+    assert len(game_map.animals) == len(full.animals) - 1
+
+def test_autosave_writes_a_compressed_slot_and_survives_errors(tmp_path):
+    game_map = Map("Easy", seed=1)
+    saver = game_map.autosave = AutoSave(str(tmp_path))
+    saver.request(game_map)
+    saver._pending.join()                   # nothing queued before the capture completes
+    saver.flush()
+    path = latest_autosave(str(tmp_path))
+    with open(path, "rb") as f:
+        data = f.read()
+    assert not data.startswith(SAVE_MAGIC) and zlib.decompress(data).startswith(SAVE_MAGIC)
+    assert encode_snapshot(read_snapshot(path)) == encode_snapshot(capture_snapshot(game_map))
+
+    saver._pending.put(None)                # not a snapshot: the encoder raises
+    saver.flush()
+    assert saver.last_error is not None
+    saver.request(game_map)
+    saver.flush()
+    assert saver.last_path == autosave_path(1, str(tmp_path))
@@ -0,0 +1,76 @@
+import sys, os, random
+import pygame
+import pytest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from src.model.animals import Herbivore, INTERACTION_RADIUS, FERTILITY_COOLDOWN
+from src.model.breedingIndex import BreedingIndex
+
+@pytest.fixture(scope="module", autouse=True)
+def init_pygame():
+    pygame.init()
+    pygame.display.set_mode((800, 600))
+    yield
+    pygame.quit()
+
+_MAP = pygame.Rect(0, 0, 1000, 1000)
+
+def _animal(name, gender, group_type="cow"):
+    return Herbivore(name, "cow", 3, (0, 0), pygame.sprite.Group(), _MAP, 150,
+                     gender=gender, group_type=group_type, variant="")
+
+def _place(animal, x, y):
+    animal.pos.update(x, y)
+    animal.rect.center = animal.pos
+
+def _mate(female, animals, index):
+    """The father _check_reproduction picks with `index`, or with the plain scan if None."""
+    female.is_pregnant, female._stored_father = False, None
+    female.breeding_index = index
+    female._check_reproduction(animals)
+    return female._stored_father if female.is_pregnant else None
+
+def test_mate_on_the_far_side_of_a_bucket_edge():
+    index = BreedingIndex(INTERACTION_RADIUS)
+    female, near, far = _animal("f", "female"), _animal("m1", "male"), _animal("m2", "male")
+    for a in (female, near, far):
+        index.add(a)
+    _place(female, 119.5, 100.0)                            # bucket 1; the male is in bucket 2
+    _place(near, 119.5 + INTERACTION_RADIUS, 100.0)
+    _place(far, 119.5, 100.5 + INTERACTION_RADIUS)
+    index.begin_tick()
+    assert _mate(female, [female, near, far], index) is near
+    assert _mate(female, [female, near, far], None) is near
+
+def test_find_mate_agrees_with_the_plain_scan():
+    rng = random.Random(11)
+    index = BreedingIndex(INTERACTION_RADIUS)
+    females = [_animal(f"f{i}", "female", rng.choice(("cow", "goat"))) for i in range(10)]
+    males = [_animal(f"m{i}", "male", rng.choice(("cow", "goat"))) for i in range(15)]
+    animals = females + males
+    for a in animals:
+        index.add(a)
+
+    found = cooled = 0
+    for _ in range(40):
+        for a in animals:
+            x, y = rng.uniform(0, 300), rng.uniform(0, 300)
+            if rng.random() < 0.4:                          # right on either side of a bucket edge
+                x = rng.randint(1, 4) * INTERACTION_RADIUS + rng.choice((-0.25, 0.0, 0.25))
+            _place(a, x, y)
+            a.is_alive = rng.random() > 0.1
+        for f in females:
+            f.fertility_cooldown = FERTILITY_COOLDOWN if rng.random() < 0.2 else 0.0
+        index.begin_tick()
+
+        for f in females:
+            mate, expected = _mate(f, animals, index), _mate(f, animals, None)
+            assert (mate is None) == (expected is None)
+            if mate is not None:
+                found += 1
+                assert mate.is_alive and mate.gender == "male" and mate.group_type == f.group_type
+                assert f.pos.distance_to(mate.pos) <= INTERACTION_RADIUS
+            if f.fertility_cooldown:
+                cooled += 1
+                assert mate is None
+    assert found and cooled
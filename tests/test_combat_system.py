@@ -0,0 +1,48 @@
+import sys, os, random
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from pygame.math import Vector2
+from src.model.combatSystem import CombatSystem
+from src.model.rangers import RANGER_DETECTION_RADIUS, RANGER_SPEAR_RANGE
+from src.model.poacher import POACHER_DETECTION_RADIUS
+
+class _Entity:
+    """Just the fields CombatSystem reads."""
+    def __init__(self, rng, edge):
+        x, y = rng.uniform(0, 4 * edge), rng.uniform(0, 4 * edge)
+        if rng.random() < 0.4:                  # right on either side of a cell edge
+            x = rng.randint(1, 3) * edge + rng.choice((-0.25, 0.0, 0.25))
+        self.pos = Vector2(x, y)
+        self.health = 0 if rng.random() < 0.15 else 100
+        self.dying = rng.random() < 0.1
+        self.is_alive = rng.random() > 0.1
+
+def _nearest(origin, candidates, radius):
+    best, best_d2 = None, radius ** 2
+    for c in candidates:
+        d2 = origin.pos.distance_squared_to(c.pos)
+        if d2 < best_d2:
+            best, best_d2 = c, d2
+    return best
+
+def test_views_match_plain_nearest_scans():
+    rng = random.Random(3)
+    combat = CombatSystem()
+    for _ in range(40):
+        rangers = [_Entity(rng, combat.cell) for _ in range(12)]
+        poachers = [_Entity(rng, combat.cell) for _ in range(12)]
+        animals = [_Entity(rng, combat.cell) for _ in range(40)]
+        combat.update(rangers, poachers, animals)
+
+        active = [p for p in poachers if p.health > 0 and not p.dying]
+        assert set(combat.poacher_views) == set(active)     # dying or dead poachers get no view
+        for r in rangers:
+            view = combat.ranger_view(r)
+            in_range = lambda radius: [p for p in active if r.pos.distance_to(p.pos) < radius]
+            assert view.target is _nearest(r, active, RANGER_DETECTION_RADIUS)
+            assert view.in_gun_range == in_range(RANGER_DETECTION_RADIUS)
+            assert view.in_spear_range == in_range(RANGER_SPEAR_RANGE)
+        for p in active:
+            view = combat.poacher_view(p)
+            assert view.threat is _nearest(p, [r for r in rangers if r.health > 0], POACHER_DETECTION_RADIUS)
+            assert view.prey is _nearest(p, [a for a in animals if a.is_alive], POACHER_DETECTION_RADIUS)
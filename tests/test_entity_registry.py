@@ -0,0 +1,18 @@
+import sys, os
+import pytest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from src.model.entityRegistry import EntityList
+
+def test_swap_remove_keeps_indices_consistent():
+    items = EntityList(["a", "b", "c", "d"])
+    items.remove("b")
+    assert list(items) == ["a", "d", "c"]       # last item moved into the hole
+    assert [items.index(x) for x in items] == [0, 1, 2]
+    assert "b" not in items and len(items) == 3
+
+def test_remove_missing_raises_value_error():
+    items = EntityList(["a"])
+    items.discard("z")
+    with pytest.raises(ValueError):
+        items.remove("z")
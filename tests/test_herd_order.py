@@ -0,0 +1,28 @@
+import sys, os
+import pygame
+import pytest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from src.model.safariMap import Map
+from src.model.flowField import FLOW_ARRIVE_COST
+
+@pytest.fixture(scope="module", autouse=True)
+def init_pygame():
+    pygame.init()
+    pygame.display.set_mode((800, 600))
+    yield
+    pygame.quit()
+
+def test_ordered_herd_arrives_and_the_order_clears():
+    game_map = Map("Easy", seed=3)
+    game_map.autosave.enabled = False
+    herd = game_map.registry.herds.herds["cow"]
+    assert game_map.order_herd("cow", game_map.map_rect.center)
+    field = herd.destination
+
+    for _ in range(1200):                   # 20 game seconds at 60 fps
+        game_map.step(1 / 60)
+        if herd.destination is None:
+            break
+    assert herd.destination is None
+    assert field.cost_at(herd.centroid) <= FLOW_ARRIVE_COST
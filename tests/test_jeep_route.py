@@ -0,0 +1,18 @@
+import sys, os
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from src.model.jeepFleet import JeepRoute
+
+def test_route_is_closed_at_the_depot_and_located_by_distance():
+    route = JeepRoute([(100, 0), (100, 50)], start=(0, 0))
+    # depot -> (100, 0) -> (100, 50) -> back to the depot
+    assert route.points[0] == route.points[-1] == (0.0, 0.0)
+    assert route.cum[:3] == [0.0, 100.0, 150.0]
+    assert abs(route.length - (150.0 + (100 ** 2 + 50 ** 2) ** 0.5)) < 1e-9
+
+    assert route.locate(30) == (30.0, 0.0, 'right')
+    assert route.locate(125) == (100.0, 25.0, 'down')
+    x, y, facing = route.locate(route.length - 1e-9)
+    assert abs(x) < 1e-6 and abs(y) < 1e-6 and facing == 'left'
+    assert route.locate(-5)[:2] == (0.0, 0.0)                  # clamped to the ends
+    assert route.locate(route.length + 5)[:2] == (0.0, 0.0)
@@ -0,0 +1,63 @@
+import sys, os
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+import pygame
+from src.config.settings import TILE_SIZE
+from src.model.pathfinder import Pathfinder
+from src.model.flowField import FlowFields
+
+def _wall(group, x, y):
+    s = pygame.sprite.Sprite(group)
+    s.rect = pygame.Rect(x * TILE_SIZE, y * TILE_SIZE, TILE_SIZE, TILE_SIZE)
+    s.hitbox = s.rect.copy()
+
+def _run(pf, req):
+    for _ in range(100):
+        if req.done:
+            break
+        pf.update()
+    return req
+
+def test_path_goes_around_wall_and_is_cached():
+    group = pygame.sprite.Group()
+    for y in range(0, 4):                       # wall at x=2, gap at y=4
+        _wall(group, 2, y)
+    pf = Pathfinder(pygame.Rect(0, 0, 5 * TILE_SIZE, 5 * TILE_SIZE), group, budget=3)
+    start, goal = pf.cell_centre((0, 0)), pf.cell_centre((4, 0))
+    assert not pf.line_clear(start, goal)
+
+    req = _run(pf, pf.request(start, goal))
+    cells = [pf.cell_of(p) for p in req.path]
+    assert cells[-1] == (4, 0) and (2, 4) in cells
+    assert all(pf.walkable(c) for c in cells)
+    assert pf.request(start, goal).done         # served from the cache
+
+def test_placing_an_obstacle_invalidates_paths():
+    group = pygame.sprite.Group()
+    pf = Pathfinder(pygame.Rect(0, 0, 3 * TILE_SIZE, 1 * TILE_SIZE), group)
+    start, goal = pf.cell_centre((0, 0)), pf.cell_centre((2, 0))
+    assert _run(pf, pf.request(start, goal)).found
+
+    _wall(group, 1, 0)
+    pf.invalidate(group.sprites()[0].hitbox)
+    assert not pf.walkable((1, 0))
+    assert not _run(pf, pf.request(start, goal)).found
+
+def test_flow_field_leads_every_cell_to_the_goal():
+    group = pygame.sprite.Group()
+    for y in range(0, 4):
+        _wall(group, 2, y)
+    pf = Pathfinder(pygame.Rect(0, 0, 5 * TILE_SIZE, 5 * TILE_SIZE), group)
+    fields = FlowFields(pf)
+    field = fields.get(pf.cell_centre((4, 0)))
+    assert fields.get(pf.cell_centre((4, 0))) is field      # cached per goal cell
+
+    for start in [(0, 0), (1, 3), (0, 4)]:
+        pos = pygame.Vector2(pf.cell_centre(start))
+        for _ in range(50):                                 # walk cell centre to cell centre
+            step = field.direction_at(pos)
+            if step is None:
+                break
+            pos = pygame.Vector2(pf.cell_centre(pf.cell_of(pos + step * TILE_SIZE)))
+            assert pf.walkable(pf.cell_of(pos))
+        assert pf.cell_of(pos) == (4, 0)
@@ -0,0 +1,72 @@
+import sys, os, random
+import pygame
+import pytest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from src.model.animals import Animal, Herbivore, Carnivore, Omnivore, PREY_DETECTION_RADIUS
+from src.model.entityList import EntityList
+from src.model.proximityService import ProximityService
+
+@pytest.fixture(scope="module", autouse=True)
+def init_pygame():
+    pygame.init()
+    pygame.display.set_mode((800, 600))
+    yield
+    pygame.quit()
+
+def _animals():
+    group, map_rect = pygame.sprite.Group(), pygame.Rect(0, 0, 3000, 3000)
+    herbs = [Herbivore(f"h{i}", "cow", 3, (0, 0), group, map_rect, 150, variant="") for i in range(20)]
+    carns = [Carnivore(f"c{i}", "wolf/2", 3, (0, 0), group, map_rect, 300, variant="") for i in range(8)]
+    omnis = [Omnivore(f"o{i}", "bears/1", 3, (0, 0), group, map_rect, 300, variant="") for i in range(8)]
+    return herbs, carns, omnis
+
+def _scatter(animals, rng):
+    """Random spots, many of them right on either side of a cell edge."""
+    edge = PREY_DETECTION_RADIUS
+    for a in animals:
+        x, y = rng.uniform(100, 700), rng.uniform(100, 700)
+        if rng.random() < 1 / 3:
+            x = rng.randint(1, 4) * edge + rng.choice((-0.5, 0.0, 0.5))
+        elif rng.random() < 1 / 2:
+            y = rng.randint(1, 4) * edge + rng.choice((-0.5, 0.0, 0.5))
+        a.pos.update(x, y)
+        a.rect.center = a.pos
+        a.is_alive = rng.random() > 0.1
+        a.health = rng.choice((30, 100))    # bears under 50 health are fair game
+
+def test_sighting_matches_the_plain_scans():
+    herbs, carns, omnis = _animals()
+    animals = herbs + carns + omnis
+    service = ProximityService(
+        {"herbivore": EntityList(herbs), "carnivore": EntityList(carns), "omnivore": EntityList(omnis)},
+        prey_radius=PREY_DETECTION_RADIUS, threat_margin=Animal.DETECTION_RADIUS,
+    )
+    rng = random.Random(7)
+    checked = {"prey": 0, "threat": 0, "bear spared": 0}
+    for _ in range(30):
+        _scatter(animals, rng)
+        service.begin_tick()
+        for a in animals:
+            seen = service.sighting(a)
+
+            if isinstance(a, (Carnivore, Omnivore)):
+                a.target_prey, a.hunting_cooldown = None, 0.0
+                a._find_prey(animals)
+                assert a.target_prey is seen.prey
+                assert not (isinstance(a, Carnivore) and seen.prey in omnis and seen.prey.health >= 50)
+                checked["prey"] += seen.prey is not None
+                if isinstance(a, Carnivore):
+                    checked["bear spared"] += any(
+                        o.is_alive and o.health >= 50 and a.pos.distance_to(o.pos) < PREY_DETECTION_RADIUS
+                        for o in omnis)
+
+            a.fleeing = False
+            a._check_threats_and_flee(animals)
+            assert a.fleeing == (seen.threat is not None)
+            if seen.threat is not None:
+                checked["threat"] += 1
+                a.fleeing = False
+                a._check_threats_and_flee([seen.threat])
+                assert a.fleeing            # the service's threat is one the scan accepts too
+    assert all(checked.values()), checked
@@ -0,0 +1,42 @@
+import sys, os, random
+import pygame
+import pytest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from src.controller.replay import ReplayRecorder, ReplayPlayer, load_replay
+from src.model.saveGame import capture_snapshot, encode_snapshot
+from src.model.safariMap import Map
+
+@pytest.fixture(scope="module", autouse=True)
+def init_pygame():
+    pygame.init()
+    pygame.display.set_mode((800, 600))
+    yield
+    pygame.quit()
+
+def test_headless_replay_matches_the_recorded_session(tmp_path):
+    game_map = Map("Easy", seed=99)
+    game_map.autosave.enabled = False
+    recorder = ReplayRecorder(game_map)
+    jitter = random.Random(5)
+    for i in range(500):
+        dt = 1 / 60 + jitter.uniform(-0.004, 0.004)
+        game_map.input.begin_frame(dt)
+        recorder.begin_frame(dt)
+        if i == 100: game_map.buy_item("animal", animal_type="wolf", item_price=300)
+        if i == 200: game_map.toggle_day_night()
+        if i == 250: game_map.sell_animal(game_map.animals[2])
+        if i == 320: game_map.input.press("switch_ranger")
+        if i == 321: game_map.input.release("switch_ranger")
+        if i == 400: game_map.buy_item("tree", item_price=50)
+        game_map.run(dt, [])
+        if i == 401: game_map.place_item((900, 900))
+    live = encode_snapshot(capture_snapshot(game_map))
+
+    path = recorder.save(str(tmp_path / "session.json"))
+    log = load_replay(path)
+    names = {name for _, _, name, _ in log["commands"]}
+    assert {"buy_item", "place_item", "sell_animal", "toggle_day_night", "press"} <= names
+
+    replayed = ReplayPlayer(log).play_headless()
+    assert encode_snapshot(capture_snapshot(replayed)) == live
@@ -0,0 +1,15 @@
+import sys, os
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from src.utils.rng import WorldRNG
+
+def test_same_seed_same_streams():
+    a, b = WorldRNG(7), WorldRNG(7)
+    assert [a.movement.random() for _ in range(5)] == [b.movement.random() for _ in range(5)]
+    assert a.spawns.randint(0, 1000) == b.spawns.randint(0, 1000)
+
+def test_streams_are_independent():
+    a, b = WorldRNG(7), WorldRNG(7)
+    for _ in range(100):
+        a.movement.random()          # extra draws in one stream only
+    assert a.breeding.random() == b.breeding.random()
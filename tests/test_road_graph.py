@@ -0,0 +1,35 @@
+import sys, os
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from src.model.roadGraph import RoadGraph
+
+def _ring():
+    """A square loop of road from (0, 0) to (8, 8), with a spur west of (0, 4)."""
+    cells = {(x, y) for x in range(9) for y in (0, 8)} | {(x, y) for x in (0, 8) for y in range(9)}
+    return cells | {(-1, 4), (-2, 4)}
+
+def test_roads_compile_to_junctions_and_routes_are_cached():
+    graph = RoadGraph(_ring(), water={(10, 8)})        # a lake by the bottom-right corner
+    assert graph.nodes == {(0, 4), (-2, 4)}             # the junction and the dead end
+    assert len(graph.edges) == 2                        # the spur, and the loop from (0, 4) back to itself
+
+    path = graph.shortest((-2, 4), (8, 8))
+    assert path[0] == (-2, 4) and path[-1] == (8, 8) and len(path) - 1 == 14
+    assert all(abs(a[0] - b[0]) + abs(a[1] - b[1]) == 1 for a, b in zip(path, path[1:]))
+
+    # (8, 4) is as far by the top as by the bottom; the scenic route takes the lakeside
+    assert (4, 8) in graph.scenic((0, 4), (8, 4))
+    assert ((0, 4), True) in graph._searches
+
+def test_added_tile_is_merged_without_a_rebuild():
+    graph = RoadGraph(_ring())
+    edges = dict(graph.edges)
+    assert graph.shortest((0, 0), (8, 8)) is not None and graph._searches
+
+    for y in range(1, 8):                               # a shortcut down the middle
+        graph.add_tile((4, y))
+    assert not graph._searches                          # cached searches dropped
+    assert {(4, 0), (4, 8)} <= graph.nodes              # the loop was split where it joins
+    assert set(edges) - set(graph.edges)                # only the edges that were cut are gone
+    assert len(graph.shortest((4, 0), (4, 8))) == 9
+    assert graph.add_tile((4, 4)) is False
@@ -0,0 +1,68 @@
+import sys, os, pygame
+import pytest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from src.model.saveGame import (ParkSnapshot, encode_snapshot, decode_snapshot, capture_snapshot,
+                                apply_snapshot, SaveError)
+from src.model.safariMap import Map
+
+@pytest.fixture(scope="module", autouse=True)
+def init_pygame():
+    pygame.init()
+    pygame.display.set_mode((800, 600))
+    yield
+    pygame.quit()
+
+def _snapshot():
+    strings = ("Easy", "Daisy", "cow", "", "normal", "female")
+    animal = (0, 1, 2, 2, 3, 4, 1, 3, 1,
+              4.0, 12.5, 150, 40.0, 1.0, 1.0, 90.0, 80.0, 70.0,
+              100.0, 200.0, 0.0, -1, -1, 0)
+    world = (10000.0, 5, 42.5, 1, 1.0, 0, 3.0, 7.0, 0, 0, 0, 12, 0.5)
+    return ParkSnapshot(world, strings, (animal,), ((10.0, 20.0, 100.0, 1),), (), ((0.0, 1, 2, 0, 7.5),),
+                        ((3, 4), (-1, 7)))
+
+def test_snapshot_round_trip():
+    snap = _snapshot()
+    restored = decode_snapshot(encode_snapshot(snap))
+    assert restored == snap
+    assert restored.difficulty == "Easy"
+
+def test_rejects_foreign_data():
+    with pytest.raises(SaveError):
+        decode_snapshot(b"not a save file at all, definitely not" * 2)
+
+def _build_road(game_map, cell):
+    game_map.buy_item("road")
+    game_map.place_item((cell[0] * 64, cell[1] * 64))
+
+def test_built_roads_are_checked_and_saved():
+    game_map = Map("Easy", seed=1)
+    roads = game_map.roads
+    lake = min(roads.water)
+    land = min((x + dx, y) for x, y in roads.cells for dx in (-1, 1)
+               if (x + dx, y) not in roads.cells and (x + dx, y) not in roads.water
+               and game_map.pathfinder.walkable((x + dx, y)))
+    capital = game_map.capital
+    _build_road(game_map, lake)
+    assert lake not in roads.cells and game_map.capital == capital
+    _build_road(game_map, land)
+    assert land in roads.cells and game_map.placed_roads == [land]
+
+    snapshot = decode_snapshot(encode_snapshot(capture_snapshot(game_map)))
+    assert snapshot.roads == (land,)
+    fresh = Map("Easy", seed=1)
+    apply_snapshot(fresh, snapshot)
+    assert land in fresh.roads.cells and fresh.placed_roads == [land]
+
+
+def test_map_round_trip_is_lossless():
+    game_map = Map("Easy", seed=2)
+    game_map.autosave.enabled = False
+    for _ in range(300):
+        game_map.step(1 / 30)
+    data = encode_snapshot(capture_snapshot(game_map))
+
+    fresh = Map("Easy", seed=2)
+    apply_snapshot(fresh, decode_snapshot(data))
+    assert encode_snapshot(capture_snapshot(fresh)) == data
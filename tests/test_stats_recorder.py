@@ -0,0 +1,26 @@
+import sys, os
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from src.model.statsRecorder import StatsRecorder, METRICS, HOURS_KEPT, HOURS_PER_DAY, DAYS_PER_MONTH
+
+CAPITAL, BIRTHS = METRICS.index("capital"), METRICS.index("births")
+
+def test_hours_roll_up_into_days_and_months():
+    stats = StatsRecorder()
+    stats.update(0, 0, 0, 0, 0, 0)                          # first tick only sets the clock
+    for hour in range(1, HOURS_PER_DAY * DAYS_PER_MONTH + 1):
+        stats.births += 2
+        stats.update(hour, hour, 0, 0, 0, 0)
+
+    assert stats.daily.count == DAYS_PER_MONTH and stats.monthly.count == 1
+    assert stats.daily.column(BIRTHS)[0] == 2 * (HOURS_PER_DAY - 1)     # hours 1..23 of day 0
+    assert stats.daily.column(CAPITAL)[1] == sum(range(24, 48)) / 24    # stocks are averaged
+    assert stats.monthly.column(BIRTHS)[0] == 2 * (HOURS_PER_DAY * DAYS_PER_MONTH - 1)
+
+def test_memory_stays_bounded():
+    stats = StatsRecorder()
+    for hour in range(HOURS_KEPT * 3):
+        stats.update(hour, hour, 0, 0, 0, 0)
+    capital = stats.hourly.column(CAPITAL)
+    assert len(capital) == HOURS_KEPT and stats.hourly.data.shape[0] == HOURS_KEPT
+    assert capital[0] == HOURS_KEPT * 2 and capital[-1] == HOURS_KEPT * 3 - 1     # oldest first
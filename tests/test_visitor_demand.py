@@ -0,0 +1,51 @@
+import sys, os
+import pygame
+import pytest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from src.model.animals import Carnivore, Herbivore
+from src.model.entityRegistry import EntityRegistry
+from src.model.visitorDemand import VisitorDemand, QUEUE_CAPACITY, VISITOR_PATIENCE
+
+@pytest.fixture(scope="module", autouse=True)
+def init_pygame():
+    pygame.init()
+    pygame.display.set_mode((800, 600))
+    yield
+    pygame.quit()
+
+def _run(speed, seconds=600.0):
+    demand, now, dt = VisitorDemand(), 0.0, speed / 30
+    for _ in range(round(seconds / dt)):
+        now += dt
+        demand.update(dt, now, species=10, animals=40, hour=12.0)
+        demand.take(100)
+    return demand.arrived
+
+def test_arrivals_do_not_depend_on_the_time_multiplier():
+    assert _run(1) == _run(10) == _run(60) > 0
+    assert VisitorDemand.rate(10, 40, hour=2.0) == 0.0          # gate closed at night
+
+def test_queue_turns_visitors_away_and_they_give_up():
+    demand = VisitorDemand()
+    demand.carry = QUEUE_CAPACITY + 5.0
+    assert demand.update(0.0, 0.0, 10, 40, 12.0) == QUEUE_CAPACITY
+    assert demand.turned_away == 5
+    assert demand.take(3) == 3 and demand.waiting == QUEUE_CAPACITY - 3
+
+    demand.update(0.0, VISITOR_PATIENCE + 1.0, 10, 40, 12.0)
+    assert demand.waiting == 0 and demand.gave_up == QUEUE_CAPACITY - 3
+
+def test_predator_species_add_to_demand():
+    group, map_rect = pygame.sprite.Group(), pygame.Rect(0, 0, 1000, 1000)
+    registry = EntityRegistry()
+    registry.add_animal(Herbivore("Deery", "deer", 2, (50, 60), group, map_rect, 100))
+    before = VisitorDemand.rate(len(registry.species), 2, hour=12.0)
+
+    wolf = Carnivore("Wolfie", "baby-wolf", 1, (100, 200), group, map_rect, 300)
+    registry.add_animal(wolf)                                   # predators never herd
+    assert not registry.herds.herds.get(wolf.group_type)
+    assert VisitorDemand.rate(len(registry.species), 2, hour=12.0) > before
+
+    registry.remove_animal(wolf)
+    assert wolf.group_type not in registry.species